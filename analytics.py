@@ -0,0 +1,190 @@
+# ~*~ coding: utf-8 ~*~
+"""
+    File name           : analytics.py
+    Author              : Derryn Edwards
+    Date Created        : 2026/10/18
+    Date Last Modified  : 2026/10/18
+    Python Version      : 3.11
+"""
+# ==================================================================================================
+# IMPORTS
+# ==================================================================================================
+from grid import NeighborIndex, DEGREE
+
+
+class MazeAnalysis:
+    """
+    Topology of a maze: how its cells connect, how long its corridors are and how far apart its
+    cells lie.
+
+    Openings through the outer wall, such as the entrance and exit, are not counted as passages.
+    Distances are numbers of steps, so a path through n cells has length n - 1.
+
+    Attributes
+    ----------
+    cells : int
+        Number of cells.
+    degrees : tuple
+        Number of cells with 0, 1, 2, 3 and 4 open passages.
+    dead_ends : int
+        Number of cells with a single open passage.
+    junctions : dict
+        Maps 3 and 4 to the number of cells where that many passages meet.
+    corridors : dict
+        Maps a corridor length to the number of corridors that long. A corridor is a run of
+        passages between two cells that are not on a straight or bent stretch, such as dead ends
+        and junctions; its length is its number of passages.
+    solution_length : int
+        Steps from the entrance (0, 0) to the exit (num_cols - 1, num_rows - 1). None if the exit
+        can not be reached.
+    diameter : int
+        Steps between the two cells furthest apart. Exact for perfect mazes.
+    diameter_ends : tuple
+        (i, j) coordinates of the two cells furthest apart.
+    is_perfect : bool
+        True if every cell is reachable and there is a single path between any two cells.
+
+    Methods
+    -------
+    branching_factor(self)
+        Returns the mean number of new passages offered at a junction.
+    as_dict(self)
+        Returns the analysis as a plain dict.
+    """
+
+    __slots__ = (
+        "cells", "degrees", "dead_ends", "junctions", "corridors", "solution_length", "diameter",
+        "diameter_ends", "is_perfect"
+    )
+
+    def __init__(self, cells, degrees, corridors, solution_length, diameter, diameter_ends,
+                 is_perfect):
+        self.cells = cells
+        self.degrees = degrees
+        self.dead_ends = degrees[1]
+        self.junctions = {3: degrees[3], 4: degrees[4]}
+        self.corridors = corridors
+        self.solution_length = solution_length
+        self.diameter = diameter
+        self.diameter_ends = diameter_ends
+        self.is_perfect = is_perfect
+
+    def branching_factor(self):
+        """
+        Returns the mean number of passages a junction offers besides the one it was entered by,
+        or 0.0 without junctions.
+        """
+        junctions = self.degrees[3] + self.degrees[4]
+        if not junctions:
+            return 0.0
+        return (2 * self.degrees[3] + 3 * self.degrees[4]) / junctions
+
+    def as_dict(self):
+        """Returns the analysis as a plain dict, ready for json.dump."""
+        return {
+            "cells": self.cells,
+            "degrees": list(self.degrees),
+            "dead_ends": self.dead_ends,
+            "junctions": dict(self.junctions),
+            "branching_factor": self.branching_factor(),
+            "corridors": dict(self.corridors),
+            "solution_length": self.solution_length,
+            "diameter": self.diameter,
+            "diameter_ends": [list(cell) for cell in self.diameter_ends],
+            "is_perfect": self.is_perfect,
+        }
+
+    def __repr__(self):
+        return (
+            f"MazeAnalysis(cells={self.cells}, dead_ends={self.dead_ends}, "
+            f"junctions={self.junctions}, solution_length={self.solution_length}, "
+            f"diameter={self.diameter})"
+        )
+
+
+def _sweep(passages, offsets, start_k, goal_k):
+    """
+    Breadth-first sweep from start_k, level by level.
+
+    Returns the last cell reached, its distance, the distance of goal_k (None if unreachable)
+    and the number of cells reached.
+    """
+    seen = bytearray(len(passages))
+    seen[start_k] = 1
+    frontier = [start_k]
+    depth = 0
+    goal_depth = 0 if start_k == goal_k else None
+    reached = 1
+    while True:
+        next_frontier = []
+        for k in frontier:
+            for offset in offsets[passages[k]]:
+                next_k = k + offset
+                if not seen[next_k]:
+                    seen[next_k] = 1
+                    next_frontier.append(next_k)
+        if not next_frontier:
+            return frontier[-1], depth, goal_depth, reached
+        depth += 1
+        if goal_depth is None and seen[goal_k]:
+            goal_depth = depth
+        reached += len(next_frontier)
+        frontier = next_frontier
+
+
+def _corridors(passages, offsets, degree):
+    """Returns a dict of corridor length to the number of corridors that long."""
+    lengths = {}
+    for k, cell_degree in enumerate(degree):
+        if cell_degree == 2 or not cell_degree:
+            continue
+        for offset in offsets[passages[k]]:
+            previous, current, length = k, k + offset, 1
+            while degree[current] == 2:
+                first, second = offsets[passages[current]]
+                step = first if current + first != previous else second
+                previous, current = current, current + step
+                length += 1
+            # every corridor is walked from both ends; count it from the lower one. A loop back
+            # to k is told apart by the offset it leaves and returns through
+            if k < current or (k == current and offset < previous - current):
+                lengths[length] = lengths.get(length, 0) + 1
+    return lengths
+
+
+def analyze(grid):
+    """
+    Measures the topology of a maze in linear time.
+
+    Degrees come from a byte histogram of the open-passage bits, corridors from one walk along
+    every corridor, and the solution length and diameter from two breadth-first sweeps: the
+    first from the entrance also finds a cell furthest from it, which in a tree is one end of a
+    longest path, and the second from that cell finds the other end.
+
+    Parameters
+    ----------
+    grid : WallGrid Object
+        Walls of the maze, or a PackedWallGrid.
+
+    Returns
+    -------
+    MazeAnalysis
+    """
+    index = NeighborIndex(grid)
+    passages = index.passages
+    offsets = index.offsets
+    num_rows = grid.num_rows
+    num_cells = len(passages)
+    degree = passages.translate(DEGREE)
+    degrees = tuple(degree.count(value) for value in range(5))
+    passage_count = sum(value * count for value, count in enumerate(degrees)) // 2
+
+    exit_k = num_cells - 1
+    far_k, _, solution_length, reached = _sweep(passages, offsets, 0, exit_k)
+    other_k, diameter, _, _ = _sweep(passages, offsets, far_k, far_k)
+
+    return MazeAnalysis(
+        num_cells, degrees, _corridors(passages, offsets, degree), solution_length, diameter,
+        (divmod(far_k, num_rows), divmod(other_k, num_rows)),
+        reached == num_cells and passage_count == num_cells - 1,
+    )
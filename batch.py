@@ -0,0 +1,215 @@
+# ~*~ coding: utf-8 ~*~
+"""
+    File name           : batch.py
+    Author              : Derryn Edwards
+    Date Created        : 2026/10/18
+    Date Last Modified  : 2026/10/18
+    Python Version      : 3.11
+"""
+# ==================================================================================================
+# IMPORTS
+# ==================================================================================================
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+import os
+from analytics import analyze
+from generators import get_generator
+from grid import WallGrid, TOP, BOTTOM
+from solvers import get_solver
+
+
+class MazeSpec(
+        namedtuple("MazeSpec", "num_rows num_cols seed generator", defaults=("backtracker",))
+):
+    """
+    Description of one maze to generate.
+
+    Attributes
+    ----------
+    num_rows : int
+        Number of rows the maze will have.
+    num_cols : int
+        Number of columns the maze will have.
+    seed : int
+        Seed used for random generator.
+    generator : str
+        Default: "backtracker"
+        Name of a generator registered in generators.GENERATORS.
+    """
+
+    __slots__ = ()
+
+
+def build_grid(spec):
+    """
+    Generates the WallGrid described by spec, with the entrance and exit broken like Maze does.
+
+    Parameters
+    ----------
+    spec : MazeSpec or tuple
+        (num_rows, num_cols, seed[, generator]) of the maze.
+    """
+    spec = MazeSpec(*spec)
+    grid = get_generator(spec.generator)(spec.num_cols, spec.num_rows, spec.seed)
+    grid.break_wall(0, 0, TOP)
+    grid.break_wall(spec.num_cols - 1, spec.num_rows - 1, BOTTOM)
+    return grid
+
+
+def _generate_chunk(specs):
+    """Worker: generates every maze of a chunk and returns (spec, packed walls) pairs."""
+    return [(spec, build_grid(spec).to_bytes()) for spec in specs]
+
+
+def _solve_chunk(args):
+    """Worker: solves every maze of a chunk, generating the ones given as a bare MazeSpec."""
+    items, algorithm = args
+    solver = get_solver(algorithm)
+    results = []
+    for item in items:
+        if isinstance(item, MazeSpec):
+            spec, grid = item, build_grid(item)
+        else:
+            spec, data = item
+            grid = WallGrid.from_bytes(spec.num_cols, spec.num_rows, data)
+        results.append(
+            (spec, solver(grid, (0, 0), (spec.num_cols - 1, spec.num_rows - 1)))
+        )
+    return results
+
+
+def _analyze_chunk(items):
+    """Worker: analyzes every maze of a chunk, generating the ones given as a bare MazeSpec."""
+    results = []
+    for item in items:
+        if isinstance(item, MazeSpec):
+            spec, grid = item, build_grid(item)
+        else:
+            spec, data = item
+            grid = WallGrid.from_bytes(spec.num_cols, spec.num_rows, data)
+        results.append((spec, analyze(grid)))
+    return results
+
+
+def _normalize(item):
+    """Turns a spec tuple into a MazeSpec, or a (spec, walls) pair into (MazeSpec, bytes)."""
+    if len(item) == 2 and isinstance(item[0], tuple):
+        return MazeSpec(*item[0]), bytes(item[1])
+    return MazeSpec(*item)
+
+
+def _chunks(items, chunksize):
+    """Groups an iterable into lists of at most chunksize items."""
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == chunksize:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _run(func, chunks, workers):
+    """
+    Runs func over every chunk and yields the results of every chunk in order.
+
+    At most a few chunks per worker are in flight at any time, so arbitrarily long inputs are
+    streamed instead of being submitted all at once. With workers set to 0 everything runs in
+    the calling process.
+    """
+    if workers == 0:
+        for chunk in chunks:
+            yield from func(chunk)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        window = 4 * workers
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(func, chunk))
+            if len(pending) >= window:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def generate_many(specs, workers=None, chunksize=16):
+    """
+    Generates many mazes in parallel across a process pool.
+
+    Every maze gets its own random generator seeded from its spec, so the output only depends
+    on the specs and not on the number of workers or the order they run in.
+
+    Parameters
+    ----------
+    specs : iterable
+        MazeSpec objects or (num_rows, num_cols, seed[, generator]) tuples.
+    workers : int
+        Default: None
+        Number of worker processes. None uses one per CPU, 0 runs in the calling process.
+    chunksize : int
+        Default: 16
+        Number of mazes sent to a worker at a time.
+
+    Yields
+    ------
+    tuple
+        (MazeSpec, packed walls) in the order of specs. WallGrid.from_bytes restores the grid.
+    """
+    specs = (MazeSpec(*spec) for spec in specs)
+    yield from _run(_generate_chunk, _chunks(specs, chunksize), workers)
+
+
+def solve_many(items, algorithm="bfs", workers=None, chunksize=16):
+    """
+    Solves many mazes in parallel across a process pool.
+
+    Parameters
+    ----------
+    items : iterable
+        MazeSpec objects or tuples, generated inside the workers, or (MazeSpec, packed walls)
+        pairs as yielded by generate_many.
+    algorithm : str
+        Default: "bfs"
+        Name of a solver registered in solvers.SOLVERS.
+    workers : int
+        Default: None
+        Number of worker processes. None uses one per CPU, 0 runs in the calling process.
+    chunksize : int
+        Default: 16
+        Number of mazes sent to a worker at a time.
+
+    Yields
+    ------
+    tuple
+        (MazeSpec, SolveResult) in the order of items.
+    """
+    get_solver(algorithm)
+    chunks = ((chunk, algorithm) for chunk in _chunks(map(_normalize, items), chunksize))
+    yield from _run(_solve_chunk, chunks, workers)
+
+
+def analyze_many(items, workers=None, chunksize=64):
+    """
+    Runs analytics.analyze on many mazes in parallel across a process pool.
+
+    Parameters
+    ----------
+    items : iterable
+        MazeSpec objects or tuples, generated inside the workers, or (MazeSpec, packed walls)
+        pairs as yielded by generate_many.
+    workers : int
+        Default: None
+        Number of worker processes. None uses one per CPU, 0 runs in the calling process.
+    chunksize : int
+        Default: 64
+        Number of mazes sent to a worker at a time.
+
+    Yields
+    ------
+    tuple
+        (MazeSpec, MazeAnalysis) in the order of items.
+    """
+    yield from _run(_analyze_chunk, _chunks(map(_normalize, items), chunksize), workers)
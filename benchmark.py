@@ -0,0 +1,334 @@
+# ~*~ coding: utf-8 ~*~
+"""
+    File name           : benchmark.py
+    Author              : Derryn Edwards
+    Date Created        : 2026/10/18
+    Date Last Modified  : 2026/10/18
+    Python Version      : 3.11
+"""
+# ==================================================================================================
+# IMPORTS
+# ==================================================================================================
+import argparse
+import csv
+import json
+import sys
+import time
+import tracemalloc
+from graphics import MazeRenderer
+from maze import Maze
+from solvers import SOLVERS
+
+DEFAULT_SIZES = [10, 50, 100, 500, 1000, 2000]
+PHASES = ("generate", "solve", "render", "memory")
+FIELDS = ("size", "metric", "seconds", "cells_per_second", "peak_bytes")
+
+
+class NullWindow:
+    """Window stand-in for headless rendering benchmarks; hands out item ids and draws nothing."""
+
+    def __init__(self):
+        self.items = 0
+
+    def create_line(self, coords, fill_color="black"):
+        self.items += 1
+        return self.items
+
+    def move_line(self, item, coords):
+        pass
+
+    def recolor_line(self, item, fill_color):
+        pass
+
+    def delete_line(self, item):
+        pass
+
+
+def _record(size, metric, seconds, peak_bytes=None):
+    """Builds one result row."""
+    return {
+        "size": size,
+        "metric": metric,
+        "seconds": seconds,
+        "cells_per_second": size * size / seconds if seconds else None,
+        "peak_bytes": peak_bytes,
+    }
+
+
+def _best_of(repeat, func):
+    """Calls func repeat times and returns the last result and the fastest time."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
+
+
+def benchmark_generation(size, seed=0, repeat=1):
+    """
+    Generates a headless square maze and measures how fast the cells are carved.
+
+    Parameters
+    ----------
+    size : int
+        Number of rows and columns of the maze.
+    seed : int
+        Default: 0
+        Seed used for random generator.
+    repeat : int
+        Default: 1
+        Number of runs; the fastest one is reported.
+
+    Returns
+    -------
+    tuple
+        The generated Maze and its result row.
+    """
+    maze, elapsed = _best_of(
+        repeat, lambda: Maze(0, 0, size, size, 10, 10, seed=seed)
+    )
+    return maze, _record(size, "generate", elapsed)
+
+
+def benchmark_solvers(maze, size, algorithms=None, repeat=1):
+    """
+    Solves a maze with every requested solver.
+
+    Parameters
+    ----------
+    maze : Maze Object
+        Maze to solve.
+    size : int
+        Number of rows and columns of the maze.
+    algorithms : list
+        Default: None
+        Names of the solvers to time. None times every registered solver.
+    repeat : int
+        Default: 1
+        Number of runs per solver; the fastest one is reported.
+
+    Returns
+    -------
+    list
+        One result row per solver.
+    """
+    rows = []
+    for algorithm in algorithms or SOLVERS:
+        _, elapsed = _best_of(repeat, lambda: maze.solve(algorithm))
+        rows.append(_record(size, f"solve:{algorithm}", elapsed))
+    return rows
+
+
+def benchmark_render(maze, size, repeat=1):
+    """
+    Draws every wall of a maze with MazeRenderer on a NullWindow.
+
+    Measures the cost of turning the grid into merged canvas lines, without Tk itself.
+
+    Returns
+    -------
+    dict
+        Result row.
+    """
+    def render():
+        MazeRenderer(NullWindow(), maze.get_grid(), 0, 0, 10, 10).draw_walls()
+
+    _, elapsed = _best_of(repeat, render)
+    return _record(size, "render", elapsed)
+
+
+def benchmark_memory(size, seed=0):
+    """
+    Generates a maze under tracemalloc and records the peak memory allocated while doing so.
+
+    Returns
+    -------
+    dict
+        Result row.
+    """
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        maze = Maze(0, 0, size, size, 10, 10, seed=seed)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del maze
+    return _record(size, "memory:generate", elapsed, peak)
+
+
+def run(sizes, phases=PHASES, seed=0, algorithms=None, repeat=1, out=None):
+    """
+    Runs the requested phases for every size.
+
+    Parameters
+    ----------
+    sizes : list
+        Square maze sizes to benchmark.
+    phases : tuple
+        Default: PHASES
+        Any of "generate", "solve", "render" and "memory".
+    seed : int
+        Default: 0
+        Seed used for random generator.
+    algorithms : list
+        Default: None
+        Names of the solvers to time. None times every registered solver.
+    repeat : int
+        Default: 1
+        Number of runs per timing; the fastest one is reported.
+    out : file
+        Default: None
+        Stream to print every row to as soon as it is measured.
+
+    Returns
+    -------
+    list
+        Result rows.
+    """
+    results = []
+
+    def add(row):
+        results.append(row)
+        if out is not None:
+            print(_format_row(row), file=out, flush=True)
+
+    for size in sizes:
+        if {"generate", "solve", "render"} & set(phases):
+            maze, row = benchmark_generation(size, seed, repeat)
+            if "generate" in phases:
+                add(row)
+            if "solve" in phases:
+                for row in benchmark_solvers(maze, size, algorithms, repeat):
+                    add(row)
+            if "render" in phases:
+                add(benchmark_render(maze, size, repeat))
+            del maze
+        if "memory" in phases:
+            add(benchmark_memory(size, seed))
+    return results
+
+
+def compare(results, baseline, threshold=0.2):
+    """
+    Compares results against a baseline and returns the rows that regressed.
+
+    A row regresses when its time or peak memory is more than threshold above the baseline row
+    with the same size and metric. Memory rows only compare peak memory, since tracemalloc makes
+    their timings unreliable.
+
+    Parameters
+    ----------
+    results : list
+        Result rows of this run.
+    baseline : list
+        Result rows of a previous run.
+    threshold : float
+        Default: 0.2
+        Allowed relative slowdown or memory growth.
+
+    Returns
+    -------
+    list
+        (row, field, baseline value) for every regression.
+    """
+    previous = {(row["size"], row["metric"]): row for row in baseline}
+    regressions = []
+    for row in results:
+        old = previous.get((row["size"], row["metric"]))
+        if old is None:
+            continue
+        fields = ("seconds", "peak_bytes")
+        if row["metric"].startswith("memory"):
+            fields = ("peak_bytes",)
+        for field in fields:
+            if row.get(field) is None or old.get(field) is None:
+                continue
+            if row[field] > old[field] * (1 + threshold):
+                regressions.append((row, field, old[field]))
+    return regressions
+
+
+def _format_row(row):
+    """Formats one result row for the terminal."""
+    rate = row["cells_per_second"]
+    rate = "" if rate is None else f"{rate:,.0f}"
+    peak = row["peak_bytes"]
+    peak = "" if peak is None else f"{peak / row['size'] ** 2:.1f}"
+    return (
+        f"{row['size']:>5}x{row['size']:<5} {row['metric']:>20} {row['seconds']:>9.4f} "
+        f"{rate:>14} {peak:>10}"
+    )
+
+
+def write_json(results, path):
+    """Writes result rows to a JSON file."""
+    with open(path, "w") as file:
+        json.dump(results, file, indent=2)
+
+
+def write_csv(results, path):
+    """Writes result rows to a CSV file."""
+    with open(path, "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark maze generation, solving, rendering and memory across sizes."
+    )
+    parser.add_argument(
+        "sizes", nargs="*", type=int, default=DEFAULT_SIZES,
+        help=f"Square maze sizes (default: {' '.join(map(str, DEFAULT_SIZES))})."
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Seed used for random generator.")
+    parser.add_argument(
+        "--phases", default=",".join(PHASES),
+        help=f"Comma separated phases to run (default: {','.join(PHASES)})."
+    )
+    parser.add_argument(
+        "--solvers", default=None, help="Comma separated solvers to time (default: all)."
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=1, help="Runs per timing, fastest is reported (default: 1)."
+    )
+    parser.add_argument("--json", help="Write the results to this JSON file.")
+    parser.add_argument("--csv", help="Write the results to this CSV file.")
+    parser.add_argument("--baseline", help="JSON results of a previous run to compare against.")
+    parser.add_argument(
+        "--threshold", type=float, default=0.2,
+        help="Allowed slowdown or memory growth against the baseline (default: 0.2)."
+    )
+    args = parser.parse_args()
+
+    phases = tuple(phase for phase in args.phases.split(",") if phase)
+    unknown = set(phases) - set(PHASES)
+    if unknown:
+        parser.error(f"unknown phases: {', '.join(sorted(unknown))}")
+    algorithms = args.solvers.split(",") if args.solvers else None
+
+    print(f"{'size':>11} {'metric':>20} {'seconds':>9} {'cells/s':>14} {'bytes/cell':>10}")
+    results = run(args.sizes, phases, args.seed, algorithms, args.repeat, out=sys.stdout)
+
+    if args.json:
+        write_json(results, args.json)
+    if args.csv:
+        write_csv(results, args.csv)
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions = compare(results, json.load(file), args.threshold)
+        for row, field, old in regressions:
+            print(f"REGRESSION {row['size']}x{row['size']} {row['metric']} {field}: "
+                  f"{old:.4g} -> {row[field]:.4g}")
+        if regressions:
+            sys.exit(1)
+        print("no regressions against baseline")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,217 @@
+# ~*~ coding: utf-8 ~*~
+"""
+    File name           : cache.py
+    Author              : Derryn Edwards
+    Date Created        : 2026/10/18
+    Date Last Modified  : 2026/10/18
+    Python Version      : 3.11
+"""
+# ==================================================================================================
+# IMPORTS
+# ==================================================================================================
+from collections import OrderedDict
+import os
+import threading
+from batch import MazeSpec, build_grid
+from grid import load_grid, save_grid
+from maze import Maze
+from solvers import get_solver
+
+
+class MazeCache:
+    """
+    LRU cache of generated mazes and their solutions, keyed by (rows, cols, seed, generator) and
+    the solver algorithm.
+
+    Entries are evicted least recently used first once their estimated size goes over max_bytes.
+    With a directory, generated grids are also written to disk and memory-mapped back on a
+    miss, so they survive evictions and restarts. Mazes without a seed are never cached.
+
+    Attributes
+    ----------
+    max_bytes : int
+        Upper bound on the estimated size of all entries kept in memory.
+    directory : str
+        Directory for grids persisted on disk. None keeps everything in memory.
+    hits : int
+        Number of lookups answered from the cache.
+    misses : int
+        Number of lookups that had to generate or solve.
+    evictions : int
+        Number of entries dropped to stay under max_bytes.
+    size : int
+        Estimated size of all entries in memory.
+
+    Methods
+    -------
+    get_grid(self, num_rows, num_cols, seed, generator="backtracker")
+        Returns the cached grid of a maze, generating it on a miss.
+    maze(self, num_rows, num_cols, seed, generator="backtracker", **kwargs)
+        Returns a Maze built around the cached grid.
+    solve(self, num_rows, num_cols, seed, algorithm="dfs", generator="backtracker")
+        Returns the cached solution of a maze, solving it on a miss.
+    clear(self)
+        Drops every entry kept in memory.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, directory=None):
+        """
+        Parameters
+        ----------
+        max_bytes : int
+            Default: 64 MiB
+            Upper bound on the estimated size of all entries kept in memory.
+        directory : str
+            Default: None
+            Directory for grids persisted on disk. Created if it does not exist.
+        """
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.size = 0
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def __lookup(self, key):
+        """Returns the entry stored under key and marks it as recently used, or None."""
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.__entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def __store(self, key, value, size):
+        """Stores value under key and evicts the least recently used entries over max_bytes."""
+        with self.__lock:
+            old = self.__entries.pop(key, None)
+            if old is not None:
+                self.size -= old[1]
+            self.__entries[key] = (value, size)
+            self.size += size
+            while self.size > self.max_bytes and len(self.__entries) > 1:
+                _, (_, evicted_size) = self.__entries.popitem(last=False)
+                self.size -= evicted_size
+                self.evictions += 1
+
+    def __path(self, spec):
+        """Returns the file used to persist the grid of spec."""
+        return os.path.join(
+            self.directory,
+            f"{spec.num_rows}x{spec.num_cols}-{spec.seed}-{spec.generator}.maze"
+        )
+
+    def get_grid(self, num_rows, num_cols, seed, generator="backtracker"):
+        """
+        Returns the grid of a maze, with entrance and exit broken, generating it on a miss.
+
+        The grid is shared with later callers and must not be modified.
+
+        Parameters
+        ----------
+        num_rows : int
+            Number of rows the maze will have.
+        num_cols : int
+            Number of columns the maze will have.
+        seed : int
+            Seed used for random generator. None bypasses the cache.
+        generator : str
+            Default: "backtracker"
+            Name of a generator registered in generators.GENERATORS.
+        """
+        spec = MazeSpec(num_rows, num_cols, seed, generator)
+        if seed is None:
+            return build_grid(spec)
+
+        key = ("grid",) + spec
+        grid = self.__lookup(key)
+        if grid is not None:
+            return grid
+
+        path = None if self.directory is None else self.__path(spec)
+        if path is not None and os.path.exists(path):
+            grid = load_grid(path)
+        else:
+            grid = build_grid(spec)
+            if path is not None:
+                save_grid(grid, path)
+        self.__store(key, grid, 2 * num_rows * num_cols)
+        return grid
+
+    def maze(self, num_rows, num_cols, seed, generator="backtracker", **kwargs):
+        """
+        Returns a Maze built around the cached grid of (num_rows, num_cols, seed, generator).
+
+        Every call gets its own copy of the grid, so changes to one Maze do not leak into the
+        cache.
+
+        Parameters
+        ----------
+        num_rows : int
+            Number of rows the maze will have.
+        num_cols : int
+            Number of columns the maze will have.
+        seed : int
+            Seed used for random generator. None bypasses the cache.
+        generator : str
+            Default: "backtracker"
+            Name of a generator registered in generators.GENERATORS.
+        kwargs
+            Other Maze parameters such as x1, y1, cell_size_x, cell_size_y or win.
+        """
+        grid = self.get_grid(num_rows, num_cols, seed, generator).copy()
+        x1 = kwargs.pop("x1", 0)
+        y1 = kwargs.pop("y1", 0)
+        cell_size_x = kwargs.pop("cell_size_x", 10)
+        cell_size_y = kwargs.pop("cell_size_y", 10)
+        return Maze(x1, y1, num_rows, num_cols, cell_size_x, cell_size_y, grid=grid, **kwargs)
+
+    def solve(self, num_rows, num_cols, seed, algorithm="dfs", generator="backtracker"):
+        """
+        Returns the solution of a maze from its entrance to its exit, solving it on a miss.
+
+        The result is shared with later callers and must not be modified.
+
+        Parameters
+        ----------
+        num_rows : int
+            Number of rows the maze will have.
+        num_cols : int
+            Number of columns the maze will have.
+        seed : int
+            Seed used for random generator. None bypasses the cache.
+        algorithm : str
+            Default: "dfs"
+            Name of a solver registered in solvers.SOLVERS.
+        generator : str
+            Default: "backtracker"
+            Name of a generator registered in generators.GENERATORS.
+        """
+        solver = get_solver(algorithm)
+        key = ("solve", num_rows, num_cols, seed, generator, algorithm)
+        if seed is not None:
+            result = self.__lookup(key)
+            if result is not None:
+                return result
+
+        grid = self.get_grid(num_rows, num_cols, seed, generator)
+        result = solver(grid, (0, 0), (num_cols - 1, num_rows - 1))
+        if seed is not None:
+            # the path is packed at 2 bits per step
+            self.__store(key, result, len(result.packed) + 200)
+        return result
+
+    def clear(self):
+        """Drops every entry kept in memory. Grids persisted on disk are kept."""
+        with self.__lock:
+            self.__entries.clear()
+            self.size = 0
@@ -16,6 +16,9 @@ class Cell:
     """
     A class used for creating Cells.
 
+    Kept for compatibility only: Maze no longer creates Cell objects, and get_cells() returns
+    grid.CellView objects that read and write the wall grid.
+
     Attributes
     ----------
     has_left_wall : bool
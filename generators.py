@@ -0,0 +1,370 @@
+# ~*~ coding: utf-8 ~*~
+"""
+    File name           : generators.py
+    Author              : Derryn Edwards
+    Date Created        : 2026/10/18
+    Date Last Modified  : 2026/10/18
+    Python Version      : 3.11
+"""
+# ==================================================================================================
+# IMPORTS
+# ==================================================================================================
+from array import array
+from functools import partial
+from itertools import chain
+from grid import WallGrid, ALL_WALLS, LEFT, RIGHT, TOP, BOTTOM
+import random
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+GENERATORS = {}
+
+# the four 2-bit values packed in every byte, lowest bits first
+_CRUMBS = [(n & 3, (n >> 2) & 3, (n >> 4) & 3, n >> 6) for n in range(256)]
+
+
+class BulkRandom:
+    """
+    A fast source of small random numbers for picking directions.
+
+    Random bytes are drawn from a random.Random in large blocks and handed out two bits at a
+    time, which is much cheaper than a full randrange call per step. It produces different
+    mazes than random.Random for the same seed, but is just as deterministic.
+
+    Methods
+    -------
+    randrange(self, n)
+        Returns a random integer in range(n).
+    """
+
+    __slots__ = ("__rng", "__crumbs")
+
+    def __init__(self, seed=None, block_size=4096):
+        """
+        Parameters
+        ----------
+        seed : int
+            Default: None
+            Seed used for random generator.
+        block_size : int
+            Default: 4096
+            Number of random bytes drawn at a time.
+        """
+        self.__rng = random.Random(seed)
+        blocks = iter(partial(self.__rng.randbytes, block_size), None)
+        self.__crumbs = chain.from_iterable(map(_CRUMBS.__getitem__, chain.from_iterable(blocks)))
+
+    def randrange(self, n):
+        """Returns a random integer in range(n)."""
+        if n == 4:
+            return next(self.__crumbs)
+        if n == 2:
+            return next(self.__crumbs) & 1
+        if n == 1:
+            return 0
+        if n == 3:
+            while True:
+                crumb = next(self.__crumbs)
+                if crumb != 3:
+                    return crumb
+        return self.__rng.randrange(n)
+
+
+def register_generator(name):
+    """
+    Decorator that adds a generator function to the GENERATORS registry under the given name.
+
+    A generator is called as generator(num_cols, num_rows, seed) and returns a WallGrid holding
+    a perfect maze without entrance or exit.
+
+    Parameters
+    ----------
+    name : str
+        Name used to select the generator through Maze(generator=name).
+    """
+    def decorator(func):
+        GENERATORS[name] = func
+        return func
+    return decorator
+
+
+def get_generator(name):
+    """
+    Returns the generator registered under name.
+
+    Raises
+    ------
+    ValueError
+        If no generator is registered under name.
+    """
+    try:
+        return GENERATORS[name]
+    except KeyError:
+        raise ValueError(
+            f"unknown generator {name!r}, expected one of: {', '.join(sorted(GENERATORS))}"
+        ) from None
+
+
+def _carve(grid, i, j, rng, report):
+    """
+    Generator breaking walls in a depth-first traversal starting at cell (i, j).
+
+    The traversal keeps its own stack instead of recursing. Neighbours are checked in left,
+    right, up, down order and picked with rng.randrange, like the original recursive
+    Maze.__break_walls_r, so a given seed produces the same maze.
+
+    Parameters
+    ----------
+    grid : WallGrid Object
+        Grid to carve. Cells already marked visited are left alone.
+    i : int
+        Column of the starting cell.
+    j : int
+        Row of the starting cell.
+    rng : random.Random Object
+        Source of randomness; anything with a randrange method.
+    report : bool
+        Yield (i, j, wall) after every wall that is broken. While False the traversal never
+        yields, so it runs to the end on the first next().
+    """
+    walls = grid.walls
+    stamps = grid.stamps
+    epoch = grid.epoch
+    num_rows = grid.num_rows
+    max_i = grid.num_cols - 1
+    max_j = num_rows - 1
+    randrange = rng.randrange
+    # flat index offset to the neighbour behind each wall, and the wall facing back
+    offsets = {LEFT: -num_rows, RIGHT: num_rows, TOP: -1, BOTTOM: 1}
+    opposite = {LEFT: ~RIGHT, RIGHT: ~LEFT, TOP: ~BOTTOM, BOTTOM: ~TOP}
+
+    k = i * num_rows + j
+    stamps[k] = epoch
+    stack = array("l", [k])
+
+    while stack:
+        k = stack[-1]
+        i, j = divmod(k, num_rows)
+        directions = []
+
+        # check left
+        if i > 0 and stamps[k - num_rows] != epoch:
+            directions.append(LEFT)
+        # check right
+        if i < max_i and stamps[k + num_rows] != epoch:
+            directions.append(RIGHT)
+        # check up
+        if j > 0 and stamps[k - 1] != epoch:
+            directions.append(TOP)
+        # check down
+        if j < max_j and stamps[k + 1] != epoch:
+            directions.append(BOTTOM)
+
+        # if nowhere to go, backtrack
+        if not directions:
+            stack.pop()
+            continue
+
+        # randomly choose the next direction to go
+        direction = directions[randrange(len(directions))]
+        next_k = k + offsets[direction]
+
+        # break walls between this cell and the next cell
+        walls[k] &= ~direction
+        walls[next_k] &= opposite[direction]
+        if report:
+            yield i, j, direction
+
+        # visit the next cell
+        stamps[next_k] = epoch
+        stack.append(next_k)
+
+
+def carve_backtracker(grid, i, j, rng, on_break=None):
+    """
+    Breaks walls in a depth-first traversal starting at cell (i, j).
+
+    Parameters
+    ----------
+    grid : WallGrid Object
+        Grid to carve. Cells already marked visited are left alone.
+    i : int
+        Column of the starting cell.
+    j : int
+        Row of the starting cell.
+    rng : random.Random Object
+        Source of randomness; anything with a randrange method.
+    on_break : callable
+        Default: None
+        Called as on_break(i, j, wall) after every wall that is broken.
+    """
+    carve = _carve(grid, i, j, rng, on_break is not None)
+    if on_break is None:
+        next(carve, None)
+        return
+    for event in carve:
+        on_break(*event)
+
+
+def iter_backtracker(grid, i, j, rng):
+    """
+    Breaks walls like carve_backtracker, lazily yielding (i, j, wall) for every broken wall.
+
+    Stopping early leaves the grid partially carved.
+    """
+    return _carve(grid, i, j, rng, True)
+
+
+def iter_walls(grid):
+    """
+    Yields (i, j, wall) for every inner wall missing from a finished grid, column by column.
+
+    Replaying these events with break_wall on a grid with every wall standing rebuilds the inner
+    walls of grid, which lets generators that build the whole grid at once be streamed.
+    """
+    walls = grid.walls
+    num_rows = grid.num_rows
+    max_i = grid.num_cols - 1
+    max_j = num_rows - 1
+    for k, cell in enumerate(walls):
+        i, j = divmod(k, num_rows)
+        if i < max_i and not cell & RIGHT:
+            yield i, j, RIGHT
+        if j < max_j and not cell & BOTTOM:
+            yield i, j, BOTTOM
+
+
+@register_generator("backtracker")
+def backtracker(num_cols, num_rows, seed=None):
+    """
+    Randomized depth-first backtracker, the default Maze generator.
+
+    Uses its own random.Random(seed), so it is safe to run in parallel and produces the same
+    maze as Maze(seed=seed).
+
+    Parameters
+    ----------
+    num_cols : int
+        Number of columns the maze will have.
+    num_rows : int
+        Number of rows the maze will have.
+    seed : int
+        Default: None
+        Seed used for random generator.
+    """
+    grid = WallGrid(num_cols, num_rows)
+    carve_backtracker(grid, 0, 0, random.Random(seed))
+    grid.reset_visited()
+    return grid
+
+
+def _require_numpy(name):
+    """Raises ImportError if NumPy is not installed."""
+    if np is None:
+        raise ImportError(
+            f"the {name!r} generator requires NumPy, install it with `pip install numpy`"
+        )
+
+
+def _to_grid(walls):
+    """Copies a (num_cols, num_rows) uint8 array of wall bits into a new WallGrid."""
+    num_cols, num_rows = walls.shape
+    grid = WallGrid(num_cols, num_rows)
+    grid.walls[:] = walls.tobytes()
+    return grid
+
+
+def _carve_horizontal(walls, mask):
+    """Breaks the wall between every cell (i, j) in mask and its right neighbour (i + 1, j)."""
+    walls[:-1][mask] &= np.uint8(ALL_WALLS ^ RIGHT)
+    walls[1:][mask] &= np.uint8(ALL_WALLS ^ LEFT)
+
+
+def _carve_vertical(walls, cols, rows):
+    """Breaks the wall between every cell (cols[n], rows[n]) and the cell above it."""
+    walls[cols, rows] &= np.uint8(ALL_WALLS ^ TOP)
+    walls[cols, rows - 1] &= np.uint8(ALL_WALLS ^ BOTTOM)
+
+
+@register_generator("sidewinder")
+def sidewinder(num_cols, num_rows, seed=None):
+    """
+    Vectorized sidewinder generator.
+
+    The top row is one open corridor. In every other row, cells are grouped into runs by
+    randomly carving to the right, and each run gets exactly one passage up to a random cell of
+    the run. All rows are processed at once with NumPy.
+
+    Parameters
+    ----------
+    num_cols : int
+        Number of columns the maze will have.
+    num_rows : int
+        Number of rows the maze will have.
+    seed : int
+        Default: None
+        Seed used for random generator.
+    """
+    _require_numpy("sidewinder")
+    rng = np.random.default_rng(seed)
+    walls = np.full((num_cols, num_rows), ALL_WALLS, dtype=np.uint8)
+
+    # carve right everywhere on the top row, and randomly on the others
+    east = rng.random((num_cols - 1, num_rows)) < 0.5
+    east[:, 0] = True
+    _carve_horizontal(walls, east)
+
+    if num_rows > 1:
+        # runs end wherever a cell did not carve right; the last column always ends a run
+        run_ends = np.ones((num_rows - 1, num_cols), dtype=bool)
+        run_ends[:, :-1] = ~east[:, 1:].T
+        ends = np.flatnonzero(run_ends)
+        starts = np.empty_like(ends)
+        starts[0] = 0
+        starts[1:] = ends[:-1] + 1
+        chosen = starts + (rng.random(len(ends)) * (ends - starts + 1)).astype(np.int64)
+        rows, cols = np.divmod(chosen, num_cols)
+        _carve_vertical(walls, cols, rows + 1)
+
+    return _to_grid(walls)
+
+
+@register_generator("binary_tree")
+def binary_tree(num_cols, num_rows, seed=None):
+    """
+    Vectorized binary tree generator.
+
+    Every cell except the top-left one carves a passage either left or up, chosen at random
+    where both are possible. The whole grid is processed at once with NumPy.
+
+    Parameters
+    ----------
+    num_cols : int
+        Number of columns the maze will have.
+    num_rows : int
+        Number of rows the maze will have.
+    seed : int
+        Default: None
+        Seed used for random generator.
+    """
+    _require_numpy("binary_tree")
+    rng = np.random.default_rng(seed)
+    walls = np.full((num_cols, num_rows), ALL_WALLS, dtype=np.uint8)
+
+    up = rng.random((num_cols, num_rows)) < 0.5
+    # the top row can only carve left and the left column can only carve up
+    up[:, 0] = False
+    up[0, :] = True
+    up[0, 0] = False
+
+    cols, rows = np.nonzero(up)
+    _carve_vertical(walls, cols, rows)
+
+    # carving left from (i + 1, j) breaks the same wall as carving right from (i, j)
+    left = ~up[1:]
+    _carve_horizontal(walls, left)
+
+    return _to_grid(walls)
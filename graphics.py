@@ -3,13 +3,20 @@
     File name           : graphics.py
     Author              : Derryn Edwards
     Date Created        : 2023/08/12
-    Date Last Modified  : 2023/08/12
+    Date Last Modified  : 2026/10/18
     Python Version      : 3.11
 """
 # ==================================================================================================
 # IMPORTS
 # ==================================================================================================
-from tkinter import Tk, BOTH, Canvas
+import asyncio
+from bisect import bisect_right
+from grid import LEFT, RIGHT, TOP, BOTTOM
+
+try:
+    from tkinter import Tk, BOTH, Canvas
+except ImportError:
+    Tk = None
 
 
 class Window:
@@ -31,9 +38,21 @@ class Window:
         Update the window for continuous running.
     wait_for_close(self)
         Updates the __running attribute to True
-        Keeps the window running with redraw()
+        Blocks in the Tk event loop until the window is closed.
+    wait_for_close_async(self, interval=1 / 30)
+        Keeps the window responsive from an asyncio event loop until it is closed.
     close(self)
         Updates the __running attribute to False for closing the window.
+    draw_line(self, line, fill_color="black")
+        Draws a line on the canvas by calling the Line class draw method.
+    create_line(self, coords, fill_color="black")
+        Creates a line or polyline on the canvas and returns its item id.
+    move_line(self, item, coords)
+        Moves an existing line item to new coordinates.
+    recolor_line(self, item, fill_color)
+        Changes the color of an existing line item.
+    delete_line(self, item)
+        Removes a line item from the canvas.
     """
 
     def __init__(self, width, height):
@@ -45,6 +64,10 @@ class Window:
         height : int
             Height of the window
         """
+        if Tk is None:
+            raise ImportError(
+                "Window requires Tkinter; install python-tk or draw with raster.RasterWindow"
+            )
         self.__root = Tk()
         self.__root.title("Maze Solver")
         self.__canvas = Canvas(self.__root, bg="white", height=height, width=width)
@@ -53,21 +76,47 @@ class Window:
         self.__root.protocol("WM_DELETE_WINDOW", self.close)
 
     def redraw(self):
-        """Update the window for continuous running."""
-        self.__root.update_idletasks()
+        """
+        Update the window for continuous running.
+
+        One update() call processes pending events and idle tasks, such as canvas redraws, in a
+        single pump of the Tk event loop.
+        """
         self.__root.update()
 
     def wait_for_close(self):
-        """Updates the __running attribute to True. Keeps the window running with redraw()"""
+        """
+        Updates the __running attribute to True. Keeps the window running until it is closed.
+
+        Tk's mainloop sleeps until the next event arrives, so waiting does not spin the CPU.
+        """
         self.__running = True
+        self.__root.mainloop()
+        print("Window closed...")
+
+    async def wait_for_close_async(self, interval=1 / 30):
+        """
+        Keeps the window responsive until it is closed, without blocking an asyncio event loop.
+
+        Tk events are processed every interval seconds; the loop is free for other tasks in
+        between.
 
+        Parameters
+        ----------
+        interval : float
+            Default: 1 / 30
+            Seconds between two updates of the window.
+        """
+        self.__running = True
         while self.__running:
             self.redraw()
+            await asyncio.sleep(interval)
         print("Window closed...")
 
     def close(self):
         """Updates the __running attribute to False for closing the window."""
         self.__running = False
+        self.__root.quit()
 
     def draw_line(self, line, fill_color="black"):
         """
@@ -82,6 +131,366 @@ class Window:
         """
         line.draw(self.__canvas, fill_color)
 
+    def create_line(self, coords, fill_color="black"):
+        """
+        Creates a line or polyline on the canvas and returns its item id.
+
+        Parameters
+        ----------
+        coords : list
+            Flat list of coordinates x1, y1, x2, y2, ... of the points of the line.
+        fill_color : str
+            String defining the color such as "black" or "red".
+        """
+        return self.__canvas.create_line(*coords, fill=fill_color, width=2)
+
+    def move_line(self, item, coords):
+        """
+        Moves an existing line item to new coordinates.
+
+        Parameters
+        ----------
+        item : int
+            Canvas item id returned by create_line.
+        coords : list
+            Flat list of coordinates x1, y1, x2, y2, ... of the points of the line.
+        """
+        self.__canvas.coords(item, *coords)
+
+    def recolor_line(self, item, fill_color):
+        """
+        Changes the color of an existing line item.
+
+        Parameters
+        ----------
+        item : int
+            Canvas item id returned by create_line.
+        fill_color : str
+            String defining the color such as "black" or "red".
+        """
+        self.__canvas.itemconfigure(item, fill=fill_color)
+
+    def delete_line(self, item):
+        """
+        Removes a line item from the canvas.
+
+        Parameters
+        ----------
+        item : int
+            Canvas item id returned by create_line.
+        """
+        self.__canvas.delete(item)
+
+
+class MazeRenderer:
+    """
+    Draws the walls of a WallGrid and the moves of a solver with as few canvas items as possible.
+
+    Every horizontal and vertical grid line is drawn as a handful of items, one per unbroken run
+    of wall segments, instead of one item per wall. When a wall is broken, only the run that
+    contains it is shortened or split, reusing its canvas item. Solver moves get one item per
+    pair of cells that is recolored in place on backtracking.
+
+    Changes can also be queued with queue_wall and queue_move and applied together by flush,
+    once per animation frame. Within a frame every run item is moved at most once, however many
+    of its walls were broken, and a move drawn and then backtracked is created in its final
+    color.
+
+    Attributes
+    ----------
+    __win : Window Object
+        Window to draw on. Anything with create_line, move_line, recolor_line and delete_line.
+    __grid : WallGrid Object
+        Walls of the maze.
+    __x1 : int
+        x-coordinate on where the Maze starts.
+    __y1 : int
+        y-coordinate on where the Maze starts.
+    __cell_size_x : float
+        Width of each cell.
+    __cell_size_y : float
+        Height of each cell.
+    __runs : dict
+        Maps ("h", line) and ("v", line) to the sorted [start, end, item] runs drawn on that line.
+    __moves : dict
+        Maps a pair of cells to the item drawn for the move between them.
+    __dirty_lines : dict
+        Maps the grid lines with queued wall changes to the set of changed segments.
+    __dirty_moves : dict
+        Maps the pairs of cells with queued moves to their latest fill color.
+    __pending_coords : dict
+        While flushing, maps run items to their latest coordinates. None otherwise.
+
+    Methods
+    -------
+    draw_walls(self)
+        Draws every wall of the grid, reusing the items of a previous draw.
+    update_wall(self, i, j, wall)
+        Updates the drawing of one wall of cell (i, j) after it changed in the grid.
+    draw_move(self, from_ij, to_ij, undo=False)
+        Draws a line between the center of 2 cells as a Path.
+    queue_wall(self, i, j, wall)
+        Queues a wall change of cell (i, j) until the next flush.
+    queue_move(self, from_ij, to_ij, undo=False)
+        Queues a solver move until the next flush.
+    flush(self)
+        Applies every queued change to the window.
+    """
+
+    def __init__(self, win, grid, x1, y1, cell_size_x, cell_size_y):
+        """
+        Parameters
+        ----------
+        win : Window Object
+            Window to draw on.
+        grid : WallGrid Object
+            Walls of the maze.
+        x1 : int
+            x-coordinate on where the Maze starts.
+        y1 : int
+            y-coordinate on where the Maze starts.
+        cell_size_x : float
+            Width of each cell.
+        cell_size_y : float
+            Height of each cell.
+        """
+        self.__win = win
+        self.__grid = grid
+        self.__x1 = x1
+        self.__y1 = y1
+        self.__cell_size_x = cell_size_x
+        self.__cell_size_y = cell_size_y
+        self.__runs = {}
+        self.__moves = {}
+        self.__dirty_lines = {}
+        self.__dirty_moves = {}
+        self.__pending_coords = None
+
+    def __has_segment(self, key, segment):
+        """Returns True if the wall segment of a grid line is present on either side of it."""
+        grid = self.__grid
+        walls = grid.walls
+        num_rows = grid.num_rows
+        direction, line = key
+        if direction == "h":
+            k = segment * num_rows + line
+            below = line < num_rows and walls[k] & TOP
+            above = line > 0 and walls[k - 1] & BOTTOM
+        else:
+            k = line * num_rows + segment
+            below = line < grid.num_cols and walls[k] & LEFT
+            above = line > 0 and walls[k - num_rows] & RIGHT
+        return bool(below or above)
+
+    def __coords(self, key, start, end):
+        """Returns the canvas coordinates of segments start to end of a grid line."""
+        direction, line = key
+        if direction == "h":
+            y = self.__y1 + line * self.__cell_size_y
+            return [
+                self.__x1 + start * self.__cell_size_x, y, self.__x1 + end * self.__cell_size_x, y
+            ]
+        x = self.__x1 + line * self.__cell_size_x
+        return [x, self.__y1 + start * self.__cell_size_y, x, self.__y1 + end * self.__cell_size_y]
+
+    def __redraw_line(self, key):
+        """Draws one grid line as merged runs of wall segments, reusing its existing items."""
+        grid = self.__grid
+        num_segments = grid.num_cols if key[0] == "h" else grid.num_rows
+        spans = []
+        start = None
+        for segment in range(num_segments):
+            if self.__has_segment(key, segment):
+                if start is None:
+                    start = segment
+            elif start is not None:
+                spans.append((start, segment))
+                start = None
+        if start is not None:
+            spans.append((start, num_segments))
+
+        old_items = [item for _, _, item in self.__runs.get(key, ())]
+        runs = []
+        for n, (start, end) in enumerate(spans):
+            coords = self.__coords(key, start, end)
+            if n < len(old_items):
+                item = old_items[n]
+                self.__move_item(item, coords)
+            else:
+                item = self.__win.create_line(coords)
+            runs.append([start, end, item])
+        for item in old_items[len(spans):]:
+            self.__delete_item(item)
+        self.__runs[key] = runs
+
+    def draw_walls(self):
+        """Draws every wall of the grid, reusing the items of a previous draw."""
+        for line in range(self.__grid.num_rows + 1):
+            self.__redraw_line(("h", line))
+        for line in range(self.__grid.num_cols + 1):
+            self.__redraw_line(("v", line))
+
+    @staticmethod
+    def __locate(i, j, wall):
+        """Returns the grid line and segment of a wall of cell (i, j)."""
+        if wall == LEFT:
+            return ("v", i), j
+        if wall == RIGHT:
+            return ("v", i + 1), j
+        if wall == TOP:
+            return ("h", j), i
+        return ("h", j + 1), i
+
+    def __move_item(self, item, coords):
+        """Moves a run item now, or at the end of the current flush."""
+        if self.__pending_coords is None:
+            self.__win.move_line(item, coords)
+        else:
+            self.__pending_coords[item] = coords
+
+    def __delete_item(self, item):
+        """Deletes a run item, dropping any move of it still pending."""
+        if self.__pending_coords is not None:
+            self.__pending_coords.pop(item, None)
+        self.__win.delete_line(item)
+
+    def __update_segment(self, key, segment):
+        """Updates the drawing of one segment of a grid line after it changed in the grid."""
+        runs = self.__runs.get(key)
+        if runs is None or self.__has_segment(key, segment):
+            # a wall was added; rebuild the whole line
+            self.__redraw_line(key)
+            return
+
+        n = bisect_right(runs, segment, key=lambda run: run[0]) - 1
+        if n < 0 or runs[n][1] <= segment:
+            return
+        start, end, item = runs[n]
+        if start < segment:
+            # keep the part before the broken segment in the existing item
+            runs[n][1] = segment
+            self.__move_item(item, self.__coords(key, start, segment))
+            if segment + 1 < end:
+                tail = self.__win.create_line(self.__coords(key, segment + 1, end))
+                runs.insert(n + 1, [segment + 1, end, tail])
+        elif segment + 1 < end:
+            runs[n][0] = segment + 1
+            self.__move_item(item, self.__coords(key, segment + 1, end))
+        else:
+            self.__delete_item(item)
+            del runs[n]
+
+    def update_wall(self, i, j, wall):
+        """
+        Updates the drawing of one wall of cell (i, j) after it changed in the grid.
+
+        Parameters
+        ----------
+        i : int
+            Column of the cell.
+        j : int
+            Row of the cell.
+        wall : int
+            One of LEFT, RIGHT, TOP or BOTTOM.
+        """
+        self.__update_segment(*self.__locate(i, j, wall))
+
+    def draw_move(self, from_ij, to_ij, undo=False):
+        """
+        Draws a line between the center of 2 cells as a Path.
+
+        Parameters
+        ----------
+        from_ij : tuple
+            (i, j) coordinates of the cell the move starts from.
+        to_ij : tuple
+            (i, j) coordinates of the cell the move goes to.
+        undo : bool
+            Identifier for backtracking. Change line fill_color.
+        """
+        self.__draw_move((min(from_ij, to_ij), max(from_ij, to_ij)), "blue" if undo else "red")
+
+    def __draw_move(self, key, fill_color):
+        """Draws or recolors the move between the pair of cells key."""
+        item = self.__moves.get(key)
+        if item is not None:
+            self.__win.recolor_line(item, fill_color)
+            return
+
+        coords = []
+        for i, j in key:
+            coords.append(self.__x1 + (i + 0.5) * self.__cell_size_x)
+            coords.append(self.__y1 + (j + 0.5) * self.__cell_size_y)
+        self.__moves[key] = self.__win.create_line(coords, fill_color)
+
+    def queue_wall(self, i, j, wall):
+        """
+        Queues a wall change of cell (i, j) until the next flush.
+
+        Parameters
+        ----------
+        i : int
+            Column of the cell.
+        j : int
+            Row of the cell.
+        wall : int
+            One of LEFT, RIGHT, TOP or BOTTOM.
+        """
+        key, segment = self.__locate(i, j, wall)
+        segments = self.__dirty_lines.get(key)
+        if segments is None:
+            self.__dirty_lines[key] = {segment}
+        else:
+            segments.add(segment)
+
+    def queue_move(self, from_ij, to_ij, undo=False):
+        """
+        Queues a solver move until the next flush. Only the last color of a move is drawn.
+
+        Parameters
+        ----------
+        from_ij : tuple
+            (i, j) coordinates of the cell the move starts from.
+        to_ij : tuple
+            (i, j) coordinates of the cell the move goes to.
+        undo : bool
+            Identifier for backtracking. Change line fill_color.
+        """
+        key = (min(from_ij, to_ij), max(from_ij, to_ij))
+        # re-insert so moves are drawn in the order of their last change
+        self.__dirty_moves.pop(key, None)
+        self.__dirty_moves[key] = "blue" if undo else "red"
+
+    def flush(self):
+        """
+        Applies every queued change to the window.
+
+        Wall segments are updated in place one by one, but the items they move are only moved
+        on the window once, to their final coordinates.
+
+        Returns
+        -------
+        int
+            Number of grid lines and moves that were updated.
+        """
+        dirty_lines = self.__dirty_lines
+        dirty_moves = self.__dirty_moves
+        self.__dirty_lines = {}
+        self.__dirty_moves = {}
+        self.__pending_coords = {}
+        try:
+            for key, segments in dirty_lines.items():
+                for segment in sorted(segments):
+                    self.__update_segment(key, segment)
+        finally:
+            pending_coords = self.__pending_coords
+            self.__pending_coords = None
+        for item, coords in pending_coords.items():
+            self.__win.move_line(item, coords)
+        for key, fill_color in dirty_moves.items():
+            self.__draw_move(key, fill_color)
+        return len(dirty_lines) + len(dirty_moves)
+
 
 class Point:
     """
@@ -159,4 +568,3 @@ class Line:
             fill=fill_color,
             width=2
         )
-        canvas.pack(fill=BOTH, expand=1)
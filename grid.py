@@ -0,0 +1,798 @@
+# ~*~ coding: utf-8 ~*~
+"""
+    File name           : grid.py
+    Author              : Derryn Edwards
+    Date Created        : 2026/10/18
+    Date Last Modified  : 2026/10/18
+    Python Version      : 3.11
+"""
+# ==================================================================================================
+# IMPORTS
+# ==================================================================================================
+import mmap
+import operator
+import struct
+import weakref
+
+# wall bits stored for every cell
+LEFT = 1
+RIGHT = 2
+TOP = 4
+BOTTOM = 8
+ALL_WALLS = LEFT | RIGHT | TOP | BOTTOM
+
+# wall on the neighbouring cell that faces each wall
+OPPOSITE = {LEFT: RIGHT, RIGHT: LEFT, TOP: BOTTOM, BOTTOM: TOP}
+
+# (di, dj) step to the neighbouring cell behind each wall
+STEPS = {LEFT: (-1, 0), RIGHT: (1, 0), TOP: (0, -1), BOTTOM: (0, 1)}
+
+# file header: magic, format version, num_cols, num_rows
+MAGIC = b"MAZE"
+VERSION = 1
+_HEADER = struct.Struct("<4sB3xII")
+
+# byte translation tables turning wall bits into open-passage bits, or closing one side
+_OPEN = bytes(~n & ALL_WALLS for n in range(256))
+_CLOSE = {wall: bytes(n & ~wall for n in range(256)) for wall in (LEFT, RIGHT, TOP, BOTTOM)}
+
+# byte translation tables used to pack two cells into one byte and back
+_HIGH_NIBBLE = bytes((n << 4) & 0xFF for n in range(256))
+_LOW_BITS = bytes(n & 0x0F for n in range(256))
+_HIGH_BITS = bytes(n >> 4 for n in range(256))
+
+# packed bytes decoded per slice of a PackedWalls buffer, bounding the temporary copies
+_DECODE_CHUNK = 1 << 20
+
+
+def pack_walls(walls):
+    """
+    Packs a sequence of wall bytes into 4 bits per cell, cell n in the low nibble of byte n // 2
+    when n is even and in the high nibble when n is odd.
+    """
+    low = walls[0::2]
+    high = walls[1::2].translate(_HIGH_NIBBLE).ljust(len(low), b"\0")
+    # OR both halves together in one go through big integers
+    packed = int.from_bytes(low, "little") | int.from_bytes(high, "little")
+    return packed.to_bytes(len(low), "little")
+
+
+class WallGrid:
+    """
+    Compact storage for the walls of a maze.
+
+    Every cell is one byte in a bytearray holding its LEFT, RIGHT, TOP and BOTTOM wall bits, and
+    one byte in a separate stamps bytearray. Cells are stored column by column, so cell (i, j)
+    lives at index i * num_rows + j, matching the cells[i][j] layout used by Maze.
+
+    A cell is visited when its stamp equals the current epoch. Resetting every visited flag just
+    moves on to the next epoch, so it costs O(1) instead of a sweep over the grid; the stamps are
+    only cleared once every 255 resets, when the epoch wraps around.
+
+    changes counts the walls changed through break_wall and CellView, so anything derived from
+    the walls, like a PathIndex, can tell when it is out of date. Writes straight into walls
+    are not counted.
+
+    Attributes
+    ----------
+    num_cols : int
+        Number of columns in the grid.
+    num_rows : int
+        Number of rows in the grid.
+    walls : bytearray
+        Wall bits of every cell.
+    stamps : bytearray
+        Epoch in which every cell was last visited.
+    epoch : int
+        Current epoch, from 1 to 255.
+    changes : int
+        Number of wall changes made through break_wall and CellView.
+
+    Methods
+    -------
+    index(self, i, j)
+        Returns the flat index of cell (i, j).
+    has_wall(self, i, j, wall)
+        Returns True if cell (i, j) has the given wall.
+    break_wall(self, i, j, wall)
+        Removes a wall from cell (i, j) and the facing wall of its neighbour.
+    is_visited(self, k)
+        Returns True if cell k was visited in the current epoch.
+    mark_visited(self, k)
+        Marks cell k as visited in the current epoch.
+    unmark_visited(self, k)
+        Marks cell k as not visited.
+    visited_count(self)
+        Returns the number of cells visited in the current epoch.
+    reset_visited(self)
+        Resets the visited flag of every cell in O(1).
+    copy(self)
+        Returns an independent copy of the grid.
+    to_bytes(self)
+        Packs the walls into 4 bits per cell.
+    from_bytes(cls, num_cols, num_rows, data)
+        Creates a grid from walls packed by to_bytes.
+    """
+
+    __slots__ = ("num_cols", "num_rows", "walls", "stamps", "epoch", "changes")
+
+    def __init__(self, num_cols, num_rows):
+        """
+        Parameters
+        ----------
+        num_cols : int
+            Number of columns in the grid.
+        num_rows : int
+            Number of rows in the grid.
+        """
+        self.num_cols = num_cols
+        self.num_rows = num_rows
+        self.walls = bytearray([ALL_WALLS]) * (num_cols * num_rows)
+        self.stamps = bytearray(num_cols * num_rows)
+        self.epoch = 1
+        self.changes = 0
+
+    def __len__(self):
+        return len(self.walls)
+
+    def index(self, i, j):
+        """Returns the flat index of cell (i, j)."""
+        return i * self.num_rows + j
+
+    def has_wall(self, i, j, wall):
+        """Returns True if cell (i, j) has the given wall."""
+        return bool(self.walls[i * self.num_rows + j] & wall)
+
+    def break_wall(self, i, j, wall):
+        """
+        Removes a wall from cell (i, j) and the facing wall of its neighbour, if it has one.
+
+        Parameters
+        ----------
+        i : int
+            Column of the cell.
+        j : int
+            Row of the cell.
+        wall : int
+            One of LEFT, RIGHT, TOP or BOTTOM.
+        """
+        k = i * self.num_rows + j
+        self.changes += 1
+        self.walls[k] &= ~wall
+        if wall == LEFT and i > 0:
+            self.walls[k - self.num_rows] &= ~RIGHT
+        elif wall == RIGHT and i < self.num_cols - 1:
+            self.walls[k + self.num_rows] &= ~LEFT
+        elif wall == TOP and j > 0:
+            self.walls[k - 1] &= ~BOTTOM
+        elif wall == BOTTOM and j < self.num_rows - 1:
+            self.walls[k + 1] &= ~TOP
+
+    def is_visited(self, k):
+        """Returns True if cell k was visited in the current epoch."""
+        return self.stamps[k] == self.epoch
+
+    def mark_visited(self, k):
+        """Marks cell k as visited in the current epoch."""
+        self.stamps[k] = self.epoch
+
+    def unmark_visited(self, k):
+        """Marks cell k as not visited."""
+        # epochs start at 1, so a stamp of 0 is never visited
+        self.stamps[k] = 0
+
+    def visited_count(self):
+        """Returns the number of cells visited in the current epoch."""
+        return self.stamps.count(self.epoch)
+
+    def reset_visited(self):
+        """Resets the visited flag of every cell by moving on to the next epoch."""
+        self.epoch += 1
+        if self.epoch > 255:
+            # stamps are single bytes; clear them and start over once every 255 resets
+            self.stamps[:] = bytes(len(self.stamps))
+            self.epoch = 1
+
+    def copy(self):
+        """Returns an independent copy of the grid."""
+        grid = WallGrid.__new__(WallGrid)
+        grid.num_cols = self.num_cols
+        grid.num_rows = self.num_rows
+        grid.walls = bytearray(self.walls)
+        grid.stamps = bytearray(self.stamps)
+        grid.epoch = self.epoch
+        grid.changes = self.changes
+        return grid
+
+    def to_bytes(self):
+        """
+        Packs the walls into 4 bits per cell.
+
+        Cell n is stored in the low nibble of byte n // 2 when n is even and in the high nibble
+        when n is odd.
+        """
+        return pack_walls(self.walls)
+
+    @classmethod
+    def from_bytes(cls, num_cols, num_rows, data):
+        """
+        Creates a grid from walls packed by to_bytes.
+
+        Parameters
+        ----------
+        num_cols : int
+            Number of columns in the grid.
+        num_rows : int
+            Number of rows in the grid.
+        data : bytes
+            Walls packed 4 bits per cell.
+        """
+        grid = cls(num_cols, num_rows)
+        num_cells = num_cols * num_rows
+        if len(data) != (num_cells + 1) // 2:
+            raise ValueError(
+                f"expected {(num_cells + 1) // 2} bytes for a {num_cols}x{num_rows} grid, "
+                f"got {len(data)}"
+            )
+        grid.walls[0::2] = data.translate(_LOW_BITS)
+        grid.walls[1::2] = data.translate(_HIGH_BITS)[:num_cells // 2]
+        return grid
+
+
+class PackedWalls:
+    """
+    Read-only sequence of wall bits stored 4 bits per cell in a buffer, such as an mmap.
+
+    Indexing returns the wall bits of one cell, decoded on the fly, so the walls never have to
+    be unpacked into memory.
+    """
+
+    __slots__ = ("__data", "__offset", "__length")
+
+    def __init__(self, data, offset, length):
+        """
+        Parameters
+        ----------
+        data : buffer
+            Buffer holding the packed walls, such as bytes or an mmap.
+        offset : int
+            Position of the first packed byte in data.
+        length : int
+            Number of cells.
+        """
+        self.__data = data
+        self.__offset = offset
+        self.__length = length
+
+    def __len__(self):
+        return self.__length
+
+    def __getitem__(self, k):
+        if k < 0:
+            k += self.__length
+        if not 0 <= k < self.__length:
+            raise IndexError("cell index out of range")
+        byte = self.__data[self.__offset + (k >> 1)]
+        return byte >> 4 if k & 1 else byte & 0x0F
+
+    def translate(self, table):
+        """
+        Returns a bytearray of the wall bits of every cell mapped through table, like
+        bytearray.translate. The nibbles are decoded straight from the buffer a chunk at a time,
+        so no other full copy of the walls is made.
+
+        Parameters
+        ----------
+        table : bytes
+            Translation table of 256 bytes, or None to keep the wall bits as they are.
+        """
+        length = self.__length
+        cells = bytearray(length)
+        low = _LOW_BITS if table is None else _LOW_BITS.translate(table)
+        high = _HIGH_BITS if table is None else _HIGH_BITS.translate(table)
+        end = self.__offset + (length + 1) // 2
+        for start in range(self.__offset, end, _DECODE_CHUNK):
+            chunk = self.__data[start:min(start + _DECODE_CHUNK, end)]
+            first = 2 * (start - self.__offset)
+            stop = min(first + 2 * len(chunk), length)
+            cells[first:stop:2] = chunk.translate(low)
+            cells[first + 1:stop:2] = chunk.translate(high)[:(stop - first) // 2]
+        return cells
+
+    def packed(self):
+        """Returns the packed bytes."""
+        return bytes(self.__data[self.__offset:self.__offset + (self.__length + 1) // 2])
+
+
+class PackedWallGrid:
+    """
+    Read-only WallGrid backed by walls packed 4 bits per cell, usually a memory-mapped file.
+
+    It has the same attributes and read methods as WallGrid, so solvers and renderers can use
+    it directly, while the operating system pages the walls in only as they are touched. Opening
+    one allocates nothing per cell: the visited stamps are only created by the first
+    mark_visited.
+
+    Attributes
+    ----------
+    num_cols : int
+        Number of columns in the grid.
+    num_rows : int
+        Number of rows in the grid.
+    walls : PackedWalls
+        Wall bits of every cell, decoded on access.
+    stamps : bytearray
+        Epoch in which every cell was last visited. None until a cell is first marked visited.
+    epoch : int
+        Current epoch, from 1 to 255.
+    changes : int
+        Always 0, the walls can not change.
+    """
+
+    __slots__ = ("num_cols", "num_rows", "walls", "stamps", "epoch", "changes")
+
+    def __init__(self, num_cols, num_rows, data, offset=0):
+        """
+        Parameters
+        ----------
+        num_cols : int
+            Number of columns in the grid.
+        num_rows : int
+            Number of rows in the grid.
+        data : buffer
+            Buffer holding the packed walls, such as bytes or an mmap.
+        offset : int
+            Default: 0
+            Position of the first packed byte in data.
+        """
+        self.num_cols = num_cols
+        self.num_rows = num_rows
+        self.walls = PackedWalls(data, offset, num_cols * num_rows)
+        self.stamps = None
+        self.epoch = 1
+        self.changes = 0
+
+    __len__ = WallGrid.__len__
+    index = WallGrid.index
+    has_wall = WallGrid.has_wall
+
+    def is_visited(self, k):
+        """Returns True if cell k was visited in the current epoch."""
+        return self.stamps is not None and self.stamps[k] == self.epoch
+
+    def mark_visited(self, k):
+        """Marks cell k as visited in the current epoch, creating the stamps on first use."""
+        if self.stamps is None:
+            self.stamps = bytearray(len(self.walls))
+        self.stamps[k] = self.epoch
+
+    def unmark_visited(self, k):
+        """Marks cell k as not visited."""
+        if self.stamps is not None:
+            self.stamps[k] = 0
+
+    def visited_count(self):
+        """Returns the number of cells visited in the current epoch."""
+        return 0 if self.stamps is None else self.stamps.count(self.epoch)
+
+    def reset_visited(self):
+        """Resets the visited flag of every cell by moving on to the next epoch."""
+        if self.stamps is None:
+            self.epoch = self.epoch % 255 + 1
+            return
+        WallGrid.reset_visited(self)
+
+    def break_wall(self, i, j, wall):
+        """Packed grids are read-only."""
+        raise TypeError("packed wall grids are read-only")
+
+    def copy(self):
+        """Returns a writable WallGrid holding the same walls, unpacked into memory."""
+        return WallGrid.from_bytes(self.num_cols, self.num_rows, self.to_bytes())
+
+    def to_bytes(self):
+        """Returns the walls packed into 4 bits per cell."""
+        return self.walls.packed()
+
+
+# number of the LEFT, RIGHT, TOP and BOTTOM bits set in every byte: the degree of a cell when
+# translating NeighborIndex.passages, its number of walls when translating WallGrid.walls
+DEGREE = bytes(bin(bits & ALL_WALLS).count("1") for bits in range(256))
+
+
+class NeighborIndex:
+    """
+    Flat neighbour table of a finished grid, so solvers can step between cells without any
+    bounds checks or coordinate arithmetic.
+
+    Every cell gets one byte of open-passage bits, the walls it does not have, with openings
+    through the outer wall such as the entrance and exit closed. offsets maps each of the 16
+    possible bytes to the flat index offsets of the neighbours it opens onto, in left, right, up,
+    down order, so the open neighbours of cell k are k + offset for offset in
+    offsets[passages[k]]. Building it takes a few byte translations and one byte per cell.
+
+    Attributes
+    ----------
+    num_cols : int
+        Number of columns in the grid.
+    num_rows : int
+        Number of rows in the grid.
+    passages : bytearray
+        Open-passage bits of every cell.
+    offsets : list
+        Tuple of neighbour offsets for every combination of open-passage bits.
+
+    Methods
+    -------
+    neighbors(self, k)
+        Returns the flat indices of the cells reachable from cell k.
+    """
+
+    __slots__ = ("num_cols", "num_rows", "passages", "offsets")
+
+    def __init__(self, grid):
+        """
+        Parameters
+        ----------
+        grid : WallGrid Object
+            Grid to index, or a PackedWallGrid. Later changes to it are not reflected.
+        """
+        num_cols = grid.num_cols
+        num_rows = grid.num_rows
+        # PackedWalls decodes its nibbles straight into the passages
+        passages = grid.walls.translate(_OPEN)
+        # close the outer wall: first column, last column, top row and bottom row
+        for side, wall in (
+            (slice(0, num_rows), LEFT),
+            (slice(len(passages) - num_rows, None), RIGHT),
+            (slice(0, None, num_rows), TOP),
+            (slice(num_rows - 1, None, num_rows), BOTTOM),
+        ):
+            passages[side] = passages[side].translate(_CLOSE[wall])
+
+        steps = ((LEFT, -num_rows), (RIGHT, num_rows), (TOP, -1), (BOTTOM, 1))
+        self.num_cols = num_cols
+        self.num_rows = num_rows
+        self.passages = passages
+        self.offsets = [
+            tuple(offset for wall, offset in steps if bits & wall) for bits in range(ALL_WALLS + 1)
+        ]
+
+    def neighbors(self, k):
+        """Returns the flat indices of the cells reachable from cell k, left, right, up, down."""
+        return [k + offset for offset in self.offsets[self.passages[k]]]
+
+
+def save_grid(grid, path):
+    """
+    Writes a grid to a file: a 16 byte header followed by the walls packed 4 bits per cell.
+
+    Parameters
+    ----------
+    grid : WallGrid Object
+        Grid to save.
+    path : str
+        Path of the file to write.
+    """
+    with open(path, "wb") as file:
+        file.write(_HEADER.pack(MAGIC, VERSION, grid.num_cols, grid.num_rows))
+        file.write(grid.to_bytes())
+
+
+def load_grid(path):
+    """
+    Opens a grid written by save_grid without reading it into memory.
+
+    The file is memory-mapped read-only and the walls are decoded on access.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file to open.
+
+    Returns
+    -------
+    PackedWallGrid
+        Read-only grid backed by the file.
+    """
+    with open(path, "rb") as file:
+        data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    if len(data) < _HEADER.size:
+        raise ValueError(f"{path} is not a maze file")
+    magic, version, num_cols, num_rows = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a maze file")
+    if version != VERSION:
+        raise ValueError(f"{path} has unsupported maze file version {version}")
+    if len(data) != _HEADER.size + (num_cols * num_rows + 1) // 2:
+        raise ValueError(f"{path} is truncated")
+    return PackedWallGrid(num_cols, num_rows, data, _HEADER.size)
+
+
+class GridFileWriter:
+    """
+    Writes a maze file in the save_grid format piece by piece, for grids too large to hold in
+    memory.
+
+    The file is created at its full size and memory-mapped, and every write_column call packs
+    one run of cells into place, so only the run being written has to be in memory. Cells that
+    are never written read back with no walls at all.
+
+    Attributes
+    ----------
+    num_cols : int
+        Number of columns in the grid.
+    num_rows : int
+        Number of rows in the grid.
+
+    Methods
+    -------
+    write_column(self, i, j, walls)
+        Writes the walls of a run of cells down column i, starting at row j.
+    close(self)
+        Flushes the file to disk and closes it.
+    """
+
+    def __init__(self, path, num_cols, num_rows):
+        """
+        Parameters
+        ----------
+        path : str
+            Path of the file to write.
+        num_cols : int
+            Number of columns in the grid.
+        num_rows : int
+            Number of rows in the grid.
+        """
+        self.num_cols = num_cols
+        self.num_rows = num_rows
+        size = _HEADER.size + (num_cols * num_rows + 1) // 2
+        with open(path, "wb+") as file:
+            file.write(_HEADER.pack(MAGIC, VERSION, num_cols, num_rows))
+            file.truncate(size)
+            self.__data = mmap.mmap(file.fileno(), size)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def write_column(self, i, j, walls):
+        """
+        Writes the walls of a run of cells down column i, starting at row j.
+
+        Parameters
+        ----------
+        i : int
+            Column of the cells.
+        j : int
+            Row of the first cell.
+        walls : bytes
+            Wall bits of each cell of the run.
+        """
+        data = self.__data
+        k = i * self.num_rows + j
+        if k & 1:
+            # the first cell shares its byte with the cell above it
+            at = _HEADER.size + k // 2
+            data[at] = (data[at] & 0x0F) | (walls[0] << 4)
+            walls = walls[1:]
+            k += 1
+        even = len(walls) & ~1
+        at = _HEADER.size + k // 2
+        data[at:at + even // 2] = pack_walls(walls[:even])
+        if even < len(walls):
+            # and the last cell with the cell below it
+            at += even // 2
+            data[at] = (data[at] & 0xF0) | walls[-1]
+
+    def close(self):
+        """Flushes the file to disk and closes it."""
+        if not self.__data.closed:
+            self.__data.flush()
+            self.__data.close()
+
+
+class CellView:
+    """
+    A lightweight, Cell-compatible view of one cell of a WallGrid.
+
+    Reading or assigning has_left_wall, has_right_wall, has_top_wall, has_bottom_wall or visited
+    reads or writes the underlying grid directly. draw and draw_move go through the renderer of
+    the maze, if it has a window.
+
+    Methods
+    -------
+    draw(self, x1=None, y1=None, x2=None, y2=None)
+        Redraws the walls of the cell from the grid.
+    draw_move(self, to_cell, undo=False)
+        Draws a line between the center of 2 cells as a Path.
+    """
+
+    __slots__ = ("_grid", "_index", "_renderer", "__weakref__")
+
+    def __init__(self, grid, index, renderer=None):
+        """
+        Parameters
+        ----------
+        grid : WallGrid Object
+            Grid that holds the cell.
+        index : int
+            Flat index of the cell in the grid.
+        renderer : MazeRenderer Object
+            Default: None
+            Renderer drawing the grid. None when running headless.
+        """
+        self._grid = grid
+        self._index = index
+        self._renderer = renderer
+
+    def _get_wall(self, wall):
+        return bool(self._grid.walls[self._index] & wall)
+
+    def _set_wall(self, wall, value):
+        self._grid.changes += 1
+        if value:
+            self._grid.walls[self._index] |= wall
+        else:
+            self._grid.walls[self._index] &= ~wall
+
+    has_left_wall = property(
+        lambda self: self._get_wall(LEFT), lambda self, value: self._set_wall(LEFT, value)
+    )
+    has_right_wall = property(
+        lambda self: self._get_wall(RIGHT), lambda self, value: self._set_wall(RIGHT, value)
+    )
+    has_top_wall = property(
+        lambda self: self._get_wall(TOP), lambda self, value: self._set_wall(TOP, value)
+    )
+    has_bottom_wall = property(
+        lambda self: self._get_wall(BOTTOM), lambda self, value: self._set_wall(BOTTOM, value)
+    )
+
+    @property
+    def visited(self):
+        return self._grid.is_visited(self._index)
+
+    @visited.setter
+    def visited(self, value):
+        if value:
+            self._grid.mark_visited(self._index)
+        else:
+            self._grid.unmark_visited(self._index)
+
+    def draw(self, x1=None, y1=None, x2=None, y2=None):
+        """
+        Redraws the walls of the cell from the grid, for example after they were assigned.
+
+        The coordinates are accepted for compatibility with Cell.draw and ignored: the renderer
+        places every cell by its position in the maze.
+        """
+        if self._renderer is None:
+            return
+
+        i, j = divmod(self._index, self._grid.num_rows)
+        for wall in (LEFT, RIGHT, TOP, BOTTOM):
+            self._renderer.update_wall(i, j, wall)
+
+    def draw_move(self, to_cell, undo=False):
+        """
+        Draws a line between the center of 2 cells as a Path.
+
+        Parameters
+        ----------
+        to_cell : CellView Object
+            Cell of the same grid on where to move to.
+        undo : bool
+            Identifier for backtracking. Change line fill_color.
+        """
+        if self._renderer is None:
+            return
+
+        num_rows = self._grid.num_rows
+        self._renderer.draw_move(
+            divmod(self._index, num_rows), divmod(to_cell._index, num_rows), undo
+        )
+
+
+def _position(index, length, name):
+    """Turns an index into a position in range(length), counting negative ones from the end."""
+    index = operator.index(index)
+    if index < 0:
+        index += length
+    if not 0 <= index < length:
+        raise IndexError(f"{name} index out of range")
+    return index
+
+
+class CellGrid:
+    """
+    Lazy 2-dimensional view of the cells of a WallGrid, indexed as cells[i][j] like a list of
+    columns of Cell objects.
+
+    Nothing is allocated up front: cells[i] is a light CellColumn, and a CellView is only
+    created when a cell is accessed. Views are kept in a weak cache, so a cell that is still
+    referenced somewhere comes back as the same object, while bulk code that touches every cell
+    once leaves nothing behind.
+
+    Attributes
+    ----------
+    grid : WallGrid Object
+        Grid that holds the cells.
+    renderer : MazeRenderer Object
+        Renderer the views draw through. None when running headless.
+
+    Methods
+    -------
+    cell(self, k)
+        Returns the CellView of the cell at flat index k.
+    """
+
+    __slots__ = ("grid", "renderer", "__views")
+
+    def __init__(self, grid, renderer=None):
+        """
+        Parameters
+        ----------
+        grid : WallGrid Object
+            Grid that holds the cells.
+        renderer : MazeRenderer Object
+            Default: None
+            Renderer the views draw through. None when running headless.
+        """
+        self.grid = grid
+        self.renderer = renderer
+        self.__views = weakref.WeakValueDictionary()
+
+    def __len__(self):
+        return self.grid.num_cols
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [CellColumn(self, n) for n in range(*i.indices(self.grid.num_cols))]
+        return CellColumn(self, _position(i, self.grid.num_cols, "column"))
+
+    def __iter__(self):
+        for i in range(self.grid.num_cols):
+            yield CellColumn(self, i)
+
+    def cell(self, k):
+        """Returns the CellView of the cell at flat index k, reusing a live one."""
+        view = self.__views.get(k)
+        if view is None:
+            view = CellView(self.grid, k, self.renderer)
+            self.__views[k] = view
+        return view
+
+
+class CellColumn:
+    """One column of a CellGrid, indexed by row. Creates its CellView objects on access."""
+
+    __slots__ = ("__cells", "__start")
+
+    def __init__(self, cells, i):
+        """
+        Parameters
+        ----------
+        cells : CellGrid Object
+            Grid view the column belongs to.
+        i : int
+            Column number.
+        """
+        self.__cells = cells
+        self.__start = i * cells.grid.num_rows
+
+    def __len__(self):
+        return self.__cells.grid.num_rows
+
+    def __getitem__(self, j):
+        num_rows = self.__cells.grid.num_rows
+        if isinstance(j, slice):
+            return [self.__cells.cell(self.__start + n) for n in range(*j.indices(num_rows))]
+        return self.__cells.cell(self.__start + _position(j, num_rows, "row"))
+
+    def __iter__(self):
+        cell = self.__cells.cell
+        for k in range(self.__start, self.__start + self.__cells.grid.num_rows):
+            yield cell(k)
@@ -3,39 +3,102 @@
     File name           : main.py
     Author              : Derryn Edwards
     Date Created        : 2023/08/12
-    Date Last Modified  : 2023/08/12
+    Date Last Modified  : 2026/10/18
     Python Version      : 3.11
 """
 # ==================================================================================================
 # IMPORTS
 # ==================================================================================================
-import sys
+import argparse
+import asyncio
 from graphics import Window
 from maze import Maze
+from solvers import SOLVERS
+from stats import MazeStats
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Generate and solve a maze.")
+    parser.add_argument("--rows", type=int, default=12, help="Number of rows (default: 12).")
+    parser.add_argument("--cols", type=int, default=16, help="Number of columns (default: 16).")
+    parser.add_argument("--seed", type=int, default=None, help="Seed used for random generator.")
+    parser.add_argument(
+        "--algorithm", choices=sorted(SOLVERS), default="dfs", help="Solver to use (default: dfs)."
+    )
+    parser.add_argument(
+        "--delay", type=float, default=0.05,
+        help="Seconds to wait after every redraw, 0 for none (default: 0.05)."
+    )
+    parser.add_argument(
+        "--steps-per-frame", type=int, default=1,
+        help="Drawing steps batched into one redraw (default: 1)."
+    )
+    parser.add_argument(
+        "--async", dest="use_async", action="store_true",
+        help="Animate from an asyncio event loop instead of sleeping between frames."
+    )
+    parser.add_argument(
+        "--headless", action="store_true", help="Generate and solve without opening a window."
+    )
+    parser.add_argument(
+        "--stats", action="store_true", help="Print counters and phase timings when done."
+    )
+    parser.add_argument(
+        "--image", default=None,
+        help="Write the solved maze to this PNG or PPM file, without needing a display."
+    )
+    return parser.parse_args()
+
+
+async def animate_async(maze, algorithm):
+    """Generates and solves a maze created with generate=False on an asyncio event loop."""
+    await maze.generate_async()
+    print("Maze created")
+    return await maze.solve_async(algorithm)
 
 
 def main():
-    num_rows = 12
-    num_cols = 16
+    args = parse_args()
+    num_rows = args.rows
+    num_cols = args.cols
     margin = 50
     screen_x = 800
     screen_y = 600
     cell_size_x = (screen_x - 2 * margin) / num_cols
     cell_size_y = (screen_y - 2 * margin) / num_rows
 
-    sys.setrecursionlimit(10000)
-    win = Window(screen_x, screen_y)
+    win = None
+    if not args.headless:
+        win = Window(screen_x, screen_y)
 
-    maze = Maze(margin, margin, num_rows, num_cols, cell_size_x, cell_size_y, win)
-    print("Maze created")
-    is_solveable = maze.solve()
+    stats = MazeStats() if args.stats else None
+    maze = Maze(
+        margin, margin, num_rows, num_cols, cell_size_x, cell_size_y, win, args.seed,
+        animation_delay=args.delay, steps_per_frame=args.steps_per_frame, stats=stats,
+        generate=not args.use_async
+    )
+    if args.use_async:
+        is_solveable = asyncio.run(animate_async(maze, args.algorithm))
+    else:
+        print("Maze created")
+        is_solveable = maze.solve(args.algorithm)
 
     if not is_solveable:
         print("maze can not be solved!")
     else:
-        print("maze solved!")
+        print(f"maze solved! path length {len(is_solveable)}, "
+              f"{is_solveable.expanded} cells expanded")
+
+    if args.image:
+        maze.save_image(args.image, solution=is_solveable)
+        print(f"image written to {args.image}")
+
+    if stats is not None:
+        for phase, seconds in stats.timings.items():
+            print(f"{phase:>10}: {seconds:.4f}s {stats.counters.get(phase, {})}")
 
-    win.wait_for_close()
+    if win is not None:
+        win.wait_for_close()
 
 
 if __name__ == '__main__':
@@ -3,21 +3,34 @@
     File name           : maze.py
     Author              : Derryn Edwards
     Date Created        : 2023/08/12
-    Date Last Modified  : 2023/08/12
+    Date Last Modified  : 2026/10/18
     Python Version      : 3.11
 """
 # ==================================================================================================
 # IMPORTS
 # ==================================================================================================
-from cell import Cell
+from generators import carve_backtracker, get_generator, iter_backtracker, iter_walls
+from graphics import MazeRenderer
+from raster import render_grid, save_image
+from grid import WallGrid, CellGrid, load_grid, save_grid, ALL_WALLS, TOP, BOTTOM, STEPS
+from solvers import PathIndex, get_solver, iter_solve, UNDO
+import asyncio
 import time
 import random
+import warnings
+
+# headless async runs hand control back to the event loop once every this many events
+_ASYNC_BATCH = 1024
 
 
 class Maze:
     """
     Holds all the cells in the maze in a 2-dimensional grid.
 
+    The walls are always carved, solved and drawn from a compact WallGrid, the only copy of
+    them. get_cells() returns a lazy grid.CellGrid whose CellView objects read and write that
+    grid directly, so a wall changed through a cell is seen by the solvers.
+
     Attributes
     ----------
     __x1 : int
@@ -34,31 +47,98 @@ class Maze:
         Height of each cell.
     __win : Window object
         Default: None
-        Instance of Window class.
+        Instance of Window class. None runs the maze headless.
+    __animation_delay : float
+        Seconds to sleep after every redraw of the window.
+    __steps_per_frame : int
+        Number of drawing steps batched into a single redraw of the window.
+    __pending_steps : int
+        Drawing steps since the last redraw.
+    __frames : int
+        Number of redraws so far.
+    __scheduled : bool
+        True while an asyncio driver paces the frames instead of time.sleep.
+    __rng : random.Random object
+        Random generator owned by this maze.
+    __grid : WallGrid object
+        Wall bits and visited flags of every cell.
+    __cells : CellGrid object
+        Lazy view of the cells of __grid. None until get_cells() is first called.
+    __renderer : MazeRenderer object
+        Draws the grid on __win. None when running headless.
+    __stats : MazeStats object
+        Counters, timers and hooks of this maze. None when not profiling.
+    __paths : PathIndex object
+        Shortest path index of the grid, built on the first query. None until then.
+    __paths_changes : int
+        Wall changes of the grid when __paths was built.
 
     Methods
     -------
-    __create_cells(self)
-        Creates the cells of the maze in a 2-dimensional grid.
-    __draw_cell(self, i, j)
-        Method that draws the cells on the Maze.
-    __animate(self)
+    __create_cells(self, grid=None)
+        Creates the wall grid. Cell views are left to get_cells().
+    __draw_wall(self, i, j, wall)
+        Queues a redraw of a wall of cell (i, j) after it was broken. Only called when there is a
+        window.
+    __animate(self, flush=False)
         Allows to visualize what algorithms are doing in real time.
     __break_entrance_and_exit(self)
         Breaks wall on entrance and exit of maze.
-    __break_walls_r(self, i, j)
-        Recursive method that breaks walls in a breadth-first traversal.
+    __generate(self, report)
+        Generator carving the maze, timed as the "generate" phase.
+    __carve(self, report)
+        Body of __generate.
+    __break_walls_r(self, i, j, report=False)
+        Generator breaking walls in a depth-first traversal using an explicit stack.
+    __break_walls(self, events, report, apply=False)
+        Generator passing broken walls on to the break hooks and the window.
     __reset_cells_visited(self)
         Resets all cells visited attribute to False.
-    __solve_r(self, i, j)
-        Recursive method that attempts to solve the maze.
-    solve(self)
-        Calls __solve_r method. Returns True if successful, otherwise False.
+    __draw_move(self, from_ij, to_ij, undo)
+        Queues a solver move between two cells and animates it.
+    __run_solver(self, solver, goal, on_move)
+        Runs a solver from the entrance to goal and flushes the animation of its moves.
+    __iter_solve_timed(self, algorithm)
+        Runs __iter_solve as the "solve" phase of the stats.
+    __iter_solve(self, algorithm)
+        Body of iter_solve.
+    __path_index(self)
+        Returns the PathIndex of the grid, rebuilding it after a wall changed.
+    solve(self, algorithm="dfs")
+        Solves the maze with the chosen solver and returns a SolveResult.
+    shortest_path(self, src, dst)
+        Returns the shortest path between any two cells as a SolveResult.
+    distance(self, src, dst)
+        Returns the number of steps on the shortest path between any two cells.
+    iter_generate(self)
+        Carves a maze created with generate=False, yielding an event per broken wall.
+    iter_solve(self, algorithm="dfs")
+        Solves the maze, yielding an event per solver move.
+    generate_async(self)
+        Carves a maze created with generate=False as an asyncio coroutine.
+    solve_async(self, algorithm="dfs")
+        Solves the maze as an asyncio coroutine and returns a SolveResult.
+    __run_async(self, events)
+        Drives an event generator, awaiting the animation delay after every frame.
+    save(self, path)
+        Saves the walls of the maze to a file, packed 4 bits per cell.
+    save_image(self, path, cell_size=4, solution=None, line_width=1)
+        Renders the maze offscreen and writes it to a PNG or PPM file.
+    load(cls, path, ...)
+        Opens a maze written by save, memory-mapped and read-only.
+    get_grid(self)
+        Returns the WallGrid holding the walls of the maze.
+    get_stats(self)
+        Returns the MazeStats collecting counters and timings, or None.
     get_cells(self)
-        Returns __cells attribute.
+        Returns the cells as a 2-dimensional sequence of CellView objects.
     """
 
-    def __init__(self, x1, y1, num_rows, num_cols, cell_size_x, cell_size_y, win=None, seed=None):
+    def __init__(
+            self, x1, y1, num_rows, num_cols, cell_size_x, cell_size_y, win=None, seed=None,
+            storage=None, animation_delay=0.05, steps_per_frame=1, generator="backtracker",
+            rng=None, grid=None, stats=None, generate=True
+    ):
         """
         Parameters
         ----------
@@ -76,12 +156,60 @@ class Maze:
             Height of each cell.
         win : Window object
             Default: None
-            Instance of Window class.
+            Instance of Window class. Without a window the maze runs headless: no drawing or
+            animation code is called at all and generation and solving run at full speed.
         seed : int
             Default: None
-            Seed used for random generator.
+            Seed used for the random generator of this maze. The global random module is never
+            touched, so mazes can be built concurrently from several threads.
+        storage : str
+            Default: None
+            Deprecated and ignored. The maze always keeps only the wall grid and get_cells()
+            always returns CellView objects; passing "cells" or "compact" only warns.
+        animation_delay : float
+            Default: 0.05
+            Seconds to sleep after every redraw of the window. 0 disables the delay.
+        steps_per_frame : int
+            Default: 1
+            Number of drawing steps batched into a single redraw of the window.
+        generator : str
+            Default: "backtracker"
+            "backtracker" carves the maze cell by cell with __break_walls_r. Any other name is
+            looked up in generators.GENERATORS, such as the NumPy based "sidewinder" or
+            "binary_tree", which build the whole grid at once.
+        rng : random.Random Object
+            Default: None
+            Source of randomness for the backtracker; anything with a randrange method, such
+            as generators.BulkRandom. Defaults to random.Random(seed).
+        grid : WallGrid Object
+            Default: None
+            Finished maze to use as is, for example one returned by grid.load_grid. Generation
+            and breaking the entrance and exit are skipped; its size must match num_rows and
+            num_cols.
+        stats : MazeStats Object
+            Default: None
+            Collects counters and phase timings of generation, solving and redrawing, and calls
+            its hooks. None skips all bookkeeping.
+        generate : bool
+            Default: True
+            Carve the maze right away. With False every wall is left standing until the maze
+            is carved step by step through iter_generate().
         """
-        self.__cells = []
+        if storage is not None:
+            warnings.warn(
+                "the storage argument of Maze is deprecated and has no effect",
+                DeprecationWarning, stacklevel=2
+            )
+        if steps_per_frame < 1:
+            raise ValueError("steps_per_frame must be at least 1")
+        if grid is not None and (grid.num_cols, grid.num_rows) != (num_cols, num_rows):
+            raise ValueError(
+                f"grid is {grid.num_cols}x{grid.num_rows}, expected {num_cols}x{num_rows}"
+            )
+
+        self.__cells = None
+        self.__grid = None
+        self.__renderer = None
         self.__x1 = x1
         self.__y1 = y1
         self.__num_rows = num_rows
@@ -89,29 +217,95 @@ class Maze:
         self.__cell_size_x = cell_size_x
         self.__cell_size_y = cell_size_y
         self.__win = win
+        self.__animation_delay = animation_delay
+        self.__steps_per_frame = steps_per_frame
+        self.__pending_steps = 0
+        self.__frames = 0
+        self.__scheduled = False
+
+        self.__rng = random.Random(seed) if rng is None else rng
+        self.__stats = stats
+        self.__paths = None
+        self.__paths_changes = None
+        self.__seed = seed
+        self.__generator = generator
+        if generator != "backtracker":
+            get_generator(generator)
+        self.__generated = grid is not None or generate
+
+        if grid is not None:
+            self.__create_cells(grid)
+        elif generate:
+            next(self.__generate(False), None)
+        else:
+            self.__create_cells()
+
+    def __generate(self, report):
+        """
+        Generator carving the maze with the chosen generator, timed as the "generate" phase.
 
-        if seed:
-            random.seed(seed)
+        Parameters
+        ----------
+        report : bool
+            Yield (i, j, wall) for every broken wall and carve the existing grid. While False
+            the cells are created here and nothing is yielded.
+        """
+        if self.__stats is None:
+            yield from self.__carve(report)
+            return
+
+        with self.__stats.phase("generate"):
+            yield from self.__carve(report)
 
-        self.__create_cells()
+    def __carve(self, report):
+        """Body of __generate."""
+        carved = None
+        if self.__generator != "backtracker":
+            carved = get_generator(self.__generator)(self.__num_cols, self.__num_rows, self.__seed)
+
+        if not report:
+            self.__create_cells(carved)
         self.__break_entrance_and_exit()
-        self.__break_walls_r(0, 0)
+        if report:
+            yield 0, 0, TOP
+            yield self.__num_cols - 1, self.__num_rows - 1, BOTTOM
+
+        if carved is None:
+            yield from self.__break_walls_r(0, 0, report)
+        elif report:
+            # replay the finished grid one wall at a time
+            yield from self.__break_walls(iter_walls(carved), report, apply=True)
+
+        if self.__stats is not None:
+            self.__stats.count_grid("generate", self.__grid)
         self.__reset_cells_visited()
+        self.__paths = None
 
-    def __create_cells(self):
-        """Creates the cells of the maze in a 2-dimensional grid."""
-        for i in range(self.__num_cols):
-            col_cells = []
-            for j in range(self.__num_rows):
-                col_cells.append(Cell(self.__win))
-            self.__cells.append(col_cells)
-        for i in range(self.__num_cols):
-            for j in range(self.__num_rows):
-                self.__draw_cell(i, j)
+    def __create_cells(self, grid=None):
+        """
+        Creates the wall grid. Cell views are left to get_cells().
 
-    def __draw_cell(self, i, j):
+        Parameters
+        ----------
+        grid : WallGrid Object
+            Default: None
+            Already generated grid to use instead of a new grid with every wall standing.
         """
-        Method that draws the cells on the Maze.
+        self.__grid = WallGrid(self.__num_cols, self.__num_rows) if grid is None else grid
+        self.__cells = None
+        if self.__win is None:
+            return
+
+        self.__renderer = MazeRenderer(
+            self.__win, self.__grid, self.__x1, self.__y1, self.__cell_size_x, self.__cell_size_y
+        )
+        self.__renderer.draw_walls()
+        self.__animate(flush=True)
+
+    def __draw_wall(self, i, j, wall):
+        """
+        Queues a redraw of a wall of cell (i, j) after it was broken. Only called when there is a
+        window.
 
         Parameters
         ----------
@@ -119,159 +313,444 @@ class Maze:
             Columns
         j: int
             Rows
+        wall: int
+            One of LEFT, RIGHT, TOP or BOTTOM.
         """
-        if self.__win is None:
-            return self
-
-        x1 = self.__x1 + i * self.__cell_size_x
-        y1 = self.__y1 + j * self.__cell_size_y
-        x2 = x1 + self.__cell_size_x
-        y2 = y1 + self.__cell_size_y
-        self.__cells[i][j].draw(x1, y1, x2, y2)
+        self.__renderer.queue_wall(i, j, wall)
         self.__animate()
 
-    def __animate(self):
-        """Allows to visualize what algorithms are doing in real time."""
-        if self.__win is None:
+    def __animate(self, flush=False):
+        """
+        Allows to visualize what algorithms are doing in real time.
+
+        The window is only redrawn once every steps_per_frame calls, followed by the configured
+        animation_delay. Wall changes and moves queued since the last frame are applied to the
+        canvas in one batch right before the redraw. While an asyncio driver runs, the delay is
+        awaited by the driver instead of slept here.
+
+        Parameters
+        ----------
+        flush : bool
+            Default: False
+            Redraw immediately, regardless of the number of pending steps.
+        """
+        self.__pending_steps += 1
+        if not flush and self.__pending_steps < self.__steps_per_frame:
             return
 
-        self.__win.redraw()
-        time.sleep(0.05)
+        self.__pending_steps = 0
+        self.__frames += 1
+        self.__renderer.flush()
+        sleep = self.__animation_delay > 0 and not self.__scheduled
+        if self.__stats is None:
+            self.__win.redraw()
+            if sleep:
+                time.sleep(self.__animation_delay)
+            return
+
+        with self.__stats.phase("redraw"):
+            self.__win.redraw()
+            if sleep:
+                time.sleep(self.__animation_delay)
+        self.__stats.count("redraw", "redraws")
+        self.__stats.emit("redraw")
 
     def __break_entrance_and_exit(self):
         """Breaks wall on entrance and exit of maze."""
-        self.__cells[0][0].has_top_wall = False
-        self.__draw_cell(0, 0)
-        self.__cells[self.__num_cols - 1][self.__num_rows - 1].has_bottom_wall = False
-        self.__draw_cell(self.__num_cols - 1, self.__num_rows - 1)
+        self.__grid.break_wall(0, 0, TOP)
+        self.__grid.break_wall(self.__num_cols - 1, self.__num_rows - 1, BOTTOM)
+        if self.__win is None:
+            return
 
-    def __break_walls_r(self, i, j):
-        """Recursive method that breaks walls in a breadth-first traversal."""
-        self.__cells[i][j].visited = True
+        self.__draw_wall(0, 0, TOP)
+        self.__draw_wall(self.__num_cols - 1, self.__num_rows - 1, BOTTOM)
 
-        while True:
-            next_index_list = []
-            possible_direction_indices = 0
-
-            # check left
-            if i > 0 and not self.__cells[i - 1][j].visited:
-                next_index_list.append((i - 1, j))
-                possible_direction_indices += 1
-            # check right
-            if i < self.__num_cols - 1 and not self.__cells[i + 1][j].visited:
-                next_index_list.append((i + 1, j))
-                possible_direction_indices += 1
-            # check up
-            if j > 0 and not self.__cells[i][j - 1].visited:
-                next_index_list.append((i, j - 1))
-                possible_direction_indices += 1
-            # check down
-            if j < self.__num_rows - 1 and not self.__cells[i][j + 1].visited:
-                next_index_list.append((i, j + 1))
-                possible_direction_indices += 1
-
-            # if nowhere to go, break wall
-            if possible_direction_indices == 0:
-                self.__draw_cell(i, j)
-                return
-
-            # randomly choose the next direction to go
-            direction_index = random.randrange(possible_direction_indices)
-            next_index = next_index_list[direction_index]
-
-            # break walls between this cell and the next cell(s)
-            # right
-            if next_index[0] == i + 1:
-                self.__cells[i][j].has_right_wall = False
-                self.__cells[i + 1][j].has_left_wall = False
-            # left
-            if next_index[0] == i - 1:
-                self.__cells[i][j].has_left_wall = False
-                self.__cells[i - 1][j].has_right_wall = False
-            # down
-            if next_index[1] == j + 1:
-                self.__cells[i][j].has_bottom_wall = False
-                self.__cells[i][j + 1].has_top_wall = False
-            # up
-            if next_index[1] == j - 1:
-                self.__cells[i][j].has_top_wall = False
-                self.__cells[i][j - 1].has_bottom_wall = False
-
-            # recursively visit the next cell
-            self.__break_walls_r(next_index[0], next_index[1])
+    def __break_walls_r(self, i, j, report=False):
+        """
+        Generator breaking walls in a depth-first traversal starting at cell (i, j).
+
+        The traversal itself is generators.carve_backtracker, which keeps its own stack instead
+        of recursing, so the size of the maze is not limited by the interpreter recursion limit.
+        Headless and without break hooks it runs without yielding at all.
+
+        Parameters
+        ----------
+        i: int
+            Column of the starting cell.
+        j: int
+            Row of the starting cell.
+        report : bool
+            Default: False
+            Yield (i, j, wall) for every broken wall.
+        """
+        hooked = self.__stats is not None and self.__stats.has_hooks("break")
+        if not report and not hooked and self.__win is None:
+            carve_backtracker(self.__grid, i, j, self.__rng)
+            return
+
+        yield from self.__break_walls(iter_backtracker(self.__grid, i, j, self.__rng), report)
+
+    def __break_walls(self, events, report, apply=False):
+        """
+        Generator passing broken walls on to the break hooks and the window.
+
+        Parameters
+        ----------
+        events : iterable
+            (i, j, wall) of every broken wall.
+        report : bool
+            Yield every event after handling it.
+        apply : bool
+            Default: False
+            Break the walls in the grid, for events that have not been carved yet.
+        """
+        emit = None
+        if self.__stats is not None and self.__stats.has_hooks("break"):
+            emit = self.__stats.emit
+        grid = self.__grid
+        for event in events:
+            if apply:
+                grid.break_wall(*event)
+            if emit is not None:
+                emit("break", *event)
+            if self.__win is not None:
+                self.__draw_wall(*event)
+            if report:
+                yield event
+
+        if self.__win is not None:
+            self.__animate(flush=True)
 
     def __reset_cells_visited(self):
-        """Resets all cells visited attribute to False."""
-        for col in self.__cells:
-            for cell in col:
-                cell.visited = False
+        """
+        Resets all cells visited attribute to False in O(1) by starting a new epoch of the grid.
 
-    def __solve_r(self, i, j):
-        """Recursive method that attempts to solve the maze."""
+        Cell views read the visited flags from the grid, so they need no sweep of their own.
+        """
+        self.__grid.reset_visited()
+
+    def __draw_move(self, from_ij, to_ij, undo):
+        """
+        Queues a solver move between two cells and animates it.
+
+        Parameters
+        ----------
+        from_ij : tuple
+            (i, j) coordinates of the cell the move starts from.
+        to_ij : tuple
+            (i, j) coordinates of the cell the move goes to.
+        undo : bool
+            Identifier for backtracking. Changes the line color.
+        """
+        self.__renderer.queue_move(from_ij, to_ij, undo)
         self.__animate()
 
-        # visit current cell
-        self.__cells[i][j].visited = True
-
-        # if at end cell, maze is solved!
-        if i == self.__num_cols - 1 and j == self.__num_rows - 1:
-            return True
-
-        # move left if no wall and not visited
-        if (
-                i > 0
-                and not self.__cells[i][j].has_left_wall
-                and not self.__cells[i - 1][j].visited
-        ):
-            self.__cells[i][j].draw_move(self.__cells[i - 1][j])
-            if self.__solve_r(i - 1, j):
-                return True
-            else:
-                self.__cells[i][j].draw_move(self.__cells[i - 1][j], True)
-
-        # move right if no wall and not visited
-        if (
-                i < self.__num_cols - 1
-                and not self.__cells[i][j].has_right_wall
-                and not self.__cells[i + 1][j].visited
-        ):
-            self.__cells[i][j].draw_move(self.__cells[i + 1][j])
-            if self.__solve_r(i + 1, j):
-                return True
-            else:
-                self.__cells[i][j].draw_move(self.__cells[i + 1][j], True)
-
-        # move up if no wall and not visited
-        if (
-                j > 0
-                and not self.__cells[i][j].has_top_wall
-                and not self.__cells[i][j - 1].visited
-        ):
-            self.__cells[i][j].draw_move(self.__cells[i][j - 1])
-            if self.__solve_r(i, j - 1):
-                return True
-            else:
-                self.__cells[i][j].draw_move(self.__cells[i][j - 1], True)
-
-        # move down if no wall and not visited
-        if (
-                j < self.__num_rows - 1
-                and not self.__cells[i][j].has_bottom_wall
-                and not self.__cells[i][j + 1].visited
-        ):
-            self.__cells[i][j].draw_move(self.__cells[i][j + 1])
-            if self.__solve_r(i, j + 1):
-                return True
-            else:
-                self.__cells[i][j].draw_move(self.__cells[i][j + 1], True)
-
-        # went wrong way; return False
-        return False
-
-    def solve(self):
-        """Calls __solve_r method. Returns True if successful, otherwise False."""
-        return self.__solve_r(0, 0)
+    def solve(self, algorithm="dfs"):
+        """
+        Solves the maze from the top-left entrance to the bottom-right exit.
+
+        Parameters
+        ----------
+        algorithm : str
+            Default: "dfs"
+            Name of a solver registered in solvers.SOLVERS, such as "dfs", "bfs", "astar" or
+            "bidirectional".
+
+        Returns
+        -------
+        SolveResult
+            Path from entrance to exit and the number of expanded cells. Truthy if solved.
+        """
+        solver = get_solver(algorithm)
+        goal = (self.__num_cols - 1, self.__num_rows - 1)
+        draw_move = None if self.__win is None else self.__draw_move
+        if self.__stats is None:
+            return self.__run_solver(solver, goal, draw_move)
+
+        with self.__stats.phase("solve"):
+            result = self.__run_solver(solver, goal, self.__stats.track_moves("solve", draw_move))
+        self.__stats.count("solve", "cells_visited", result.expanded)
+        return result
+
+    def shortest_path(self, src, dst):
+        """
+        Returns the shortest path between any two cells.
+
+        The first query builds a solvers.PathIndex of the grid; every later query reuses it and
+        costs O(log n) plus the length of the path, without touching the cells or needing a
+        reset in between. Queries are not animated.
+
+        Parameters
+        ----------
+        src : tuple
+            (i, j) coordinates of the starting cell.
+        dst : tuple
+            (i, j) coordinates of the goal cell.
+
+        Returns
+        -------
+        SolveResult
+            Path from src to dst. Truthy if dst can be reached.
+
+        Raises
+        ------
+        ValueError
+            If src or dst lies outside the maze.
+        """
+        return self.__path_index().shortest_path(src, dst)
+
+    def distance(self, src, dst):
+        """
+        Returns the number of steps on the shortest path between any two cells in O(log n), or
+        None if dst can not be reached. Shares the index of shortest_path.
+
+        Parameters
+        ----------
+        src : tuple
+            (i, j) coordinates of the starting cell.
+        dst : tuple
+            (i, j) coordinates of the goal cell.
+        """
+        return self.__path_index().distance(src, dst)
+
+    def __path_index(self):
+        """
+        Returns the PathIndex of the grid, building it on first use and rebuilding it after a
+        wall changed.
+        """
+        if self.__paths is None or self.__paths_changes != self.__grid.changes:
+            self.__paths = PathIndex(self.__grid)
+            self.__paths_changes = self.__grid.changes
+        return self.__paths
+
+    def iter_generate(self):
+        """
+        Carves a maze created with generate=False step by step.
+
+        Returns a generator yielding a compact (i, j, wall) event for every wall it breaks,
+        starting with the entrance and exit. Nothing is buffered: the consumer can stream the
+        events, pause between them or stop early, leaving the maze partially carved. A window,
+        if any, is animated as the events are produced.
+
+        Raises
+        ------
+        RuntimeError
+            If the maze was already generated.
+        """
+        if self.__generated:
+            raise RuntimeError("maze is already generated")
+        self.__generated = True
+        return self.__generate(True)
+
+    def iter_solve(self, algorithm="dfs"):
+        """
+        Solves the maze step by step.
+
+        Returns a generator yielding a compact (i, j, move) event for every solver move: the
+        solver moved from cell (i, j) through the wall given by move, with solvers.UNDO OR'd in
+        when it backtracks. The SolveResult is the return value of the generator.
+
+        Parameters
+        ----------
+        algorithm : str
+            Default: "dfs"
+            Name of a solver registered in solvers.SOLVERS.
+        """
+        get_solver(algorithm)
+        if self.__stats is None:
+            return self.__iter_solve(algorithm)
+        return self.__iter_solve_timed(algorithm)
+
+    async def generate_async(self):
+        """
+        Carves a maze created with generate=False without blocking the asyncio event loop.
+
+        Every frame is followed by an awaited animation_delay rather than a time.sleep, so
+        other tasks on the loop run between frames. Without a window the loop gets control back
+        every few thousand broken walls.
+
+        Raises
+        ------
+        RuntimeError
+            If the maze was already generated.
+        """
+        await self.__run_async(self.iter_generate())
+
+    async def solve_async(self, algorithm="dfs"):
+        """
+        Solves the maze without blocking the asyncio event loop, pacing the animation like
+        generate_async.
+
+        Parameters
+        ----------
+        algorithm : str
+            Default: "dfs"
+            Name of a solver registered in solvers.SOLVERS.
+
+        Returns
+        -------
+        SolveResult
+            Path from entrance to exit and the number of expanded cells. Truthy if solved.
+        """
+        return await self.__run_async(self.iter_solve(algorithm))
+
+    async def __run_async(self, events):
+        """
+        Drives an event generator of iter_generate or iter_solve to the end and returns its
+        return value. Frame pacing comes from the event loop: after every redraw the driver
+        awaits animation_delay.
+        """
+        self.__scheduled = True
+        try:
+            frames = self.__frames
+            steps = 0
+            while True:
+                try:
+                    next(events)
+                except StopIteration as stop:
+                    return stop.value
+                steps += 1
+                if self.__frames != frames:
+                    frames = self.__frames
+                    await asyncio.sleep(self.__animation_delay)
+                elif steps % _ASYNC_BATCH == 0:
+                    await asyncio.sleep(0)
+        finally:
+            self.__scheduled = False
+
+    def __iter_solve_timed(self, algorithm):
+        """Runs __iter_solve as the "solve" phase of the stats."""
+        with self.__stats.phase("solve"):
+            result = yield from self.__iter_solve(algorithm)
+        self.__stats.count("solve", "cells_visited", result.expanded)
+        return result
+
+    def __iter_solve(self, algorithm):
+        """Body of iter_solve."""
+        on_move = None if self.__win is None else self.__draw_move
+        if self.__stats is not None:
+            on_move = self.__stats.track_moves("solve", on_move)
+
+        search = iter_solve(
+            self.__grid, (0, 0), (self.__num_cols - 1, self.__num_rows - 1), algorithm
+        )
+        while True:
+            try:
+                event = next(search)
+            except StopIteration as stop:
+                result = stop.value
+                break
+            if on_move is not None:
+                i, j, move = event
+                di, dj = STEPS[move & ALL_WALLS]
+                on_move((i, j), (i + di, j + dj), bool(move & UNDO))
+            yield event
+
+        if self.__win is not None:
+            self.__animate(flush=True)
+        return result
+
+    def __run_solver(self, solver, goal, on_move):
+        """Runs a solver from the entrance to goal and flushes the animation of its moves."""
+        if on_move is None:
+            return solver(self.__grid, (0, 0), goal)
+
+        result = solver(self.__grid, (0, 0), goal, on_move)
+        if self.__win is not None:
+            self.__animate(flush=True)
+        return result
+
+    def save(self, path):
+        """
+        Saves the walls of the maze to a file, packed 4 bits per cell behind a 16 byte header.
+
+        Parameters
+        ----------
+        path : str
+            Path of the file to write.
+        """
+        save_grid(self.__grid, path)
+
+    @classmethod
+    def load(cls, path, x1=0, y1=0, cell_size_x=10, cell_size_y=10, win=None, **kwargs):
+        """
+        Opens a maze written by save.
+
+        The file is memory-mapped and the walls are decoded as they are read, so even very large
+        mazes open instantly without allocating anything per cell. Solving never unpacks the
+        walls either, but still builds a byte of open passages per cell, twice the size of the
+        file, plus the per-cell bookkeeping of the solver. The loaded maze is read-only.
+
+        Parameters
+        ----------
+        path : str
+            Path of the file to open.
+        x1 : int
+            Default: 0
+            x-coordinate on where the Maze starts.
+        y1 : int
+            Default: 0
+            y-coordinate on where the Maze starts.
+        cell_size_x : float
+            Default: 10
+            Width of each cell.
+        cell_size_y : float
+            Default: 10
+            Height of each cell.
+        win : Window object
+            Default: None
+            Instance of Window class.
+        kwargs
+            Other Maze parameters, such as animation_delay or stats.
+        """
+        grid = load_grid(path)
+        return cls(
+            x1, y1, grid.num_rows, grid.num_cols, cell_size_x, cell_size_y, win, grid=grid,
+            **kwargs
+        )
+
+    def save_image(self, path, cell_size=4, solution=None, line_width=1):
+        """
+        Renders the maze offscreen with raster.render_grid and writes it to a PNG or PPM file.
+
+        No window or display is needed.
+
+        Parameters
+        ----------
+        path : str
+            Path of the file to write; PNG if it ends with .png, binary PPM otherwise.
+        cell_size : int
+            Default: 4
+            Width and height of each cell in pixels.
+        solution : SolveResult or list
+            Default: None
+            Path to draw in red, such as the result of solve().
+        line_width : int
+            Default: 1
+            Thickness of the walls and the path in pixels.
+        """
+        path_cells = getattr(solution, "path", solution)
+        width, height, pixels = render_grid(
+            self.__grid, cell_size, solution=path_cells, line_width=line_width
+        )
+        save_image(path, width, height, pixels)
+
+    def get_grid(self):
+        """Returns the WallGrid holding the walls of the maze."""
+        return self.__grid
+
+    def get_stats(self):
+        """Returns the MazeStats collecting counters and timings of this maze, or None."""
+        return self.__stats
 
     def get_cells(self):
-        """Returns __cells attribute."""
+        """
+        Returns the cells as a 2-dimensional sequence indexed as cells[i][j].
+
+        The CellGrid creates CellView objects backed by the wall grid only as cells are
+        accessed, and caches them weakly. Walls and visited flags assigned through a view are
+        written to the grid, and with a window the views draw and draw_move like Cell objects.
+        """
+        if self.__cells is None:
+            self.__cells = CellGrid(self.__grid, self.__renderer)
         return self.__cells
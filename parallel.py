@@ -0,0 +1,181 @@
+# ~*~ coding: utf-8 ~*~
+"""
+    File name           : parallel.py
+    Author              : Derryn Edwards
+    Date Created        : 2026/10/18
+    Date Last Modified  : 2026/10/18
+    Python Version      : 3.11
+"""
+# ==================================================================================================
+# IMPORTS
+# ==================================================================================================
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import os
+import random
+from generators import carve_backtracker
+from grid import WallGrid, RIGHT, BOTTOM
+
+
+DEFAULT_REGION_SIZE = 512
+
+
+def _carve_region(args):
+    """
+    Worker: carves one region as a perfect maze of its own and copies its walls into the shared
+    wall buffer, column by column.
+    """
+    name, num_rows, i0, j0, cols, rows, seed = args
+    region = WallGrid(cols, rows)
+    carve_backtracker(region, 0, 0, random.Random(seed))
+    walls = region.walls
+
+    shared = shared_memory.SharedMemory(name=name)
+    try:
+        for col in range(cols):
+            at = (i0 + col) * num_rows + j0
+            shared.buf[at:at + rows] = walls[col * rows:(col + 1) * rows]
+    finally:
+        shared.close()
+
+
+class _DisjointSets:
+    """Union-find over region numbers, with path halving."""
+
+    def __init__(self, size):
+        self.__parents = list(range(size))
+
+    def find(self, item):
+        parents = self.__parents
+        while parents[item] != item:
+            parents[item] = parents[parents[item]]
+            item = parents[item]
+        return item
+
+    def union(self, first, second):
+        """Joins the sets of first and second and returns False if they were already joined."""
+        first = self.find(first)
+        second = self.find(second)
+        if first == second:
+            return False
+        self.__parents[first] = second
+        return True
+
+
+def stitch_regions(grid, region_cols, region_rows, rng):
+    """
+    Joins the independently carved regions of a grid into a single perfect maze.
+
+    Runs Kruskal's algorithm over the walls on the region borders: they are visited in random
+    order and a wall is broken whenever it separates two regions that are not connected yet.
+    Every region is a tree, so breaking one wall per union leaves a tree over the whole grid.
+
+    Parameters
+    ----------
+    grid : WallGrid Object
+        Grid whose regions were carved.
+    region_cols : int
+        Number of columns of a region.
+    region_rows : int
+        Number of rows of a region.
+    rng : random.Random Object
+        Source of randomness for the order of the border walls.
+
+    Returns
+    -------
+    int
+        Number of walls broken.
+    """
+    num_cols = grid.num_cols
+    num_rows = grid.num_rows
+    regions_y = -(-num_rows // region_rows)
+    borders = [
+        (i - 1, j, RIGHT)
+        for i in range(region_cols, num_cols, region_cols) for j in range(num_rows)
+    ]
+    borders.extend(
+        (i, j - 1, BOTTOM)
+        for j in range(region_rows, num_rows, region_rows) for i in range(num_cols)
+    )
+    rng.shuffle(borders)
+
+    num_regions = -(-num_cols // region_cols) * regions_y
+    regions = _DisjointSets(num_regions)
+    broken = 0
+    for i, j, wall in borders:
+        next_i, next_j = (i + 1, j) if wall == RIGHT else (i, j + 1)
+        if regions.union(
+            i // region_cols * regions_y + j // region_rows,
+            next_i // region_cols * regions_y + next_j // region_rows,
+        ):
+            grid.break_wall(i, j, wall)
+            broken += 1
+            if broken == num_regions - 1:
+                break
+    return broken
+
+
+def generate_parallel(num_cols, num_rows, seed=None, workers=None,
+                      region_size=DEFAULT_REGION_SIZE):
+    """
+    Generates a perfect maze by carving regions of it in parallel worker processes.
+
+    The grid is split into square regions. Every region is carved by the backtracker in a
+    worker process, which writes its walls straight into a shared memory wall buffer, and
+    stitch_regions then joins the regions through their borders. Regions get seeds derived from
+    seed, so the maze depends on the seed and region_size, never on the number of workers or
+    the order they finish in. Like the generators in GENERATORS, the entrance and exit
+    are left closed.
+
+    Parameters
+    ----------
+    num_cols : int
+        Number of columns the maze will have.
+    num_rows : int
+        Number of rows the maze will have.
+    seed : int
+        Default: None
+        Seed used for random generator.
+    workers : int
+        Default: None
+        Number of worker processes. None uses one per CPU, 0 carves every region in the
+        calling process.
+    region_size : int
+        Default: DEFAULT_REGION_SIZE
+        Number of columns and rows of a region. Smaller regions spread the work more evenly
+        over the workers but leave more border walls to stitch.
+
+    Returns
+    -------
+    WallGrid
+        Walls of the maze.
+    """
+    if seed is None:
+        seed = random.randrange(2 ** 63)
+    if region_size < 1:
+        raise ValueError("region_size must be at least 1")
+
+    num_cells = num_cols * num_rows
+    shared = shared_memory.SharedMemory(create=True, size=max(num_cells, 1))
+    try:
+        jobs = [
+            (shared.name, num_rows, i0, j0, min(region_size, num_cols - i0),
+             min(region_size, num_rows - j0), f"{seed}:{i0}:{j0}")
+            for i0 in range(0, num_cols, region_size) for j0 in range(0, num_rows, region_size)
+        ]
+        if workers == 0:
+            for job in jobs:
+                _carve_region(job)
+        else:
+            with ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1) as executor:
+                for _ in executor.map(_carve_region, jobs):
+                    pass
+
+        grid = WallGrid(num_cols, num_rows)
+        grid.walls[:] = shared.buf[:num_cells]
+    finally:
+        shared.close()
+        shared.unlink()
+
+    stitch_regions(grid, region_size, region_size, random.Random(f"{seed}:stitch"))
+    return grid
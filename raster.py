@@ -0,0 +1,423 @@
+# ~*~ coding: utf-8 ~*~
+"""
+    File name           : raster.py
+    Author              : Derryn Edwards
+    Date Created        : 2026/10/18
+    Date Last Modified  : 2026/10/18
+    Python Version      : 3.11
+"""
+# ==================================================================================================
+# IMPORTS
+# ==================================================================================================
+import struct
+import zlib
+from grid import LEFT, RIGHT, TOP, BOTTOM
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+COLORS = {
+    "black": (0, 0, 0),
+    "white": (255, 255, 255),
+    "red": (255, 0, 0),
+    "blue": (0, 0, 255),
+    "gray": (128, 128, 128),
+}
+
+
+def _rgb(color):
+    """Returns the (r, g, b) of a color name, "#rrggbb" string or tuple."""
+    if isinstance(color, tuple):
+        return color
+    if color.startswith("#") and len(color) == 7:
+        return tuple(bytes.fromhex(color[1:]))
+    try:
+        return COLORS[color]
+    except KeyError:
+        raise ValueError(f"unknown color {color!r}") from None
+
+
+class _Canvas:
+    """The part of a Tk Canvas that graphics.Line.draw uses, painting onto a RasterWindow."""
+
+    def __init__(self, window):
+        self.__window = window
+
+    def create_line(self, *coords, fill="black", width=2):
+        self.__window.paint(coords, fill, width)
+
+
+class RasterWindow:
+    """
+    An offscreen stand-in for graphics.Window that draws into a pixel buffer instead of Tk.
+
+    It has the same drawing methods as Window, so it can be handed to Maze or MazeRenderer on a
+    machine without a display. Lines drawn with draw_line are painted straight into the buffer;
+    items made with create_line are kept as coordinates, so they can still be moved, recolored
+    and deleted, and are painted on top when the image is saved.
+
+    Attributes
+    ----------
+    width : int
+        Width of the image in pixels.
+    height : int
+        Height of the image in pixels.
+    line_width : int
+        Thickness of the lines in pixels.
+    pixels : bytearray
+        RGB bytes of every pixel, row by row, without the items.
+
+    Methods
+    -------
+    redraw(self)
+        Does nothing; there is no screen to update.
+    wait_for_close(self)
+        Returns immediately.
+    wait_for_close_async(self, interval=1 / 30)
+        Returns immediately.
+    close(self)
+        Does nothing.
+    draw_line(self, line, fill_color="black")
+        Paints a Line into the pixel buffer.
+    create_line(self, coords, fill_color="black")
+        Creates a line item and returns its id.
+    move_line(self, item, coords)
+        Moves an existing line item to new coordinates.
+    recolor_line(self, item, fill_color)
+        Changes the color of an existing line item.
+    delete_line(self, item)
+        Removes a line item.
+    paint(self, coords, fill_color="black", width=None, pixels=None)
+        Paints a line or polyline into a pixel buffer.
+    render(self)
+        Returns the pixels with every item painted on top.
+    save(self, path)
+        Writes the image to a PPM or PNG file.
+    """
+
+    def __init__(self, width, height, background="white", line_width=2):
+        """
+        Parameters
+        ----------
+        width : int
+            Width of the image in pixels.
+        height : int
+            Height of the image in pixels.
+        background : str
+            Default: "white"
+            Color of the empty image.
+        line_width : int
+            Default: 2
+            Thickness of the lines in pixels, 2 like Window.
+        """
+        self.width = width
+        self.height = height
+        self.line_width = line_width
+        self.pixels = bytearray(bytes(_rgb(background)) * (width * height))
+        self.__items = {}
+        self.__next_item = 1
+        self.__canvas = _Canvas(self)
+
+    def redraw(self):
+        """Does nothing; there is no screen to update."""
+
+    def wait_for_close(self):
+        """Returns immediately; there is no window to close."""
+
+    async def wait_for_close_async(self, interval=1 / 30):
+        """Returns immediately; there is no window to close."""
+
+    def close(self):
+        """Does nothing."""
+
+    def draw_line(self, line, fill_color="black"):
+        """
+        Paints a Line into the pixel buffer.
+
+        Parameters
+        ----------
+        line : Line Object
+            Instance of Line Class
+        fill_color : str
+            String defining the color such as "black" or "red".
+        """
+        line.draw(self.__canvas, fill_color)
+
+    def create_line(self, coords, fill_color="black"):
+        """
+        Creates a line or polyline item and returns its id.
+
+        Parameters
+        ----------
+        coords : list
+            Flat list of coordinates x1, y1, x2, y2, ... of the points of the line.
+        fill_color : str
+            String defining the color such as "black" or "red".
+        """
+        item = self.__next_item
+        self.__next_item += 1
+        self.__items[item] = [coords, fill_color]
+        return item
+
+    def move_line(self, item, coords):
+        """Moves an existing line item to new coordinates."""
+        self.__items[item][0] = coords
+
+    def recolor_line(self, item, fill_color):
+        """Changes the color of an existing line item."""
+        self.__items[item][1] = fill_color
+
+    def delete_line(self, item):
+        """Removes a line item."""
+        del self.__items[item]
+
+    def paint(self, coords, fill_color="black", width=None, pixels=None):
+        """
+        Paints a line or polyline into a pixel buffer.
+
+        Horizontal and vertical segments, which is every wall and move of a maze, are painted
+        with one slice assignment per pixel row or per color channel; other segments fall back
+        to one pixel at a time.
+
+        Parameters
+        ----------
+        coords : list
+            Flat list of coordinates x1, y1, x2, y2, ... of the points of the line.
+        fill_color : str
+            Default: "black"
+            Color of the line.
+        width : int
+            Default: None
+            Thickness in pixels. None uses line_width.
+        pixels : bytearray
+            Default: None
+            Buffer to paint into. None paints into pixels.
+        """
+        pixels = self.pixels if pixels is None else pixels
+        width = self.line_width if width is None else width
+        rgb = bytes(_rgb(fill_color))
+        points = [round(value) for value in coords]
+        # center the thickness of the line on its coordinates
+        shift = width // 2
+        for n in range(0, len(points) - 2, 2):
+            x1, y1, x2, y2 = (value - shift for value in points[n:n + 4])
+            if y1 == y2:
+                self.__fill(pixels, min(x1, x2), y1, abs(x2 - x1) + width, width, rgb)
+            elif x1 == x2:
+                self.__fill(pixels, x1, min(y1, y2), width, abs(y2 - y1) + width, rgb)
+            else:
+                steps = max(abs(x2 - x1), abs(y2 - y1))
+                for step in range(steps + 1):
+                    x = x1 + round((x2 - x1) * step / steps)
+                    y = y1 + round((y2 - y1) * step / steps)
+                    self.__fill(pixels, x, y, width, width, rgb)
+
+    def __fill(self, pixels, x, y, w, h, rgb):
+        """Fills the rectangle of w by h pixels at (x, y), clipped to the image."""
+        x0 = max(x, 0)
+        y0 = max(y, 0)
+        x1 = min(x + w, self.width)
+        y1 = min(y + h, self.height)
+        if x0 >= x1 or y0 >= y1:
+            return
+        stride = 3 * self.width
+        if h <= x1 - x0:
+            row = rgb * (x1 - x0)
+            for y in range(y0, y1):
+                pixels[y * stride + 3 * x0:y * stride + 3 * x1] = row
+            return
+        # tall and thin: assign each column of each channel in one go
+        for x in range(x0, x1):
+            start = y0 * stride + 3 * x
+            end = (y1 - 1) * stride + 3 * x + 1
+            for channel in range(3):
+                pixels[start + channel:end + channel:stride] = bytes((rgb[channel],)) * (y1 - y0)
+
+    def render(self):
+        """Returns a copy of the pixels with every item painted on top, in creation order."""
+        pixels = bytearray(self.pixels)
+        for coords, fill_color in self.__items.values():
+            self.paint(coords, fill_color, pixels=pixels)
+        return pixels
+
+    def save(self, path):
+        """
+        Writes the image to a file, PNG if path ends with .png and binary PPM otherwise.
+
+        Parameters
+        ----------
+        path : str
+            Path of the file to write.
+        """
+        save_image(path, self.width, self.height, self.render())
+
+
+def write_ppm(path, width, height, pixels):
+    """Writes RGB pixels to a binary PPM (P6) file."""
+    with open(path, "wb") as file:
+        file.write(b"P6\n%d %d\n255\n" % (width, height))
+        file.write(pixels)
+
+
+def _png_chunk(kind, data):
+    """Returns one PNG chunk: length, type, data and CRC."""
+    return (
+        struct.pack(">I", len(data)) + kind + data
+        + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF)
+    )
+
+
+def write_png(path, width, height, pixels, compress_level=3):
+    """
+    Writes RGB pixels to a PNG file, using only zlib.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file to write.
+    width : int
+        Width of the image in pixels.
+    height : int
+        Height of the image in pixels.
+    pixels : bytes
+        RGB bytes of every pixel, row by row.
+    compress_level : int
+        Default: 3
+        zlib compression level. On maze images 3 is about three times faster than 6 for files
+        about a quarter larger; 1 is faster still.
+    """
+    stride = 3 * width
+    pixels = memoryview(pixels)
+    # every row starts with filter type 0 (none)
+    rows = bytearray((stride + 1) * height)
+    view = memoryview(rows)
+    for y in range(height):
+        view[y * (stride + 1) + 1:(y + 1) * (stride + 1)] = pixels[y * stride:(y + 1) * stride]
+    with open(path, "wb") as file:
+        file.write(b"\x89PNG\r\n\x1a\n")
+        file.write(_png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)))
+        file.write(_png_chunk(b"IDAT", zlib.compress(rows, compress_level)))
+        file.write(_png_chunk(b"IEND", b""))
+
+
+def save_image(path, width, height, pixels):
+    """Writes RGB pixels to a PNG file if path ends with .png and to a binary PPM otherwise."""
+    if path.lower().endswith(".png"):
+        write_png(path, width, height, pixels)
+    else:
+        write_ppm(path, width, height, pixels)
+
+
+def render_grid(grid, cell_size=4, margin=None, solution=None, line_width=1):
+    """
+    Rasterizes the walls of a grid, and optionally a solution path, into RGB pixels.
+
+    With NumPy every wall of the grid is painted at once from the wall bits, which renders a
+    1000x1000 maze in a fraction of a second. Without NumPy the walls are drawn as merged runs
+    through graphics.MazeRenderer onto a RasterWindow, which is much slower on large grids.
+
+    Parameters
+    ----------
+    grid : WallGrid Object
+        Walls of the maze, or a PackedWallGrid.
+    cell_size : int
+        Default: 4
+        Width and height of each cell in pixels.
+    margin : int
+        Default: None
+        Blank border around the maze in pixels. None uses one cell.
+    solution : list
+        Default: None
+        (i, j) coordinates of a path to draw in red, such as SolveResult.path.
+    line_width : int
+        Default: 1
+        Thickness of the walls and the path in pixels.
+
+    Returns
+    -------
+    tuple
+        (width, height, pixels) of the image, pixels being RGB bytes row by row.
+    """
+    margin = cell_size if margin is None else margin
+    width = grid.num_cols * cell_size + 2 * margin + line_width
+    height = grid.num_rows * cell_size + 2 * margin + line_width
+    if np is None:
+        return width, height, _render_grid_python(
+            grid, width, height, cell_size, margin, solution, line_width
+        )
+    return width, height, _render_grid_numpy(
+        grid, width, height, cell_size, margin, solution, line_width
+    )
+
+
+def _render_grid_python(grid, width, height, cell_size, margin, solution, line_width):
+    """Pure Python fallback of render_grid."""
+    from graphics import MazeRenderer
+
+    window = RasterWindow(width, height, line_width=line_width)
+    # RasterWindow centers thick lines; shift by half a line so walls start at the margin
+    offset = margin + line_width // 2
+    MazeRenderer(window, grid, offset, offset, cell_size, cell_size).draw_walls()
+    if solution:
+        coords = []
+        for i, j in solution:
+            coords.append(offset + i * cell_size + cell_size // 2)
+            coords.append(offset + j * cell_size + cell_size // 2)
+        window.create_line(coords, "red")
+    return window.render()
+
+
+def _render_grid_numpy(grid, width, height, cell_size, margin, solution, line_width):
+    """NumPy implementation of render_grid."""
+    num_cols = grid.num_cols
+    num_rows = grid.num_rows
+    walls = grid.walls
+    if not isinstance(walls, bytearray):
+        # decode packed walls in one pass, without an intermediate WallGrid
+        walls = walls.translate(None)
+    walls = np.frombuffer(walls, dtype=np.uint8).reshape(num_cols, num_rows)
+    s = cell_size
+
+    # segment (line, n) of every horizontal and vertical grid line, from either side
+    horizontal = np.zeros((num_rows + 1, num_cols), dtype=bool)
+    horizontal[:-1] |= (walls & TOP).T > 0
+    horizontal[1:] |= (walls & BOTTOM).T > 0
+    vertical = np.zeros((num_cols + 1, num_rows), dtype=bool)
+    vertical[:-1] |= (walls & LEFT) > 0
+    vertical[1:] |= (walls & RIGHT) > 0
+
+    ink = np.zeros((height, width), dtype=bool)
+    lines_y = margin + s * np.arange(num_rows + 1)
+    lines_x = margin + s * np.arange(num_cols + 1)
+    horizontal_run = np.repeat(horizontal, s, axis=1)
+    vertical_run = np.repeat(vertical, s, axis=1).T
+    # every segment covers s pixels plus its end pixel, widened by line_width - 1 both ways
+    for t in range(line_width):
+        for shift in range(line_width):
+            x0 = margin + shift
+            y0 = margin + shift
+            ink[lines_y + t, x0:x0 + s * num_cols] |= horizontal_run
+            ink[lines_y + t, x0 + s:x0 + s * num_cols + 1:s] |= horizontal
+            ink[y0:y0 + s * num_rows, lines_x + t] |= vertical_run
+            ink[y0 + s:y0 + s * num_rows + 1:s, lines_x + t] |= vertical.T
+
+    image = np.full((height, width, 3), 255, dtype=np.uint8)
+    image[ink] = 0
+
+    if solution and len(solution) > 1:
+        centers = margin + s * np.asarray(solution, dtype=np.int64) + s // 2
+        starts = centers[:-1]
+        steps = np.sign(centers[1:] - starts)
+        # every step covers s + 1 pixels from one cell center to the next
+        reach = np.arange(s + 1)
+        xs = starts[:, 0, None] + steps[:, 0, None] * reach
+        ys = starts[:, 1, None] + steps[:, 1, None] * reach
+        xs = xs.ravel()
+        ys = ys.ravel()
+        for tx in range(line_width):
+            for ty in range(line_width):
+                image[ys + ty, xs + tx] = (255, 0, 0)
+
+    return bytearray(image.tobytes())
@@ -0,0 +1,916 @@
+# ~*~ coding: utf-8 ~*~
+"""
+    File name           : solvers.py
+    Author              : Derryn Edwards
+    Date Created        : 2026/10/18
+    Date Last Modified  : 2026/10/18
+    Python Version      : 3.11
+"""
+# ==================================================================================================
+# IMPORTS
+# ==================================================================================================
+from array import array
+from collections import deque
+from grid import NeighborIndex, DEGREE, LEFT, RIGHT, TOP, BOTTOM
+import heapq
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+SOLVERS = {}
+SEARCHES = {}
+
+# flag OR'd into the direction of a solve event when the solver backtracks
+UNDO = 16
+
+
+# (di, dj) of each 2-bit step code of a path, in left, right, up, down order
+_CODE_STEPS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+_STEP_CODES = {step: code for code, step in enumerate(_CODE_STEPS)}
+
+# byte translation tables moving a 2-bit code into and out of each quarter of a byte
+_TO_CRUMB = [bytes((n & 3) << shift for n in range(256)) for shift in (0, 2, 4, 6)]
+_FROM_CRUMB = [bytes((n >> shift) & 3 for n in range(256)) for shift in (0, 2, 4, 6)]
+
+# reverses the direction of a step code: left <-> right, up <-> down
+_REVERSE = bytes(n ^ 1 for n in range(256))
+
+# marks the start cell in a search's came-from array, which otherwise holds step code + 1
+_START = 5
+
+
+def _pack_codes(codes):
+    """Packs 2-bit step codes four to a byte, first code in the lowest bits."""
+    codes = bytes(codes) + bytes(-len(codes) % 4)
+    # OR the four shifted quarters together in one go through big integers
+    packed = 0
+    for quarter in range(4):
+        packed |= int.from_bytes(codes[quarter::4].translate(_TO_CRUMB[quarter]), "little")
+    return packed.to_bytes(len(codes) // 4, "little")
+
+
+def _unpack_codes(packed, count):
+    """Unpacks count 2-bit step codes packed by _pack_codes into a bytearray."""
+    codes = bytearray(4 * len(packed))
+    for quarter in range(4):
+        codes[quarter::4] = packed.translate(_FROM_CRUMB[quarter])
+    del codes[count:]
+    return codes
+
+
+class SolveResult:
+    """
+    Outcome of running a solver on a maze.
+
+    A SolveResult is truthy when a path was found, so it can be used wherever the old boolean
+    return value of Maze.solve was expected.
+
+    The path is stored compactly as its start cell followed by one 2-bit step code per move,
+    four moves to a byte, so a path through ten million cells takes about 2.5 MB. The list of
+    coordinates is only rebuilt when path is read.
+
+    Attributes
+    ----------
+    algorithm : str
+        Name of the solver that produced the result.
+    expanded : int
+        Number of cells the solver expanded while searching.
+    start : tuple
+        (i, j) coordinates of the first cell of the path. None if the maze could not be solved.
+    length : int
+        Number of cells on the path. 0 if the maze could not be solved.
+    packed : bytes
+        Step codes of the path, 2 bits per move: 0 left, 1 right, 2 up, 3 down.
+
+    Methods
+    -------
+    from_directions(cls, algorithm, start, directions, expanded)
+        Creates a result from the step codes of a path.
+    cells(self)
+        Yields the (i, j) coordinates of the path one by one.
+    directions(self)
+        Returns the step codes of the path, one per byte.
+    """
+
+    __slots__ = ("algorithm", "expanded", "start", "length", "packed")
+
+    def __init__(self, algorithm, path, expanded):
+        """
+        Parameters
+        ----------
+        algorithm : str
+            Name of the solver that produced the result.
+        path : list
+            List of (i, j) coordinates from start to goal, each next to the previous one.
+        expanded : int
+            Number of cells the solver expanded while searching.
+        """
+        codes = bytearray()
+        for (i, j), (next_i, next_j) in zip(path, path[1:]):
+            codes.append(_STEP_CODES[(next_i - i, next_j - j)])
+        self.__set(algorithm, tuple(path[0]) if path else None, codes, expanded)
+
+    def __set(self, algorithm, start, codes, expanded):
+        self.algorithm = algorithm
+        self.expanded = expanded
+        self.start = start
+        self.length = 0 if start is None else len(codes) + 1
+        self.packed = _pack_codes(codes)
+
+    @classmethod
+    def from_directions(cls, algorithm, start, directions, expanded):
+        """
+        Creates a result from the step codes of a path.
+
+        Parameters
+        ----------
+        algorithm : str
+            Name of the solver that produced the result.
+        start : tuple
+            (i, j) coordinates of the first cell. None if the maze could not be solved.
+        directions : bytes
+            One step code per move: 0 left, 1 right, 2 up, 3 down.
+        expanded : int
+            Number of cells the solver expanded while searching.
+        """
+        result = cls.__new__(cls)
+        result.__set(algorithm, start, directions, expanded)
+        return result
+
+    @property
+    def path(self):
+        """List of (i, j) coordinates from start to goal, rebuilt on every read."""
+        return list(self.cells())
+
+    def cells(self):
+        """Yields the (i, j) coordinates of the path one by one, without building a list."""
+        if self.start is None:
+            return
+        i, j = self.start
+        yield i, j
+        for code in self.directions():
+            di, dj = _CODE_STEPS[code]
+            i += di
+            j += dj
+            yield i, j
+
+    def directions(self):
+        """Returns the step codes of the path, one per byte: 0 left, 1 right, 2 up, 3 down."""
+        return _unpack_codes(self.packed, max(self.length - 1, 0))
+
+    def __len__(self):
+        return self.length
+
+    def __bool__(self):
+        return self.length > 0
+
+    def __repr__(self):
+        return f"SolveResult({self.algorithm!r}, length={self.length}, expanded={self.expanded})"
+
+
+def register_solver(name):
+    """
+    Decorator that adds a solver function to the SOLVERS registry under the given name.
+
+    Parameters
+    ----------
+    name : str
+        Name used to select the solver through Maze.solve(algorithm=name).
+    """
+    def decorator(func):
+        SOLVERS[name] = func
+        return func
+    return decorator
+
+
+def register_search(name):
+    """
+    Decorator that adds the search generator behind a built-in solver to the SEARCHES registry.
+
+    A search is called as search(grid, start, goal, report) and returns a SolveResult. While
+    report is True it yields (from_k, to_k, undo) for every move it makes, with cells given as
+    flat indices; while it is False it never yields, so it runs to the end on the first next().
+
+    Parameters
+    ----------
+    name : str
+        Name of the solver the search belongs to.
+    """
+    def decorator(func):
+        SEARCHES[name] = func
+        return func
+    return decorator
+
+
+def get_solver(name):
+    """
+    Returns the solver registered under name.
+
+    Raises
+    ------
+    ValueError
+        If no solver is registered under name.
+    """
+    try:
+        return SOLVERS[name]
+    except KeyError:
+        raise ValueError(
+            f"unknown solver {name!r}, expected one of: {', '.join(sorted(SOLVERS))}"
+        ) from None
+
+
+def _direction(from_k, to_k, num_rows):
+    """Returns the wall crossed when moving from cell from_k to its neighbour to_k."""
+    step = to_k - from_k
+    if step == -num_rows:
+        return LEFT
+    if step == num_rows:
+        return RIGHT
+    return TOP if step == -1 else BOTTOM
+
+
+def _drive(search, on_move, num_rows):
+    """Runs a search to the end, passing every move to on_move, and returns its SolveResult."""
+    while True:
+        try:
+            k, next_k, undo = next(search)
+        except StopIteration as stop:
+            return stop.value
+        on_move(divmod(k, num_rows), divmod(next_k, num_rows), undo)
+
+
+def iter_solve(grid, start, goal, algorithm="dfs"):
+    """
+    Runs a solver lazily, yielding one compact event per move.
+
+    Every event is an (i, j, move) tuple: the solver moved from cell (i, j) through the wall
+    given by move, which is LEFT, RIGHT, TOP or BOTTOM, with UNDO OR'd in when it backtracks.
+    Nothing is buffered, so the consumer can stop at any point. The SolveResult is the return
+    value of the generator, as given by yield from or StopIteration.value.
+
+    Solvers registered without a search generator are run to the end first and their moves
+    replayed.
+
+    Parameters
+    ----------
+    grid : WallGrid Object
+        Walls of the maze.
+    start : tuple
+        (i, j) coordinates of the starting cell.
+    goal : tuple
+        (i, j) coordinates of the goal cell.
+    algorithm : str
+        Default: "dfs"
+        Name of a solver registered in SOLVERS.
+    """
+    num_rows = grid.num_rows
+    search = SEARCHES.get(algorithm)
+    if search is None:
+        moves = []
+        result = get_solver(algorithm)(
+            grid, start, goal,
+            lambda from_ij, to_ij, undo: moves.append((from_ij, to_ij, undo))
+        )
+        for (i, j), (next_i, next_j), undo in moves:
+            move = _direction(i * num_rows + j, next_i * num_rows + next_j, num_rows)
+            yield i, j, move | UNDO if undo else move
+        return result
+
+    search = search(grid, start, goal, True)
+    while True:
+        try:
+            k, next_k, undo = next(search)
+        except StopIteration as stop:
+            return stop.value
+        move = _direction(k, next_k, num_rows)
+        yield *divmod(k, num_rows), move | UNDO if undo else move
+
+
+def _step_codes(num_rows, add=0):
+    """Returns a dict from the flat index offset of a move to its step code plus add."""
+    # left and right come last so they win when num_rows is 1 and the offsets coincide
+    return {-1: 2 + add, 1: 3 + add, -num_rows: 0 + add, num_rows: 1 + add}
+
+
+def _trace(came, num_rows, start_k, k):
+    """
+    Follows a came-from array back from cell k to start_k and returns the step codes of the
+    path in forward order.
+    """
+    steps = (-num_rows, num_rows, -1, 1)
+    codes = bytearray()
+    while k != start_k:
+        code = came[k] - 1
+        codes.append(code)
+        k -= steps[code]
+    codes.reverse()
+    return codes
+
+
+@register_search("dfs")
+def _search_dfs(grid, start, goal, report):
+    """Search generator behind solve_dfs, see register_search."""
+    index = NeighborIndex(grid)
+    passages = index.passages
+    offsets = index.offsets
+    num_cols = grid.num_cols
+    num_rows = grid.num_rows
+    start_k = start[0] * num_rows + start[1]
+    goal_k = goal[0] * num_rows + goal[1]
+    visited = bytearray(num_cols * num_rows)
+    visited[start_k] = 1
+    expanded = 1
+    stack = [(start_k, iter(offsets[passages[start_k]]))]
+
+    if start_k == goal_k:
+        return SolveResult.from_directions("dfs", start, b"", expanded)
+
+    while stack:
+        k, neighbors = stack[-1]
+        for offset in neighbors:
+            next_k = k + offset
+            if not visited[next_k]:
+                break
+        else:
+            # dead end; step back to the previous cell
+            stack.pop()
+            if stack and report:
+                yield stack[-1][0], k, True
+            continue
+
+        visited[next_k] = 1
+        expanded += 1
+        if report:
+            yield k, next_k, False
+        if next_k == goal_k:
+            # the stack holds the path; turn every step along it into its code
+            step_codes = _step_codes(num_rows)
+            ks = [k for k, _ in stack]
+            ks.append(goal_k)
+            codes = bytes(step_codes[b - a] for a, b in zip(ks, ks[1:]))
+            return SolveResult.from_directions("dfs", start, codes, expanded)
+        stack.append((next_k, iter(offsets[passages[next_k]])))
+
+    return SolveResult.from_directions("dfs", None, b"", expanded)
+
+
+@register_solver("dfs")
+def solve_dfs(grid, start, goal, on_move=None):
+    """
+    Iterative depth-first search.
+
+    Tries left, right, up and down in that order, like the original recursive solver, and reports
+    every step and every backtrack to on_move.
+
+    Parameters
+    ----------
+    grid : WallGrid Object
+        Walls of the maze.
+    start : tuple
+        (i, j) coordinates of the starting cell.
+    goal : tuple
+        (i, j) coordinates of the goal cell.
+    on_move : callable
+        Default: None
+        Called as on_move(from_ij, to_ij, undo) for every move the search makes.
+    """
+    search = _search_dfs(grid, start, goal, on_move is not None)
+    return _drive(search, on_move, grid.num_rows)
+
+
+@register_search("bfs")
+def _search_bfs(grid, start, goal, report):
+    """Search generator behind solve_bfs, see register_search."""
+    index = NeighborIndex(grid)
+    passages = index.passages
+    offsets = index.offsets
+    num_cols = grid.num_cols
+    num_rows = grid.num_rows
+    start_k = start[0] * num_rows + start[1]
+    goal_k = goal[0] * num_rows + goal[1]
+    step_codes = _step_codes(num_rows, 1)
+    # step code + 1 of the move into every reached cell, 0 while unseen
+    came = bytearray(num_cols * num_rows)
+    came[start_k] = _START
+    queue = deque([start_k])
+    expanded = 0
+
+    while queue:
+        k = queue.popleft()
+        expanded += 1
+        if k == goal_k:
+            codes = _trace(came, num_rows, start_k, k)
+            return SolveResult.from_directions("bfs", start, codes, expanded)
+        for offset in offsets[passages[k]]:
+            next_k = k + offset
+            if not came[next_k]:
+                came[next_k] = step_codes[offset]
+                if report:
+                    yield k, next_k, False
+                queue.append(next_k)
+
+    return SolveResult.from_directions("bfs", None, b"", expanded)
+
+
+@register_solver("bfs")
+def solve_bfs(grid, start, goal, on_move=None):
+    """
+    Breadth-first search. Always returns a shortest path.
+
+    Parameters
+    ----------
+    grid : WallGrid Object
+        Walls of the maze.
+    start : tuple
+        (i, j) coordinates of the starting cell.
+    goal : tuple
+        (i, j) coordinates of the goal cell.
+    on_move : callable
+        Default: None
+        Called as on_move(from_ij, to_ij, False) whenever a new cell is discovered.
+    """
+    search = _search_bfs(grid, start, goal, on_move is not None)
+    return _drive(search, on_move, grid.num_rows)
+
+
+@register_search("astar")
+def _search_astar(grid, start, goal, report):
+    """Search generator behind solve_astar, see register_search."""
+    index = NeighborIndex(grid)
+    passages = index.passages
+    offsets = index.offsets
+    num_cols = grid.num_cols
+    num_rows = grid.num_rows
+    start_k = start[0] * num_rows + start[1]
+    goal_k = goal[0] * num_rows + goal[1]
+    goal_i, goal_j = goal
+    step_codes = _step_codes(num_rows, 1)
+    came = bytearray(num_cols * num_rows)
+    came[start_k] = _START
+    costs = {start_k: 0}
+    closed = bytearray(num_cols * num_rows)
+    heap = [(abs(start[0] - goal_i) + abs(start[1] - goal_j), 0, start_k)]
+    expanded = 0
+
+    while heap:
+        _, cost, k = heapq.heappop(heap)
+        if closed[k]:
+            continue
+        closed[k] = 1
+        expanded += 1
+        if k == goal_k:
+            codes = _trace(came, num_rows, start_k, k)
+            return SolveResult.from_directions("astar", start, codes, expanded)
+        for offset in offsets[passages[k]]:
+            next_k = k + offset
+            next_cost = cost + 1
+            if closed[next_k] or next_cost >= costs.get(next_k, next_cost + 1):
+                continue
+            costs[next_k] = next_cost
+            came[next_k] = step_codes[offset]
+            next_i, next_j = divmod(next_k, num_rows)
+            if report:
+                yield k, next_k, False
+            estimate = next_cost + abs(next_i - goal_i) + abs(next_j - goal_j)
+            heapq.heappush(heap, (estimate, next_cost, next_k))
+
+    return SolveResult.from_directions("astar", None, b"", expanded)
+
+
+@register_solver("astar")
+def solve_astar(grid, start, goal, on_move=None):
+    """
+    A* search with a Manhattan distance heuristic. Always returns a shortest path.
+
+    Parameters
+    ----------
+    grid : WallGrid Object
+        Walls of the maze.
+    start : tuple
+        (i, j) coordinates of the starting cell.
+    goal : tuple
+        (i, j) coordinates of the goal cell.
+    on_move : callable
+        Default: None
+        Called as on_move(from_ij, to_ij, False) whenever a shorter route to a cell is found.
+    """
+    search = _search_astar(grid, start, goal, on_move is not None)
+    return _drive(search, on_move, grid.num_rows)
+
+
+@register_search("bidirectional")
+def _search_bidirectional(grid, start, goal, report):
+    """Search generator behind solve_bidirectional, see register_search."""
+    index = NeighborIndex(grid)
+    passages = index.passages
+    offsets = index.offsets
+    num_cols = grid.num_cols
+    num_rows = grid.num_rows
+    start_k = start[0] * num_rows + start[1]
+    goal_k = goal[0] * num_rows + goal[1]
+    if start_k == goal_k:
+        return SolveResult.from_directions("bidirectional", start, b"", 1)
+
+    num_cells = num_cols * num_rows
+    step_codes = _step_codes(num_rows, 1)
+    # every cell is reached from one side only, so both searches share one came-from array
+    came = bytearray(num_cells)
+    came[start_k] = _START
+    came[goal_k] = _START
+    depths = [0] * num_cells
+    # 0 = unseen, 1 = reached from start, 2 = reached from goal
+    side = bytearray(num_cells)
+    side[start_k] = 1
+    side[goal_k] = 2
+    frontiers = ([start_k], [goal_k])
+    expanded = 0
+
+    while frontiers[0] and frontiers[1]:
+        s = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        own, other = s + 1, 2 - s
+        next_frontier = []
+        meeting = None
+        for k in frontiers[s]:
+            expanded += 1
+            for offset in offsets[passages[k]]:
+                next_k = k + offset
+                if side[next_k] == other:
+                    # frontiers met; keep the shortest join found on this level
+                    if meeting is None or depths[next_k] < depths[meeting[1]]:
+                        meeting = (k, next_k)
+                elif not side[next_k]:
+                    side[next_k] = own
+                    came[next_k] = step_codes[offset]
+                    depths[next_k] = depths[k] + 1
+                    if report:
+                        yield k, next_k, False
+                    next_frontier.append(next_k)
+        if meeting is not None:
+            from_start, from_goal = meeting if s == 0 else reversed(meeting)
+            codes = _trace(came, num_rows, start_k, from_start)
+            codes.append(step_codes[from_goal - from_start] - 1)
+            # the goal side was searched backwards; walk it in reverse with flipped steps
+            codes += _trace(came, num_rows, goal_k, from_goal)[::-1].translate(_REVERSE)
+            return SolveResult.from_directions("bidirectional", start, codes, expanded)
+        frontiers[s][:] = next_frontier
+
+    return SolveResult.from_directions("bidirectional", None, b"", expanded)
+
+
+@register_solver("bidirectional")
+def solve_bidirectional(grid, start, goal, on_move=None):
+    """
+    Bidirectional breadth-first search. Grows one frontier from the start and one from the goal,
+    always expanding the smaller one, and stops when they meet.
+
+    Parameters
+    ----------
+    grid : WallGrid Object
+        Walls of the maze.
+    start : tuple
+        (i, j) coordinates of the starting cell.
+    goal : tuple
+        (i, j) coordinates of the goal cell.
+    on_move : callable
+        Default: None
+        Called as on_move(from_ij, to_ij, False) whenever a new cell is discovered.
+    """
+    search = _search_bidirectional(grid, start, goal, on_move is not None)
+    return _drive(search, on_move, grid.num_rows)
+
+
+# open passage bit of each 2-bit step code, and the bit leading back through the same passage
+_CODE_BITS = (LEFT, RIGHT, TOP, BOTTOM)
+_BACK_BITS = (RIGHT, LEFT, BOTTOM, TOP)
+_BIT_CODES = {bit: code for code, bit in enumerate(_CODE_BITS)}
+
+# below this many dead ends per pass, a vectorized pass costs more than filling them one by one
+_FILL_PASS_MIN = 512
+
+
+def _fill_passes(passages, degree, num_rows):
+    """
+    Fills dead ends in vectorized passes: every pass seals all current dead ends at once and the
+    next pass only looks at the cells they opened into. Stops when a pass would seal fewer than
+    _FILL_PASS_MIN cells and returns the number of cells filled and the remaining dead ends.
+    """
+    cells = np.frombuffer(passages, dtype=np.uint8)
+    degrees = np.frombuffer(degree, dtype=np.uint8)
+    moves = [
+        (bit, (-num_rows, num_rows, -1, 1)[code], 0xFF & ~_BACK_BITS[code])
+        for code, bit in enumerate(_CODE_BITS)
+    ]
+    frontier = np.flatnonzero(degrees == 1)
+    filled = 0
+    while frontier.size >= _FILL_PASS_MIN:
+        bits = cells[frontier]
+        cells[frontier] = 0
+        degrees[frontier] = 0
+        filled += frontier.size
+        opened = []
+        # dead ends opening the same way reach distinct cells, so every direction can update
+        # its neighbours with plain fancy indexing
+        for bit, step, keep in moves:
+            neighbors = frontier[bits == bit] + step
+            cells[neighbors] &= keep
+            degrees[neighbors] -= 1
+            opened.append(neighbors)
+        neighbors = np.concatenate(opened)
+        frontier = np.unique(neighbors[degrees[neighbors] == 1])
+    return filled, frontier.tolist()
+
+
+def _fill_dead_ends(passages, num_rows, start_k, goal_k):
+    """
+    Seals every dead end of passages, except start_k and goal_k, until none are left, and
+    returns the number of cells filled.
+    """
+    degree = passages.translate(DEGREE)
+    # start and goal are never filled
+    degree[start_k] += 8
+    degree[goal_k] += 8
+    if np is None:
+        filled = 0
+        stack = [k for k, value in enumerate(degree) if value == 1]
+    else:
+        filled, stack = _fill_passes(passages, degree, num_rows)
+
+    # one cell at a time, following every filled dead end into the cell it opens into
+    steps = [0] * 16
+    back = [0] * 16
+    for code, bit in enumerate(_CODE_BITS):
+        steps[bit] = (-num_rows, num_rows, -1, 1)[code]
+        back[bit] = ~_BACK_BITS[code]
+    while stack:
+        k = stack.pop()
+        if degree[k] != 1:
+            continue
+        while True:
+            bit = passages[k]
+            passages[k] = 0
+            degree[k] = 0
+            filled += 1
+            k += steps[bit]
+            passages[k] &= back[bit]
+            degree[k] -= 1
+            if degree[k] != 1:
+                break
+    return filled
+
+
+@register_search("deadend")
+def _search_deadend(grid, start, goal, report):
+    """Search generator behind solve_deadend, see register_search."""
+    num_rows = grid.num_rows
+    start_k = start[0] * num_rows + start[1]
+    goal_k = goal[0] * num_rows + goal[1]
+    passages = bytearray(NeighborIndex(grid).passages)
+    filled = _fill_dead_ends(passages, num_rows, start_k, goal_k)
+
+    steps = (-num_rows, num_rows, -1, 1)
+    codes = bytearray()
+    k = start_k
+    back = 0
+    while k != goal_k:
+        code = _BIT_CODES.get(passages[k] & ~back)
+        if code is None:
+            break
+        codes.append(code)
+        if report:
+            yield k, k + steps[code], False
+        k += steps[code]
+        back = _BACK_BITS[code]
+
+    if k == goal_k:
+        return SolveResult.from_directions("deadend", start, codes, filled + len(codes) + 1)
+    if not passages[k] & ~back:
+        return SolveResult.from_directions("deadend", None, b"", filled)
+
+    # more than one way on: a loop survived the filling. Step back to the start and follow a
+    # breadth-first path instead
+    if report:
+        for code in reversed(codes):
+            yield k - steps[code], k, True
+            k -= steps[code]
+    found = solve_bfs(grid, start, goal)
+    if report and found:
+        k = start_k
+        for code in found.directions():
+            yield k, k + steps[code], False
+            k += steps[code]
+    return SolveResult.from_directions(
+        "deadend", found.start, found.directions(), filled + found.expanded
+    )
+
+
+@register_solver("deadend")
+def solve_deadend(grid, start, goal, on_move=None):
+    """
+    Dead-end filling. Seals every cell with three walls, other than start and goal, until none
+    are left, which in a perfect maze leaves exactly the corridor from start to goal, then walks
+    that corridor.
+
+    With NumPy the dead ends are filled in vectorized passes over the whole grid, otherwise one
+    by one. Filling never branches, so the work does not depend on where start and goal lie. On a
+    maze with loops the filled grid can still hold more than one path; the solver then steps back
+    to the start and falls back to a breadth-first search.
+
+    Parameters
+    ----------
+    grid : WallGrid Object
+        Walls of the maze.
+    start : tuple
+        (i, j) coordinates of the starting cell.
+    goal : tuple
+        (i, j) coordinates of the goal cell.
+    on_move : callable
+        Default: None
+        Called as on_move(from_ij, to_ij, undo) for every step along the corridor walked.
+    """
+    search = _search_deadend(grid, start, goal, on_move is not None)
+    return _drive(search, on_move, grid.num_rows)
+
+
+class PathIndex:
+    """
+    Answers shortest path queries between any two cells of a maze after a single precomputation.
+
+    A perfect maze is a tree, so the path between two cells runs through their lowest common
+    ancestor in any spanning tree. The index does one breadth-first pass from root and keeps, per
+    cell, the step that reached it (1 byte), its depth and a skew-binary jump pointer (4 bytes
+    each). Jumping up by those pointers finds the lowest common ancestor in O(log n) steps, so
+    distance() is O(log n) and shortest_path() costs O(log n) plus the length of the path. No
+    state is changed by a query.
+
+    When the grid is not a tree, for example after extra walls were broken, tree paths are no
+    longer guaranteed to be shortest and every query falls back to a breadth-first search.
+
+    Attributes
+    ----------
+    num_cols : int
+        Number of columns in the grid.
+    num_rows : int
+        Number of rows in the grid.
+    is_tree : bool
+        True if every cell is reachable and there is a single path between any two cells.
+
+    Methods
+    -------
+    common_ancestor(self, src, dst)
+        Returns the cell where the paths from root to src and to dst split.
+    distance(self, src, dst)
+        Returns the number of steps on the shortest path between two cells.
+    shortest_path(self, src, dst)
+        Returns the shortest path between two cells as a SolveResult.
+    """
+
+    def __init__(self, grid, root=(0, 0)):
+        """
+        Parameters
+        ----------
+        grid : WallGrid Object
+            Walls of the maze. Later changes to it are not reflected.
+        root : tuple
+            Default: (0, 0)
+            (i, j) coordinates of the cell the spanning tree is grown from.
+        """
+        index = NeighborIndex(grid)
+        passages = index.passages
+        offsets = index.offsets
+        num_rows = grid.num_rows
+        num_cells = grid.num_cols * num_rows
+        step_codes = _step_codes(num_rows, 1)
+        root_k = root[0] * num_rows + root[1]
+
+        came = bytearray(num_cells)
+        came[root_k] = _START
+        depth = array("i", [0]) * num_cells
+        jump = array("i", [root_k]) * num_cells
+        queue = deque([root_k])
+        reached = 1
+        while queue:
+            k = queue.popleft()
+            child_depth = depth[k] + 1
+            # the children of k jump two levels of jumps up when those have equal length, which
+            # keeps every jump chain skew-binary
+            up = jump[k]
+            child_jump = k
+            if depth[k] - depth[up] == depth[up] - depth[jump[up]]:
+                child_jump = jump[up]
+            for offset in offsets[passages[k]]:
+                next_k = k + offset
+                if not came[next_k]:
+                    came[next_k] = step_codes[offset]
+                    depth[next_k] = child_depth
+                    jump[next_k] = child_jump
+                    reached += 1
+                    queue.append(next_k)
+
+        # every passage is counted from both of its cells
+        passage_count = sum(
+            passages.count(bits) * bin(bits).count("1") for bits in range(len(offsets))
+        ) // 2
+        self.num_cols = grid.num_cols
+        self.num_rows = num_rows
+        self.is_tree = reached == num_cells and passage_count == num_cells - 1
+        self.__grid = grid
+        self.__came = came
+        self.__depth = depth
+        self.__jump = jump
+        self.__steps = (-num_rows, num_rows, -1, 1)
+
+    def __flat(self, cell):
+        """Returns the flat index of cell (i, j), checking it lies on the grid."""
+        i, j = cell
+        if not (0 <= i < self.num_cols and 0 <= j < self.num_rows):
+            raise ValueError(f"cell {cell!r} is outside the {self.num_cols}x{self.num_rows} grid")
+        return i * self.num_rows + j
+
+    def __ancestor(self, u, v):
+        """Returns the flat index of the lowest common ancestor of flat cells u and v."""
+        came = self.__came
+        depth = self.__depth
+        jump = self.__jump
+        steps = self.__steps
+        if depth[u] < depth[v]:
+            u, v = v, u
+        target = depth[v]
+        while depth[u] > target:
+            if depth[jump[u]] >= target:
+                u = jump[u]
+            else:
+                u -= steps[came[u] - 1]
+        # jump pointers only depend on depth, so u and v jump in lockstep from here on
+        while u != v:
+            if jump[u] != jump[v]:
+                u = jump[u]
+                v = jump[v]
+            else:
+                u -= steps[came[u] - 1]
+                v -= steps[came[v] - 1]
+        return u
+
+    def common_ancestor(self, src, dst):
+        """
+        Returns the (i, j) coordinates of the cell where the paths from the root to src and dst
+        split.
+
+        Parameters
+        ----------
+        src : tuple
+            (i, j) coordinates of the first cell.
+        dst : tuple
+            (i, j) coordinates of the second cell.
+        """
+        return divmod(self.__ancestor(self.__flat(src), self.__flat(dst)), self.num_rows)
+
+    def distance(self, src, dst):
+        """
+        Returns the number of steps on the shortest path from src to dst, or None if dst can not
+        be reached.
+
+        Parameters
+        ----------
+        src : tuple
+            (i, j) coordinates of the starting cell.
+        dst : tuple
+            (i, j) coordinates of the goal cell.
+        """
+        if not self.is_tree:
+            result = self.shortest_path(src, dst)
+            return len(result) - 1 if result else None
+
+        u = self.__flat(src)
+        v = self.__flat(dst)
+        depth = self.__depth
+        return depth[u] + depth[v] - 2 * depth[self.__ancestor(u, v)]
+
+    def shortest_path(self, src, dst):
+        """
+        Returns the shortest path from src to dst.
+
+        Parameters
+        ----------
+        src : tuple
+            (i, j) coordinates of the starting cell.
+        dst : tuple
+            (i, j) coordinates of the goal cell.
+
+        Returns
+        -------
+        SolveResult
+            Path from src to dst, falsy if dst can not be reached. expanded is the number of cells
+            on the path for tree queries.
+        """
+        u = self.__flat(src)
+        v = self.__flat(dst)
+        if not self.is_tree:
+            return solve_bfs(self.__grid, tuple(src), tuple(dst))
+
+        top = self.__ancestor(u, v)
+        # walk from src up to the common ancestor, then down to dst
+        codes = _trace(self.__came, self.num_rows, top, u)[::-1].translate(_REVERSE)
+        codes += _trace(self.__came, self.num_rows, top, v)
+        return SolveResult.from_directions("tree", tuple(src), codes, len(codes) + 1)
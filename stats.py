@@ -0,0 +1,215 @@
+# ~*~ coding: utf-8 ~*~
+"""
+    File name           : stats.py
+    Author              : Derryn Edwards
+    Date Created        : 2026/10/18
+    Date Last Modified  : 2026/10/18
+    Python Version      : 3.11
+"""
+# ==================================================================================================
+# IMPORTS
+# ==================================================================================================
+from contextlib import contextmanager
+from grid import ALL_WALLS, DEGREE, LEFT, RIGHT, TOP, BOTTOM
+import time
+
+EVENTS = ("phase_start", "phase_end", "break", "move", "redraw")
+
+
+class MazeStats:
+    """
+    Counters, per-phase timers and callback hooks for profiling a Maze.
+
+    Pass an instance as Maze(stats=...) to collect them. Without one, Maze does no bookkeeping at
+    all. Counters are kept per phase, such as "generate" or "solve", and timers add up the wall
+    clock seconds of every phase, including "redraw" for the time spent redrawing the window.
+
+    Hooks are plain callables registered per event:
+
+    - "phase_start" : hook(phase)
+    - "phase_end" : hook(phase, seconds)
+    - "break" : hook(i, j, wall) for every wall the backtracker breaks
+    - "move" : hook(from_ij, to_ij, undo) for every solver move
+    - "redraw" : hook() for every redraw of the window
+
+    The per-step "break" and "move" events are only wired into generation and solving while a
+    hook listens to them.
+
+    Attributes
+    ----------
+    counters : dict
+        Maps a phase name to a dict of counter name to value.
+    timings : dict
+        Maps a phase name to the total seconds spent in it.
+
+    Methods
+    -------
+    add_hook(self, event, hook)
+        Registers a callable for one of EVENTS.
+    has_hooks(self, event)
+        Returns True if any hook listens to event.
+    emit(self, event, *args)
+        Calls every hook registered for event.
+    count(self, phase, name, amount=1)
+        Adds amount to a counter of phase.
+    phase(self, name)
+        Context manager timing one run of a phase.
+    total(self, name)
+        Returns a counter summed over every phase.
+    count_grid(self, phase, grid)
+        Counts the visited cells, broken walls and dead ends of a grid.
+    track_moves(self, phase, on_move=None)
+        Returns an on_move callback counting solver moves, backtracks and dead ends.
+    reset(self)
+        Clears every counter and timer, keeping the hooks.
+    as_dict(self)
+        Returns the counters and timings as plain dicts.
+    """
+
+    def __init__(self):
+        self.counters = {}
+        self.timings = {}
+        self.__hooks = {}
+
+    def add_hook(self, event, hook):
+        """
+        Registers a callable for one of EVENTS.
+
+        Parameters
+        ----------
+        event : str
+            Name of the event.
+        hook : callable
+            Called with the arguments of the event every time it happens.
+        """
+        if event not in EVENTS:
+            raise ValueError(f"unknown event {event!r}, expected one of: {', '.join(EVENTS)}")
+        self.__hooks.setdefault(event, []).append(hook)
+
+    def has_hooks(self, event):
+        """Returns True if any hook listens to event."""
+        return bool(self.__hooks.get(event))
+
+    def emit(self, event, *args):
+        """Calls every hook registered for event with args."""
+        for hook in self.__hooks.get(event, ()):
+            hook(*args)
+
+    def count(self, phase, name, amount=1):
+        """Adds amount to counter name of phase."""
+        counters = self.counters.setdefault(phase, {})
+        counters[name] = counters.get(name, 0) + amount
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Context manager timing one run of a phase and emitting phase_start and phase_end.
+
+        Parameters
+        ----------
+        name : str
+            Name of the phase, such as "generate" or "solve".
+        """
+        self.emit("phase_start", name)
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            seconds = time.perf_counter() - start
+            self.timings[name] = self.timings.get(name, 0.0) + seconds
+            self.emit("phase_end", name, seconds)
+
+    def total(self, name):
+        """Returns counter name summed over every phase."""
+        return sum(counters.get(name, 0) for counters in self.counters.values())
+
+    def count_grid(self, phase, grid):
+        """
+        Counts the visited cells, broken walls and dead ends of a grid after it was carved.
+
+        Works from a histogram of the wall bytes, so it costs a few scans of the grid instead of
+        a counter update on every step of the generator. Broken walls do not include the
+        entrance and exit, and dead ends are cells with a single open side.
+
+        Parameters
+        ----------
+        phase : str
+            Phase to add the counts to.
+        grid : WallGrid Object
+            Freshly carved grid, before its visited flags are reset.
+        """
+        walls = grid.walls
+        num_rows = grid.num_rows
+        histogram = [walls.count(value) for value in range(ALL_WALLS + 1)]
+        openings = sum(count * (4 - DEGREE[value]) for value, count in enumerate(histogram))
+        # openings through the outer wall, such as the entrance and exit, have no second side
+        border = (
+            sum(1 for cell in walls[:num_rows] if not cell & LEFT)
+            + sum(1 for cell in walls[len(walls) - num_rows:] if not cell & RIGHT)
+            + sum(1 for cell in walls[0::num_rows] if not cell & TOP)
+            + sum(1 for cell in walls[num_rows - 1::num_rows] if not cell & BOTTOM)
+        )
+        # vectorized generators carve every cell at once without marking them visited
+        self.count(phase, "cells_visited", grid.visited_count() or len(walls))
+        self.count(phase, "walls_broken", (openings - border) // 2)
+        self.count(
+            phase, "dead_ends",
+            sum(count for value, count in enumerate(histogram) if DEGREE[value] == 3)
+        )
+
+    def track_moves(self, phase, on_move=None):
+        """
+        Returns an on_move callback for a solver that counts its moves, backtracks and dead ends.
+
+        A dead end is a backtrack straight after a forward move. Every move is also emitted as a
+        "move" event and passed on to on_move.
+
+        Parameters
+        ----------
+        phase : str
+            Phase to add the counts to.
+        on_move : callable
+            Default: None
+            Callback to forward every move to, such as the one drawing it.
+        """
+        counters = self.counters.setdefault(phase, {})
+        for name in ("moves", "backtracks", "dead_ends"):
+            counters.setdefault(name, 0)
+        emit = self.emit if self.has_hooks("move") else None
+        advanced = False
+
+        def track(from_ij, to_ij, undo):
+            nonlocal advanced
+            if undo:
+                counters["backtracks"] += 1
+                if advanced:
+                    counters["dead_ends"] += 1
+                advanced = False
+            else:
+                counters["moves"] += 1
+                advanced = True
+            if emit is not None:
+                emit("move", from_ij, to_ij, undo)
+            if on_move is not None:
+                on_move(from_ij, to_ij, undo)
+
+        return track
+
+    def reset(self):
+        """Clears every counter and timer, keeping the hooks."""
+        self.counters.clear()
+        self.timings.clear()
+
+    def as_dict(self):
+        """Returns the counters and timings as plain dicts, ready for json.dump."""
+        return {
+            "counters": {phase: dict(counters) for phase, counters in self.counters.items()},
+            "timings": dict(self.timings),
+        }
+
+    def __repr__(self):
+        phases = ", ".join(
+            f"{phase}={self.timings.get(phase, 0.0):.4f}s {self.counters.get(phase, {})}"
+            for phase in dict.fromkeys([*self.timings, *self.counters])
+        )
+        return f"MazeStats({phases})"
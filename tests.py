@@ -3,14 +3,58 @@
     File name           : tests.py
     Author              : Derryn Edwards
     Date Created        : 2023/08/12
-    Date Last Modified  : 2023/08/12
+    Date Last Modified  : 2026/10/18
     Python Version      : 3.11
 """
 # ==================================================================================================
 # IMPORTS
 # ==================================================================================================
+import analytics
+import asyncio
+import os
+import random
+import tempfile
 import unittest
+import zlib
+import batch
+import benchmark
+from cache import MazeCache
+import generators
+import graphics
+import parallel
+import raster
+import solvers
+import tiled
+from grid import NeighborIndex, PackedWallGrid, WallGrid, ALL_WALLS, LEFT, RIGHT, TOP, BOTTOM
 from maze import Maze
+from solvers import PathIndex, SOLVERS, SolveResult, UNDO
+from stats import MazeStats
+
+
+class RecordingWindow:
+    """Stand-in for graphics.Window that records canvas items instead of opening Tk."""
+
+    def __init__(self):
+        self.items = {}
+        self.created = 0
+        self.redraws = 0
+
+    def create_line(self, coords, fill_color="black"):
+        self.created += 1
+        self.items[self.created] = [list(coords), fill_color]
+        return self.created
+
+    def move_line(self, item, coords):
+        self.items[item][0] = list(coords)
+
+    def recolor_line(self, item, fill_color):
+        self.items[item][1] = fill_color
+
+    def delete_line(self, item):
+        del self.items[item]
+
+    def redraw(self):
+        self.redraws += 1
 
 
 class Tests(unittest.TestCase):
@@ -64,6 +108,797 @@ class Tests(unittest.TestCase):
                     False,
                 )
 
+    def test_maze_break_walls_matches_recursive(self):
+        num_cols = 12
+        num_rows = 10
+        seed = 42
+        m1 = Maze(0, 0, num_rows, num_cols, 10, 10, seed=seed)
+
+        # reference: the original recursive carving, run on plain wall dictionaries
+        random.seed(seed)
+        walls = [[{"left": True, "right": True, "top": True, "bottom": True}
+                  for _ in range(num_rows)] for _ in range(num_cols)]
+        visited = [[False] * num_rows for _ in range(num_cols)]
+        walls[0][0]["top"] = False
+        walls[num_cols - 1][num_rows - 1]["bottom"] = False
+
+        def break_walls_r(i, j):
+            visited[i][j] = True
+            while True:
+                options = []
+                if i > 0 and not visited[i - 1][j]:
+                    options.append((i - 1, j, "left", "right"))
+                if i < num_cols - 1 and not visited[i + 1][j]:
+                    options.append((i + 1, j, "right", "left"))
+                if j > 0 and not visited[i][j - 1]:
+                    options.append((i, j - 1, "top", "bottom"))
+                if j < num_rows - 1 and not visited[i][j + 1]:
+                    options.append((i, j + 1, "bottom", "top"))
+                if not options:
+                    return
+                next_i, next_j, wall, opposite = options[random.randrange(len(options))]
+                walls[i][j][wall] = False
+                walls[next_i][next_j][opposite] = False
+                break_walls_r(next_i, next_j)
+
+        break_walls_r(0, 0)
+
+        for i, col in enumerate(m1.get_cells()):
+            for j, cell in enumerate(col):
+                self.assertEqual(
+                    (cell.has_left_wall, cell.has_right_wall, cell.has_top_wall,
+                     cell.has_bottom_wall),
+                    (walls[i][j]["left"], walls[i][j]["right"],
+                     walls[i][j]["top"], walls[i][j]["bottom"]),
+                )
+
+    def test_maze_break_walls_beyond_recursion_limit(self):
+        num_cols = 120
+        num_rows = 100
+        m1 = Maze(0, 0, num_rows, num_cols, 10, 10, seed=1)
+        open_walls = 0
+        for col in m1.get_cells():
+            for cell in col:
+                open_walls += (not cell.has_right_wall) + (not cell.has_bottom_wall)
+        # a perfect maze has exactly one passage less than it has cells, plus the exit
+        self.assertEqual(
+            open_walls,
+            num_cols * num_rows,
+        )
+
+    def test_maze_solve_all_algorithms(self):
+        num_cols = 16
+        num_rows = 12
+        m1 = Maze(0, 0, num_rows, num_cols, 10, 10, seed=3)
+        cells = m1.get_cells()
+        lengths = {}
+        for algorithm in SOLVERS:
+            result = m1.solve(algorithm)
+            self.assertTrue(result)
+            self.assertEqual(result.path[0], (0, 0))
+            self.assertEqual(result.path[-1], (num_cols - 1, num_rows - 1))
+            self.assertGreaterEqual(result.expanded, 1)
+            for (i, j), (next_i, next_j) in zip(result.path, result.path[1:]):
+                if next_i == i + 1:
+                    self.assertFalse(cells[i][j].has_right_wall)
+                elif next_i == i - 1:
+                    self.assertFalse(cells[i][j].has_left_wall)
+                elif next_j == j + 1:
+                    self.assertFalse(cells[i][j].has_bottom_wall)
+                else:
+                    self.assertEqual(next_j, j - 1)
+                    self.assertFalse(cells[i][j].has_top_wall)
+            lengths[algorithm] = len(result.path)
+        # a perfect maze has a single path between two cells
+        self.assertEqual(len(set(lengths.values())), 1)
+
+    def test_solve_result_packs_path(self):
+        path = [(0, 0), (1, 0), (1, 1), (0, 1), (0, 2), (1, 2)]
+        result = SolveResult("dfs", path, 6)
+        self.assertEqual(result.path, path)
+        self.assertEqual(list(result.cells()), path)
+        self.assertEqual(len(result), 6)
+        self.assertEqual(list(result.directions()), [1, 3, 0, 3, 1])
+        self.assertEqual(len(result.packed), 2)
+        self.assertFalse(SolveResult("dfs", [], 1))
+        # a single row maps flat index offsets of one to left and right moves
+        m1 = Maze(0, 0, 1, 9, 10, 10, seed=2)
+        for algorithm in SOLVERS:
+            self.assertEqual(m1.solve(algorithm).path, [(i, 0) for i in range(9)])
+        m2 = Maze(0, 0, 60, 60, 10, 10, seed=5)
+        result = m2.solve("bfs")
+        self.assertEqual(len(result.packed), (len(result) + 2) // 4)
+        for algorithm in SOLVERS:
+            self.assertEqual(m2.solve(algorithm).path, result.path)
+
+    def test_maze_shortest_path_queries(self):
+        num_cols = 14
+        num_rows = 11
+        rng = random.Random(6)
+        for generator in ("backtracker", "sidewinder"):
+            m1 = Maze(0, 0, num_rows, num_cols, 10, 10, seed=6, generator=generator)
+            for _ in range(50):
+                src = (rng.randrange(num_cols), rng.randrange(num_rows))
+                dst = (rng.randrange(num_cols), rng.randrange(num_rows))
+                expected = SOLVERS["bfs"](m1.get_grid(), src, dst)
+                self.assertEqual(m1.shortest_path(src, dst).path, expected.path)
+                self.assertEqual(m1.distance(src, dst), len(expected) - 1)
+        with self.assertRaises(ValueError):
+            m1.distance((0, 0), (num_cols, 0))
+
+        # an extra passage makes a cycle, so queries fall back to a search
+        grid = m1.get_grid().copy()
+        grid.break_wall(3, 3, RIGHT)
+        grid.break_wall(5, 7, BOTTOM)
+        m2 = Maze(0, 0, num_rows, num_cols, 10, 10, grid=grid)
+        for _ in range(20):
+            src = (rng.randrange(num_cols), rng.randrange(num_rows))
+            dst = (rng.randrange(num_cols), rng.randrange(num_rows))
+            expected = SOLVERS["bfs"](grid, src, dst)
+            self.assertEqual(m2.distance(src, dst), len(expected) - 1)
+
+    def test_deadend_solver_fills_to_solution(self):
+        start = (0, 0)
+        goal = (79, 59)
+        numpy = solvers.np
+        for generator in ("backtracker", "sidewinder"):
+            # large enough for the vectorized passes to run before the one by one filling
+            grid = generators.get_generator(generator)(80, 60, seed=4)
+            expected = SOLVERS["bfs"](grid, start, goal)
+            result = SOLVERS["deadend"](grid, start, goal)
+            self.assertEqual(result.path, expected.path)
+            self.assertEqual(result.expanded, 80 * 60)
+            try:
+                solvers.np = None
+                self.assertEqual(SOLVERS["deadend"](grid, start, goal).path, expected.path)
+            finally:
+                solvers.np = numpy
+
+        # loops survive the filling, so the solver falls back to a search
+        for i in range(1, 79, 7):
+            grid.break_wall(i, 30, BOTTOM)
+        expected = SOLVERS["bfs"](grid, start, goal)
+        self.assertEqual(len(SOLVERS["deadend"](grid, start, goal)), len(expected))
+        # the corridor is walked step by step, and a walk stopped by a loop is undone
+        self.assertIn("deadend", solvers.SEARCHES)
+        moves = []
+        result = SOLVERS["deadend"](grid, start, goal, lambda *move: moves.append(move))
+        undone = sum(1 for _, _, undo in moves if undo)
+        self.assertGreater(undone, 0)
+        self.assertEqual(len(moves), 2 * undone + len(result) - 1)
+        self.assertEqual([to_ij for _, to_ij, _ in moves[2 * undone:]], result.path[1:])
+        self.assertFalse(SOLVERS["deadend"](WallGrid(5, 4), (0, 0), (4, 3)))
+
+    def test_maze_path_queries_see_wall_changes(self):
+        m1 = Maze(0, 0, 10, 10, 10, 10, seed=5)
+        before = m1.distance((0, 0), (9, 9))
+        self.assertEqual(before, len(m1.solve("bfs")) - 1)
+        # open a corridor along the top row and down the last column
+        cells = m1.get_cells()
+        for i in range(9):
+            cells[i][0].has_right_wall = False
+            cells[i + 1][0].has_left_wall = False
+        for j in range(9):
+            cells[9][j].has_bottom_wall = False
+            cells[9][j + 1].has_top_wall = False
+        self.assertEqual(m1.distance((0, 0), (9, 9)), 18)
+        self.assertEqual(len(m1.shortest_path((0, 0), (9, 9))), 19)
+
+        m2 = Maze(0, 0, 10, 10, 10, 10, seed=5)
+        m2.distance((0, 0), (9, 9))
+        for i in range(9):
+            m2.get_grid().break_wall(i, 0, RIGHT)
+        for j in range(9):
+            m2.get_grid().break_wall(9, j, BOTTOM)
+        self.assertEqual(m2.distance((0, 0), (9, 9)), len(m2.solve("bfs")) - 1)
+        self.assertEqual(m2.distance((0, 0), (9, 9)), 18)
+
+    def test_maze_solve_unknown_algorithm(self):
+        m1 = Maze(0, 0, 10, 12, 10, 10)
+        with self.assertRaises(ValueError):
+            m1.solve("teleport")
+
+    def test_maze_storage_is_deprecated(self):
+        num_cols = 16
+        num_rows = 12
+        m1 = Maze(0, 0, num_rows, num_cols, 10, 10, seed=5)
+        with self.assertWarns(DeprecationWarning):
+            m2 = Maze(0, 0, num_rows, num_cols, 10, 10, seed=5, storage="compact")
+        for col1, col2 in zip(m1.get_cells(), m2.get_cells()):
+            for cell1, cell2 in zip(col1, col2):
+                self.assertEqual(
+                    (cell1.has_left_wall, cell1.has_right_wall, cell1.has_top_wall,
+                     cell1.has_bottom_wall, cell1.visited),
+                    (cell2.has_left_wall, cell2.has_right_wall, cell2.has_top_wall,
+                     cell2.has_bottom_wall, cell2.visited),
+                )
+        self.assertEqual(m1.solve("bfs").path, m2.solve("bfs").path)
+
+    def test_maze_cell_views_write_through(self):
+        m1 = Maze(0, 0, 10, 12, 10, 10, seed=5)
+        m1.get_cells()[3][4].has_left_wall = False
+        m1.get_cells()[3][4].visited = True
+        self.assertFalse(m1.get_cells()[3][4].has_left_wall)
+        self.assertTrue(m1.get_cells()[3][4].visited)
+        self.assertFalse(m1.get_grid().has_wall(3, 4, LEFT))
+        self.assertTrue(m1.get_grid().is_visited(3 * 10 + 4))
+
+        # walling in the exit through the cells leaves the solvers without a way out
+        cell = m1.get_cells()[11][9]
+        cell.has_left_wall = cell.has_top_wall = True
+        m1.get_cells()[10][9].has_right_wall = True
+        m1.get_cells()[11][8].has_bottom_wall = True
+        self.assertFalse(m1.solve("bfs"))
+
+    def test_maze_cell_views_draw_like_cells(self):
+        win = RecordingWindow()
+        m1 = Maze(0, 0, 10, 12, 10, 10, win, seed=5, animation_delay=0)
+        cells = m1.get_cells()
+        i = next(i for i in range(11) if not cells[i][4].has_right_wall)
+        x = 10 * (i + 1)
+
+        def right_wall_drawn():
+            return any(
+                coords[0] == coords[2] == x and coords[1] <= 40 and coords[3] >= 50
+                for coords, _ in win.items.values()
+            )
+
+        self.assertFalse(right_wall_drawn())
+        cell = cells[i][4]
+        cell.has_right_wall = True
+        cell.draw(0, 0, 10, 10)
+        self.assertTrue(right_wall_drawn())
+        cell.draw_move(cells[i + 1][4], undo=True)
+        self.assertEqual(
+            win.items[win.created], [[10 * i + 5, 45, 10 * i + 15, 45], "blue"]
+        )
+        # headless views have nothing to draw on
+        Maze(0, 0, 10, 12, 10, 10, seed=5).get_cells()[0][0].draw_move(cells[1][0])
+
+    def test_maze_get_cells_is_lazy(self):
+        num_cols, num_rows = 12, 10
+        m1 = Maze(0, 0, num_rows, num_cols, 10, 10, seed=5)
+        cells = m1.get_cells()
+        self.assertIs(m1.get_cells(), cells)
+        self.assertEqual((len(cells), len(cells[0])), (num_cols, num_rows))
+        cell = cells[3][4]
+        # a live view is handed out again, and negative indices count from the end
+        self.assertIs(cells[3][4], cell)
+        self.assertIs(cells[-1][-1], cells[num_cols - 1][num_rows - 1])
+        self.assertEqual(len(cells[2:5]), 3)
+        with self.assertRaises(IndexError):
+            cells[num_cols]
+        with self.assertRaises(IndexError):
+            cells[0][num_rows]
+        self.assertEqual(sum(1 for col in cells for _ in col), num_cols * num_rows)
+
+    def test_maze_renderer_merges_walls(self):
+        num_cols = 12
+        num_rows = 10
+        win = RecordingWindow()
+        m1 = Maze(0, 0, num_rows, num_cols, 10, 10, win, seed=5, animation_delay=0)
+        wall_length = 0
+        for i, col in enumerate(m1.get_cells()):
+            for j, cell in enumerate(col):
+                wall_length += 10 * (cell.has_right_wall + cell.has_bottom_wall)
+                if i == 0:
+                    wall_length += 10 * cell.has_left_wall
+                if j == 0:
+                    wall_length += 10 * cell.has_top_wall
+        drawn_length = 0
+        for (x1, y1, x2, y2), fill_color in win.items.values():
+            self.assertEqual(fill_color, "black")
+            self.assertTrue(x1 == x2 or y1 == y2)
+            drawn_length += abs(x2 - x1) + abs(y2 - y1)
+        self.assertEqual(drawn_length, wall_length)
+        # merged runs need far fewer items than one per wall segment
+        self.assertLess(len(win.items), wall_length / 10)
+
+    def test_maze_renderer_reuses_move_items(self):
+        win = RecordingWindow()
+        m1 = Maze(0, 0, 10, 12, 10, 10, win, seed=5, animation_delay=0)
+        before = len(win.items)
+        result = m1.solve("dfs")
+        moves = [item for item in win.items.values() if item[1] != "black"]
+        self.assertEqual(len(win.items) - before, len(moves))
+        self.assertEqual(sum(1 for _, fill_color in moves if fill_color == "red"),
+                         len(result.path) - 1)
+
+    def test_maze_steps_per_frame_batches_redraws(self):
+        num_cols = 12
+        num_rows = 10
+        win1 = RecordingWindow()
+        Maze(0, 0, num_rows, num_cols, 10, 10, win1, seed=5, animation_delay=0)
+        win2 = RecordingWindow()
+        Maze(0, 0, num_rows, num_cols, 10, 10, win2, seed=5, animation_delay=0, steps_per_frame=10)
+        # batched frames may reuse different items, but draw the same lines
+        self.assertEqual(sorted(win1.items.values()), sorted(win2.items.values()))
+        self.assertLessEqual(win2.redraws, win1.redraws // 10 + 2)
+
+    def test_maze_renderer_flushes_queued_changes_once(self):
+        grid = WallGrid(6, 4)
+        win = RecordingWindow()
+        renderer = graphics.MazeRenderer(win, grid, 0, 0, 10, 10)
+        renderer.draw_walls()
+        created = win.created
+
+        # three breaks on the same grid line and one elsewhere are applied as two line updates
+        for i in range(3):
+            grid.break_wall(i, 1, BOTTOM)
+            renderer.queue_wall(i, 1, BOTTOM)
+        grid.break_wall(5, 3, RIGHT)
+        renderer.queue_wall(5, 3, RIGHT)
+        self.assertEqual(win.created, created)
+        self.assertEqual(renderer.flush(), 2)
+        self.assertEqual(renderer.flush(), 0)
+        self.assertIn([[30, 20, 60, 20], "black"], win.items.values())
+
+        # a move drawn and backtracked in the same frame is created once, already blue
+        renderer.queue_move((0, 0), (0, 1))
+        renderer.queue_move((0, 0), (0, 1), undo=True)
+        self.assertEqual(renderer.flush(), 1)
+        self.assertEqual(win.created, created + 1)
+        self.assertEqual(win.items[win.created][1], "blue")
+
+    def test_maze_headless_solve_matches_windowed(self):
+        win = RecordingWindow()
+        m1 = Maze(0, 0, 10, 12, 10, 10, win, seed=5, animation_delay=0)
+        m2 = Maze(0, 0, 10, 12, 10, 10, seed=5)
+        self.assertEqual(m1.solve().path, m2.solve().path)
+        self.assertGreater(len(win.items), 0)
+
+    @unittest.skipIf(generators.np is None, "NumPy is not installed")
+    def test_vectorized_generators_make_perfect_mazes(self):
+        num_cols = 40
+        num_rows = 30
+        for name in generators.GENERATORS:
+            grid = generators.get_generator(name)(num_cols, num_rows, seed=11)
+            self.assertEqual(
+                bytes(grid.walls),
+                bytes(generators.get_generator(name)(num_cols, num_rows, seed=11).walls),
+            )
+            passages = 0
+            for i in range(num_cols):
+                for j in range(num_rows):
+                    walls = grid.walls[grid.index(i, j)]
+                    if i == 0:
+                        self.assertTrue(walls & LEFT)
+                    if i == num_cols - 1:
+                        self.assertTrue(walls & RIGHT)
+                    else:
+                        self.assertEqual(bool(walls & RIGHT), grid.has_wall(i + 1, j, LEFT))
+                        passages += not walls & RIGHT
+                    if j == 0:
+                        self.assertTrue(walls & TOP)
+                    if j == num_rows - 1:
+                        self.assertTrue(walls & BOTTOM)
+                    else:
+                        self.assertEqual(bool(walls & BOTTOM), grid.has_wall(i, j + 1, TOP))
+                        passages += not walls & BOTTOM
+            self.assertEqual(passages, num_cols * num_rows - 1)
+
+            # n - 1 passages and every cell reachable means the maze is a spanning tree
+            seen = {(0, 0)}
+            stack = [(0, 0)]
+            while stack:
+                i, j = stack.pop()
+                for wall, (next_i, next_j) in ((RIGHT, (i + 1, j)), (LEFT, (i - 1, j)),
+                                               (BOTTOM, (i, j + 1)), (TOP, (i, j - 1))):
+                    if (0 <= next_i < num_cols and 0 <= next_j < num_rows
+                            and not grid.has_wall(i, j, wall) and (next_i, next_j) not in seen):
+                        seen.add((next_i, next_j))
+                        stack.append((next_i, next_j))
+            self.assertEqual(len(seen), num_cols * num_rows)
+
+            m1 = Maze(0, 0, num_rows, num_cols, 10, 10, seed=11, generator=name)
+            self.assertTrue(m1.solve("bfs"))
+
+    def test_maze_unknown_generator(self):
+        with self.assertRaises(ValueError):
+            Maze(0, 0, 10, 12, 10, 10, generator="teleport")
+
+    def test_grid_to_bytes_round_trip(self):
+        for num_cols, num_rows in ((12, 10), (7, 3), (1, 1)):
+            grid = generators.backtracker(num_cols, num_rows, seed=2)
+            data = grid.to_bytes()
+            self.assertEqual(len(data), (num_cols * num_rows + 1) // 2)
+            self.assertEqual(WallGrid.from_bytes(num_cols, num_rows, data).walls, grid.walls)
+
+    def test_batch_generate_and_solve_many(self):
+        specs = [(10, 12, seed) for seed in range(1, 7)]
+        generated = list(batch.generate_many(specs, workers=2, chunksize=2))
+        self.assertEqual([spec for spec, _ in generated], [batch.MazeSpec(*spec) for spec in specs])
+        for spec, data in generated:
+            m1 = Maze(0, 0, spec.num_rows, spec.num_cols, 10, 10, seed=spec.seed)
+            grid = WallGrid.from_bytes(spec.num_cols, spec.num_rows, data)
+            for i, col in enumerate(m1.get_cells()):
+                for j, cell in enumerate(col):
+                    self.assertEqual(cell.has_right_wall, grid.has_wall(i, j, RIGHT))
+                    self.assertEqual(cell.has_bottom_wall, grid.has_wall(i, j, BOTTOM))
+
+        from_specs = list(batch.solve_many(specs, workers=0))
+        from_grids = list(batch.solve_many(generated, workers=2, chunksize=4))
+        self.assertEqual(len(from_specs), len(specs))
+        for (spec1, result1), (spec2, result2) in zip(from_specs, from_grids):
+            self.assertEqual(spec1, spec2)
+            self.assertEqual(result1.path, result2.path)
+            self.assertTrue(result1)
+
+    def test_maze_seed_zero_is_deterministic(self):
+        m1 = Maze(0, 0, 10, 12, 10, 10, seed=0)
+        m2 = Maze(0, 0, 10, 12, 10, 10, seed=0)
+        self.assertEqual(m1.solve("bfs").path, m2.solve("bfs").path)
+        self.assertEqual(
+            [[cell.has_right_wall for cell in col] for col in m1.get_cells()],
+            [[cell.has_right_wall for cell in col] for col in m2.get_cells()],
+        )
+
+    def test_maze_leaves_global_random_alone(self):
+        random.seed(9)
+        expected = random.random()
+        random.seed(9)
+        Maze(0, 0, 10, 12, 10, 10, seed=1)
+        self.assertEqual(random.random(), expected)
+
+    def test_maze_bulk_random_is_deterministic(self):
+        m1 = Maze(0, 0, 30, 40, 10, 10, rng=generators.BulkRandom(4))
+        m2 = Maze(0, 0, 30, 40, 10, 10, rng=generators.BulkRandom(4))
+        self.assertEqual(m1.solve("dfs").path, m2.solve("dfs").path)
+        self.assertEqual(len(m1.solve("dfs").path), len(m1.solve("bfs").path))
+
+    def test_maze_save_and_load(self):
+        num_cols = 13
+        num_rows = 9
+        m1 = Maze(0, 0, num_rows, num_cols, 10, 10, seed=8)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "maze.bin")
+            m1.save(path)
+            self.assertEqual(os.path.getsize(path), 16 + (num_cols * num_rows + 1) // 2)
+            m2 = Maze.load(path)
+            self.assertEqual(len(m2.get_cells()), num_cols)
+            for col1, col2 in zip(m1.get_cells(), m2.get_cells()):
+                for cell1, cell2 in zip(col1, col2):
+                    self.assertEqual(
+                        (cell1.has_left_wall, cell1.has_right_wall, cell1.has_top_wall,
+                         cell1.has_bottom_wall),
+                        (cell2.has_left_wall, cell2.has_right_wall, cell2.has_top_wall,
+                         cell2.has_bottom_wall),
+                    )
+            for algorithm in SOLVERS:
+                self.assertEqual(m1.solve(algorithm).path, m2.solve(algorithm).path)
+            # visited stamps are only allocated once a cell is marked
+            grid = m2.get_grid()
+            self.assertIsNone(grid.stamps)
+            self.assertFalse(m2.get_cells()[2][3].visited)
+            grid.reset_visited()
+            self.assertIsNone(grid.stamps)
+            m2.get_cells()[2][3].visited = True
+            self.assertTrue(grid.is_visited(2 * num_rows + 3))
+            self.assertEqual(grid.visited_count(), 1)
+            with self.assertRaises(TypeError):
+                m2.get_cells()[0][0].has_left_wall = False
+
+            m3 = Maze.load(path)
+            self.assertFalse(m3.get_cells()[num_cols - 1][num_rows - 1].has_bottom_wall)
+            # release the memory maps before the directory is removed
+            del m2, m3
+
+    def test_maze_load_rejects_other_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "maze.bin")
+            with open(path, "wb") as file:
+                file.write(b"not a maze file at all")
+            with self.assertRaises(ValueError):
+                Maze.load(path)
+
+    def test_tiled_generation_writes_perfect_maze(self):
+        num_cols, num_rows = 23, 17
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "tiled.maze")
+            tiles = []
+            tiled.generate_tiled(path, num_rows, num_cols, seed=2, tile_size=6,
+                                 on_tile=lambda ti, tj: tiles.append((ti, tj)))
+            self.assertEqual(len(tiles), 4 * 3)
+            m1 = Maze.load(path)
+            grid = m1.get_grid()
+            self.assertFalse(grid.has_wall(0, 0, TOP))
+            self.assertFalse(grid.has_wall(num_cols - 1, num_rows - 1, BOTTOM))
+            # every cell is reachable and there are no loops across the tile borders
+            self.assertTrue(PathIndex(grid).is_tree)
+            self.assertTrue(m1.solve("bfs"))
+
+            again = os.path.join(directory, "again.maze")
+            tiled.generate_tiled(again, num_rows, num_cols, seed=2, tile_size=6)
+            with open(path, "rb") as file1, open(again, "rb") as file2:
+                self.assertEqual(file1.read(), file2.read())
+
+    def test_parallel_generation_stitches_regions(self):
+        num_cols, num_rows = 29, 19
+        grid1 = parallel.generate_parallel(num_cols, num_rows, seed=4, workers=0, region_size=7)
+        grid2 = parallel.generate_parallel(num_cols, num_rows, seed=4, workers=2, region_size=7)
+        self.assertEqual(grid1.walls, grid2.walls)
+        # one passage less than there are cells, all of them connected
+        self.assertTrue(PathIndex(grid1).is_tree)
+        m1 = Maze(0, 0, num_rows, num_cols, 10, 10, grid=grid1)
+        self.assertEqual(m1.distance((0, 0), (0, 0)), 0)
+        self.assertIsNotNone(m1.distance((0, 0), (num_cols - 1, num_rows - 1)))
+
+    def test_analytics_measures_topology(self):
+        num_cols, num_rows = 15, 11
+        m1 = Maze(0, 0, num_rows, num_cols, 10, 10, seed=8)
+        report = analytics.analyze(m1.get_grid())
+        self.assertTrue(report.is_perfect)
+        self.assertEqual(sum(report.degrees), num_cols * num_rows)
+        self.assertEqual(report.dead_ends, report.degrees[1])
+        # the corridors of a tree hold every passage exactly once
+        self.assertEqual(
+            sum(length * count for length, count in report.corridors.items()),
+            num_cols * num_rows - 1,
+        )
+        self.assertEqual(report.solution_length, len(m1.solve("bfs")) - 1)
+        # no cell lies further from either end of the diameter than the other end
+        cells = [(i, j) for i in range(num_cols) for j in range(num_rows)]
+        for end in report.diameter_ends:
+            self.assertEqual(max(m1.distance(end, cell) for cell in cells), report.diameter)
+
+        specs = [(6, 7, seed) for seed in range(5)]
+        reports = list(batch.analyze_many(specs, workers=0))
+        self.assertEqual([spec.seed for spec, _ in reports], list(range(5)))
+        self.assertEqual(
+            reports[2][1].as_dict(), analytics.analyze(batch.build_grid(specs[2])).as_dict()
+        )
+
+    def test_maze_cache_hits_and_evictions(self):
+        cache = MazeCache()
+        result1 = cache.solve(10, 12, 4, "bfs")
+        result2 = cache.solve(10, 12, 4, "bfs")
+        self.assertIs(result1, result2)
+        self.assertEqual(result1.path, Maze(0, 0, 10, 12, 10, 10, seed=4).solve("bfs").path)
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+        # a maze handed out by the cache owns a copy of the cached grid
+        m1 = cache.maze(10, 12, 4)
+        m1.get_grid().break_wall(0, 0, LEFT)
+        self.assertFalse(m1.get_grid().has_wall(0, 0, LEFT))
+        self.assertTrue(cache.get_grid(10, 12, 4).has_wall(0, 0, LEFT))
+
+        small = MazeCache(max_bytes=300)
+        for seed in range(1, 6):
+            small.get_grid(10, 12, seed)
+        self.assertLessEqual(small.size, 300)
+        self.assertEqual(small.evictions, 4)
+        self.assertEqual(len(small), 1)
+
+    def test_maze_cache_on_disk(self):
+        with tempfile.TemporaryDirectory() as directory:
+            MazeCache(directory=directory).get_grid(10, 12, 4)
+            self.assertEqual(len(os.listdir(directory)), 1)
+            cache = MazeCache(directory=directory)
+            grid = cache.get_grid(10, 12, 4)
+            self.assertEqual(grid.to_bytes(), batch.build_grid((10, 12, 4)).to_bytes())
+            del grid
+            cache.clear()
+
+    def test_benchmark_run_and_compare(self):
+        results = benchmark.run([10, 20], algorithms=["bfs"])
+        self.assertEqual(
+            [(row["size"], row["metric"]) for row in results],
+            [(size, metric) for size in (10, 20)
+             for metric in ("generate", "solve:bfs", "render", "memory:generate")],
+        )
+        self.assertGreater(results[-1]["peak_bytes"], 0)
+        self.assertEqual(benchmark.compare(results, results), [])
+
+        slower = [dict(row, seconds=row["seconds"] * 2, peak_bytes=row["peak_bytes"] and
+                       row["peak_bytes"] * 2) for row in results]
+        regressions = benchmark.compare(slower, results, threshold=0.5)
+        self.assertEqual(
+            sorted((row["metric"], field) for row, field, _ in regressions if row["size"] == 10),
+            [("generate", "seconds"), ("memory:generate", "peak_bytes"), ("render", "seconds"),
+             ("solve:bfs", "seconds")],
+        )
+
+    def test_maze_stats_counters_and_hooks(self):
+        num_cols, num_rows = 12, 10
+        stats = MazeStats()
+        events = []
+        stats.add_hook("phase_end", lambda phase, seconds: events.append(phase))
+        breaks = []
+        stats.add_hook("break", lambda i, j, wall: breaks.append((i, j, wall)))
+        m1 = Maze(0, 0, num_rows, num_cols, 10, 10, seed=5, stats=stats)
+        result = m1.solve("dfs")
+
+        self.assertIs(m1.get_stats(), stats)
+        self.assertEqual(events, ["generate", "solve"])
+        generate = stats.counters["generate"]
+        self.assertEqual(generate["cells_visited"], num_cols * num_rows)
+        # a perfect maze breaks one wall less than it has cells
+        self.assertEqual(generate["walls_broken"], num_cols * num_rows - 1)
+        self.assertEqual(len(breaks), num_cols * num_rows - 1)
+        self.assertGreater(generate["dead_ends"], 0)
+        solve = stats.counters["solve"]
+        self.assertEqual(solve["cells_visited"], result.expanded)
+        self.assertEqual(solve["moves"], result.expanded - 1)
+        self.assertEqual(solve["moves"] - solve["backtracks"], len(result.path) - 1)
+        self.assertLessEqual(solve["dead_ends"], solve["backtracks"])
+        self.assertEqual(set(stats.timings), {"generate", "solve"})
+
+        # profiling must not change the maze
+        m2 = Maze(0, 0, num_rows, num_cols, 10, 10, seed=5)
+        self.assertEqual(m1.get_grid().walls, m2.get_grid().walls)
+        self.assertIsNone(m2.get_stats())
+
+        win = RecordingWindow()
+        stats = MazeStats()
+        Maze(0, 0, 4, 4, 10, 10, win, seed=5, animation_delay=0, stats=stats).solve()
+        self.assertEqual(stats.counters["redraw"]["redraws"], win.redraws)
+
+    def test_maze_iter_generate_streams_walls(self):
+        num_cols, num_rows = 12, 10
+        eager = Maze(0, 0, num_rows, num_cols, 10, 10, seed=3)
+        lazy = Maze(0, 0, num_rows, num_cols, 10, 10, seed=3, generate=False)
+        self.assertTrue(all(cell.has_right_wall for col in lazy.get_cells() for cell in col))
+
+        events = lazy.iter_generate()
+        first = [next(events) for _ in range(5)]
+        self.assertEqual(first[:2], [(0, 0, TOP), (num_cols - 1, num_rows - 1, BOTTOM)])
+        rest = list(events)
+        # entrance, exit and one wall less than there are cells
+        self.assertEqual(len(first) + len(rest), 2 + num_cols * num_rows - 1)
+        self.assertEqual(lazy.get_grid().walls, eager.get_grid().walls)
+        self.assertEqual(
+            lazy.get_cells()[3][4].has_left_wall, eager.get_cells()[3][4].has_left_wall
+        )
+        with self.assertRaises(RuntimeError):
+            lazy.iter_generate()
+
+        # stopping early leaves a partially carved maze
+        partial = Maze(0, 0, num_rows, num_cols, 10, 10, seed=3, generate=False)
+        events = partial.iter_generate()
+        for _ in range(10):
+            next(events)
+        events.close()
+        self.assertNotEqual(partial.get_grid().walls, eager.get_grid().walls)
+
+    def test_maze_async_animation_shares_event_loop(self):
+        num_cols, num_rows = 8, 6
+        eager = Maze(0, 0, num_rows, num_cols, 10, 10, seed=3)
+        win = RecordingWindow()
+        lazy = Maze(
+            0, 0, num_rows, num_cols, 10, 10, win, seed=3, animation_delay=0.001,
+            steps_per_frame=4, generate=False
+        )
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(win.redraws)
+                await asyncio.sleep(0)
+
+        async def run():
+            task = asyncio.create_task(ticker())
+            await lazy.generate_async()
+            result = await lazy.solve_async("bfs")
+            task.cancel()
+            return result
+
+        result = asyncio.run(run())
+        self.assertEqual(lazy.get_grid().walls, eager.get_grid().walls)
+        self.assertEqual(result.path, eager.solve("bfs").path)
+        # the other task kept running between frames
+        self.assertGreater(len(set(ticks)), 5)
+
+    def test_maze_iter_solve_streams_moves(self):
+        m1 = Maze(0, 0, 10, 12, 10, 10, seed=3)
+        for algorithm in SOLVERS:
+            events = m1.iter_solve(algorithm)
+            moves = []
+            while True:
+                try:
+                    moves.append(next(events))
+                except StopIteration as stop:
+                    result = stop.value
+                    break
+            self.assertEqual(result.path, m1.solve(algorithm).path)
+            self.assertTrue(all(m1.get_grid().walls[i * 10 + j] & (move & ~UNDO) == 0
+                                for i, j, move in moves))
+
+        # the same moves reach the window as with solve()
+        win1 = RecordingWindow()
+        win2 = RecordingWindow()
+        Maze(0, 0, 5, 5, 10, 10, win1, seed=3, animation_delay=0).solve()
+        for _ in Maze(0, 0, 5, 5, 10, 10, win2, seed=3, animation_delay=0).iter_solve():
+            pass
+        self.assertEqual(win1.items, win2.items)
+
+    def test_grid_reset_visited_moves_to_next_epoch(self):
+        grid = WallGrid(6, 5)
+        grid.mark_visited(3)
+        grid.mark_visited(7)
+        self.assertTrue(grid.is_visited(3))
+        self.assertEqual(grid.visited_count(), 2)
+        stamps = grid.stamps
+        for _ in range(300):
+            grid.reset_visited()
+            self.assertFalse(grid.is_visited(3))
+            self.assertEqual(grid.visited_count(), 0)
+            grid.mark_visited(7)
+        # the stamps are cleared in place when the epoch wraps around
+        self.assertIs(grid.stamps, stamps)
+        self.assertTrue(grid.is_visited(7))
+        self.assertTrue(1 <= grid.epoch <= 255)
+
+    def test_neighbor_index_matches_walls(self):
+        num_cols, num_rows = 9, 7
+        m1 = Maze(0, 0, num_rows, num_cols, 10, 10, seed=8)
+        index = NeighborIndex(m1.get_grid())
+        cells = m1.get_cells()
+        for i in range(num_cols):
+            for j in range(num_rows):
+                cell = cells[i][j]
+                expected = []
+                if i > 0 and not cell.has_left_wall:
+                    expected.append((i - 1) * num_rows + j)
+                if i < num_cols - 1 and not cell.has_right_wall:
+                    expected.append((i + 1) * num_rows + j)
+                if j > 0 and not cell.has_top_wall:
+                    expected.append(i * num_rows + j - 1)
+                if j < num_rows - 1 and not cell.has_bottom_wall:
+                    expected.append(i * num_rows + j + 1)
+                self.assertEqual(index.neighbors(i * num_rows + j), expected)
+
+        # the entrance and exit do not lead off the grid
+        self.assertFalse(index.passages[0] & TOP)
+        self.assertFalse(index.passages[-1] & BOTTOM)
+
+    def test_neighbor_index_decodes_packed_walls(self):
+        # an odd number of cells packing into more than one decoded chunk
+        grid = WallGrid(1501, 1401)
+        grid.walls[:] = bytes(n & ALL_WALLS for n in os.urandom(len(grid)))
+        packed = PackedWallGrid(1501, 1401, b"head" + grid.to_bytes(), 4)
+        self.assertEqual(packed.walls.translate(None), grid.walls)
+        self.assertEqual(NeighborIndex(packed).passages, NeighborIndex(grid).passages)
+
+    @unittest.skipIf(raster.np is None, "NumPy is not installed")
+    def test_raster_numpy_matches_python_renderer(self):
+        m1 = Maze(0, 0, 7, 9, 10, 10, seed=3)
+        path = m1.solve().path
+        for cell_size, line_width in ((1, 1), (5, 1), (6, 2)):
+            width, height, pixels = raster.render_grid(
+                m1.get_grid(), cell_size, solution=path, line_width=line_width
+            )
+            self.assertEqual(len(pixels), 3 * width * height)
+            self.assertEqual(pixels, raster._render_grid_python(
+                m1.get_grid(), width, height, cell_size, cell_size, path, line_width
+            ))
+
+    def test_raster_window_saves_ppm_and_png(self):
+        win = raster.RasterWindow(60, 50)
+        m1 = Maze(5, 5, 4, 5, 10, 10, win, seed=3, animation_delay=0)
+        m1.solve()
+        pixels = win.render()
+        # walls are black and the solution path red
+        self.assertIn(bytes(raster.COLORS["black"]), pixels)
+        self.assertIn(bytes(raster.COLORS["red"]), pixels)
+
+        with tempfile.TemporaryDirectory() as directory:
+            ppm = os.path.join(directory, "maze.ppm")
+            png = os.path.join(directory, "maze.png")
+            win.save(ppm)
+            win.save(png)
+            with open(ppm, "rb") as file:
+                self.assertEqual(file.read(), b"P6\n60 50\n255\n" + pixels)
+            with open(png, "rb") as file:
+                data = file.read()
+            self.assertEqual(data[:8], b"\x89PNG\r\n\x1a\n")
+            idat = data.index(b"IDAT")
+            size = int.from_bytes(data[idat - 4:idat], "big")
+            rows = zlib.decompress(data[idat + 4:idat + 4 + size])
+            self.assertEqual(rows[1:181], pixels[:180])
+
+            m1.save_image(png, cell_size=3, solution=m1.solve())
+            self.assertTrue(os.path.getsize(png) > 0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,163 @@
+# ~*~ coding: utf-8 ~*~
+"""
+    File name           : tiled.py
+    Author              : Derryn Edwards
+    Date Created        : 2026/10/18
+    Date Last Modified  : 2026/10/18
+    Python Version      : 3.11
+"""
+# ==================================================================================================
+# IMPORTS
+# ==================================================================================================
+import argparse
+import random
+import time
+from generators import backtracker, carve_backtracker
+from grid import GridFileWriter, WallGrid, LEFT, RIGHT, TOP, BOTTOM
+
+DEFAULT_TILE_SIZE = 1024
+
+
+def _door(seed, ti, tj, wall, length):
+    """
+    Returns the position of the passage through the wall of tile (ti, tj) facing its RIGHT or
+    BOTTOM neighbour. Both tiles derive it from the seed alone, so they agree without sharing
+    any state.
+    """
+    return random.Random(f"{seed}:{ti}:{tj}:{wall}").randrange(length)
+
+
+def carve_tile(layout, seed, ti, tj, tile_size, num_cols, num_rows):
+    """
+    Carves one tile of a tiled maze as a perfect maze of its own, with a single passage through
+    every border that layout connects.
+
+    Parameters
+    ----------
+    layout : WallGrid Object
+        Perfect maze with one cell per tile; a missing wall between two tiles means their mazes
+        are joined.
+    seed : int
+        Seed of the whole maze.
+    ti : int
+        Column of the tile.
+    tj : int
+        Row of the tile.
+    tile_size : int
+        Number of columns and rows of a full tile.
+    num_cols : int
+        Number of columns of the whole maze.
+    num_rows : int
+        Number of rows of the whole maze.
+
+    Returns
+    -------
+    WallGrid
+        Walls of the tile, with the tiles on the last column and row cut to the maze size.
+    """
+    i0 = ti * tile_size
+    j0 = tj * tile_size
+    cols = min(tile_size, num_cols - i0)
+    rows = min(tile_size, num_rows - j0)
+    tile = WallGrid(cols, rows)
+    carve_backtracker(tile, 0, 0, random.Random(f"{seed}:{ti}:{tj}"))
+
+    # a tree of trees joined by single passages is still a tree
+    if ti > 0 and not layout.has_wall(ti, tj, LEFT):
+        tile.break_wall(0, _door(seed, ti - 1, tj, RIGHT, rows), LEFT)
+    if ti < layout.num_cols - 1 and not layout.has_wall(ti, tj, RIGHT):
+        tile.break_wall(cols - 1, _door(seed, ti, tj, RIGHT, rows), RIGHT)
+    if tj > 0 and not layout.has_wall(ti, tj, TOP):
+        tile.break_wall(_door(seed, ti, tj - 1, BOTTOM, cols), 0, TOP)
+    if tj < layout.num_rows - 1 and not layout.has_wall(ti, tj, BOTTOM):
+        tile.break_wall(_door(seed, ti, tj, BOTTOM, cols), rows - 1, BOTTOM)
+
+    # entrance and exit, like Maze
+    if i0 == 0 and j0 == 0:
+        tile.break_wall(0, 0, TOP)
+    if i0 + cols == num_cols and j0 + rows == num_rows:
+        tile.break_wall(cols - 1, rows - 1, BOTTOM)
+    return tile
+
+
+def generate_tiled(path, num_rows, num_cols, seed=None, tile_size=DEFAULT_TILE_SIZE, on_tile=None):
+    """
+    Generates a perfect maze one tile at a time and streams every tile to a maze file.
+
+    Every tile is carved by the backtracker as a maze of its own. The tiles are joined along a
+    random spanning tree of the tile grid, itself a small backtracker maze, with one passage per
+    joined border, so the result has exactly one path between any two cells. Only the tile being
+    carved is held in memory, about 10 bytes per tile cell, whatever the size of the maze. The
+    file has the save_grid format and opens with Maze.load or grid.load_grid.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file to write.
+    num_rows : int
+        Number of rows the maze will have.
+    num_cols : int
+        Number of columns the maze will have.
+    seed : int
+        Default: None
+        Seed used for random generator. The same seed and tile_size write the same file.
+    tile_size : int
+        Default: DEFAULT_TILE_SIZE
+        Number of columns and rows of a tile.
+    on_tile : callable
+        Default: None
+        Called as on_tile(ti, tj) after every tile is written.
+    """
+    if tile_size < 1:
+        raise ValueError("tile_size must be at least 1")
+    if seed is None:
+        seed = random.randrange(2 ** 63)
+
+    tiles_x = -(-num_cols // tile_size)
+    tiles_y = -(-num_rows // tile_size)
+    layout = backtracker(tiles_x, tiles_y, f"{seed}:tiles")
+
+    with GridFileWriter(path, num_cols, num_rows) as writer:
+        # column by column, matching the layout of the file
+        for ti in range(tiles_x):
+            for tj in range(tiles_y):
+                tile = carve_tile(layout, seed, ti, tj, tile_size, num_cols, num_rows)
+                walls = tile.walls
+                rows = tile.num_rows
+                for col in range(tile.num_cols):
+                    writer.write_column(
+                        ti * tile_size + col, tj * tile_size, walls[col * rows:(col + 1) * rows]
+                    )
+                if on_tile is not None:
+                    on_tile(ti, tj)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate a maze larger than memory, one tile at a time, into a maze file."
+    )
+    parser.add_argument("path", help="Maze file to write.")
+    parser.add_argument("--rows", type=int, required=True, help="Number of rows.")
+    parser.add_argument("--cols", type=int, required=True, help="Number of columns.")
+    parser.add_argument("--seed", type=int, default=None, help="Seed used for random generator.")
+    parser.add_argument(
+        "--tile-size", type=int, default=DEFAULT_TILE_SIZE,
+        help=f"Columns and rows of a tile (default: {DEFAULT_TILE_SIZE})."
+    )
+    args = parser.parse_args()
+
+    tiles = (-(-args.cols // args.tile_size)) * (-(-args.rows // args.tile_size))
+    done = 0
+    start = time.perf_counter()
+
+    def progress(ti, tj):
+        nonlocal done
+        done += 1
+        print(f"\rtile {done}/{tiles} {time.perf_counter() - start:.1f}s", end="", flush=True)
+
+    generate_tiled(args.path, args.rows, args.cols, args.seed, args.tile_size, progress)
+    print(f"\n{args.cols}x{args.rows} maze written to {args.path}")
+
+
+if __name__ == '__main__':
+    main()